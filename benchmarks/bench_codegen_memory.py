@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Code generation memory benchmark
+Compare peak memory of in-memory and streamed Swift/Objective-C code generation
+"""
+
+import os
+import sys
+import time
+import tempfile
+import tracemalloc
+import argparse
+from typing import Callable, Dict, Tuple
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.code_generator import LocalizationCodeGenerator
+
+
+def generate_catalog(count: int) -> Dict[str, str]:
+    """Generate a synthetic catalog of keys with realistic value lengths"""
+    return {f"screen_{i // 20}_label_{i}": f"Localized label number {i} for the white-label catalog"
+            for i in range(count)}
+
+
+def measure(func: Callable[[], object]) -> Tuple[float, int]:
+    """
+    Run func and measure wall time and peak traced memory
+    
+    Returns:
+        Tuple[float, int]: (seconds, peak bytes)
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description='Code generation memory benchmark')
+    parser.add_argument('--keys', type=int, default=50000, help='Number of keys')
+    args = parser.parse_args()
+    
+    strings_dict = generate_catalog(args.keys)
+    generator = LocalizationCodeGenerator()
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        swift_path = os.path.join(temp_dir, 'LocalizedStrings.swift')
+        header_path = os.path.join(temp_dir, 'LocalizedStrings.h')
+        
+        # Warm up the naming map so both approaches do the same work
+        generator._resolve_property_names(strings_dict, temp_dir)
+        
+        cases = [
+            ('swift in-memory', lambda: generator.generate_swift_extensions(strings_dict, swift_path)),
+            ('swift streamed', lambda: generator.write_swift_extensions(strings_dict, swift_path)),
+            ('objc in-memory', lambda: generator.generate_objc_header(strings_dict, header_path)),
+            ('objc streamed', lambda: generator.write_objc_header(strings_dict, header_path)),
+        ]
+        
+        # Generated code is identical, so remove outputs to force real writes
+        print(f"{args.keys} keys")
+        for name, func in cases:
+            for path in (swift_path, header_path):
+                if os.path.exists(path):
+                    os.remove(path)
+            elapsed, peak = measure(func)
+            print(f"  {name:<16} {elapsed:7.3f}s  peak {peak / 1024 / 1024:8.2f} MiB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Property name generation benchmark
+Measure Swift property name generation when many keys collapse to the same name
+"""
+
+import os
+import sys
+import time
+import argparse
+from typing import Dict
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.code_generator import LocalizationCodeGenerator
+
+
+def generate_colliding_keys(count: int, bases: int = 10) -> Dict[str, str]:
+    """
+    Generate unique keys that only differ in punctuation, so they camel-case to a few names
+    
+    Args:
+        count: Number of keys
+        bases: Number of distinct base names
+    
+    Returns:
+        Dict[str, str]: Dictionary of key-value pairs
+    """
+    keys = {}
+    for i in range(count):
+        # Encode the index in punctuation, which _to_camel_case strips
+        suffix = ''
+        n = i // bases
+        while n:
+            suffix += '.-!?'[n % 4]
+            n //= 4
+        keys[f"message{i % bases}_{suffix}"] = f"Message {i}"
+    return keys
+
+
+def legacy_generate_property_names(generator: LocalizationCodeGenerator, strings_dict: Dict[str, str]) -> Dict[str, str]:
+    """Previous implementation: restarts the suffix search at 1 for every collision"""
+    property_names = {}
+    used_names = set()
+    
+    for key in strings_dict.keys():
+        property_name = generator._to_camel_case(key)
+        if property_name in generator.reserved_keywords:
+            property_name = f"localized{property_name.capitalize()}"
+        
+        original_name = property_name
+        counter = 1
+        while property_name in used_names:
+            property_name = f"{original_name}{counter}"
+            counter += 1
+        
+        property_names[key] = property_name
+        used_names.add(property_name)
+    
+    return property_names
+
+
+def time_call(func, *args) -> float:
+    """Return wall time of a single call in seconds"""
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description='Property name generation benchmark')
+    parser.add_argument('--keys', type=int, default=100000, help='Number of keys')
+    parser.add_argument('--legacy-keys', type=int, default=5000,
+                        help='Number of keys for the quadratic legacy comparison (0 to skip)')
+    args = parser.parse_args()
+    
+    generator = LocalizationCodeGenerator()
+    
+    strings_dict = generate_colliding_keys(args.keys)
+    elapsed = time_call(generator._generate_property_names, strings_dict)
+    print(f"Linear:  {args.keys} keys in {elapsed:.3f}s")
+    
+    # Incremental run: names come from the previous naming map
+    naming_map = generator._generate_property_names(strings_dict)
+    elapsed = time_call(generator._generate_property_names, strings_dict, naming_map)
+    print(f"Cached:  {args.keys} keys in {elapsed:.3f}s (with naming map)")
+    
+    if args.legacy_keys:
+        legacy_dict = generate_colliding_keys(args.legacy_keys)
+        legacy = time_call(legacy_generate_property_names, generator, legacy_dict)
+        linear = time_call(generator._generate_property_names, legacy_dict)
+        print(f"Legacy:  {args.legacy_keys} keys in {legacy:.3f}s "
+              f"(linear: {linear:.3f}s, {legacy / max(linear, 1e-9):.0f}x faster)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Synthetic iOS project generator
+Create .lproj directory trees of configurable size for benchmarking
+"""
+
+import os
+import sys
+import random
+import argparse
+from typing import Dict, List, Optional
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.strings_parser import StringsParser
+
+
+# Locales used when more are requested than listed, cycled with numbered variants
+DEFAULT_LOCALES = ['zh-Hans', 'zh-Hant', 'ja', 'ko', 'fr', 'de', 'es', 'it', 'pt', 'pt-BR',
+                   'ru', 'ar', 'hi', 'th', 'vi', 'tr', 'pl', 'nl', 'sv', 'da', 'fi', 'no']
+
+WORDS = ['account', 'settings', 'profile', 'message', 'photo', 'share', 'delete', 'save',
+         'cancel', 'confirm', 'network', 'error', 'loading', 'upload', 'download', 'friend',
+         'notification', 'privacy', 'subscription', 'payment', 'search', 'result', 'empty', 'retry']
+
+
+def _make_value(rng: random.Random, length: int, escape_ratio: float) -> str:
+    """Build an English-looking value of roughly the given length"""
+    words = []
+    while sum(len(word) + 1 for word in words) < length:
+        words.append(rng.choice(WORDS))
+    value = ' '.join(words).capitalize()
+    if rng.random() < escape_ratio:
+        # Characters that must be escaped in .strings files
+        value += rng.choice(['\nSecond line', '\tTabbed', ' C:\\path'])
+    return value
+
+
+def generate_project(root_path: str, keys: int = 1000, locales: int = 5, value_length: int = 40,
+                     duplicate_ratio: float = 0.1, escape_ratio: float = 0.05, utf16_ratio: float = 0.2,
+                     translated_ratio: float = 0.5, seed: int = 42) -> Dict[str, object]:
+    """
+    Generate a synthetic iOS project
+    
+    Args:
+        root_path: Directory to create the .lproj folders in
+        keys: Number of English keys
+        locales: Number of non-English locales
+        value_length: Approximate length of each English value
+        duplicate_ratio: Fraction of values that repeat an earlier value
+        escape_ratio: Fraction of values containing escaped characters
+        utf16_ratio: Fraction of locale files written as UTF-16
+        translated_ratio: Fraction of keys already translated in each locale
+        seed: Random seed, so runs are reproducible
+    
+    Returns:
+        Dict[str, object]: Description of the generated project
+    """
+    rng = random.Random(seed)
+    parser = StringsParser()
+    
+    en_strings = {}
+    values: List[str] = []
+    for i in range(keys):
+        if values and rng.random() < duplicate_ratio:
+            value = rng.choice(values)
+        else:
+            value = _make_value(rng, value_length, escape_ratio)
+            values.append(value)
+        en_strings[f"{rng.choice(WORDS)}_{rng.choice(WORDS)}_{i}"] = value
+    
+    parser.write_strings_file(en_strings, os.path.join(root_path, 'en.lproj', 'Localizable.strings'))
+    
+    locale_names = []
+    for i in range(locales):
+        base = DEFAULT_LOCALES[i % len(DEFAULT_LOCALES)]
+        locale = base if i < len(DEFAULT_LOCALES) else f"{base}-{i // len(DEFAULT_LOCALES)}"
+        locale_names.append(locale)
+        
+        translated = {key: f"[{locale}] {value}" for key, value in en_strings.items()
+                      if rng.random() < translated_ratio}
+        file_path = os.path.join(root_path, f'{locale}.lproj', 'Localizable.strings')
+        parser.write_strings_file(translated, file_path)
+        
+        if rng.random() < utf16_ratio:
+            _convert_to_utf16(file_path)
+    
+    return {'root_path': root_path, 'keys': keys, 'locales': locale_names}
+
+
+def _convert_to_utf16(file_path: str) -> None:
+    """Re-encode a .strings file as UTF-16 with BOM, like older Xcode output"""
+    with open(file_path, 'r', encoding='utf-8') as file:
+        content = file.read()
+    with open(file_path, 'w', encoding='utf-16') as file:
+        file.write(content)
+
+
+def main(argv: Optional[List[str]] = None):
+    """Generate a project from the command line"""
+    parser = argparse.ArgumentParser(description='Generate a synthetic iOS localization project')
+    parser.add_argument('root_path', help='Output directory')
+    parser.add_argument('--keys', type=int, default=1000, help='Number of English keys')
+    parser.add_argument('--locales', type=int, default=5, help='Number of non-English locales')
+    parser.add_argument('--value-length', type=int, default=40, help='Approximate value length')
+    parser.add_argument('--duplicate-ratio', type=float, default=0.1, help='Fraction of duplicate values')
+    parser.add_argument('--escape-ratio', type=float, default=0.05, help='Fraction of values with escapes')
+    parser.add_argument('--utf16-ratio', type=float, default=0.2, help='Fraction of UTF-16 locale files')
+    parser.add_argument('--translated-ratio', type=float, default=0.5, help='Fraction of keys already translated')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed')
+    args = parser.parse_args(argv)
+    
+    project = generate_project(args.root_path, args.keys, args.locales, args.value_length,
+                               args.duplicate_ratio, args.escape_ratio, args.utf16_ratio,
+                               args.translated_ratio, args.seed)
+    print(f"Generated {project['keys']} keys x {len(project['locales'])} locales in {args.root_path}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark suite
+Time and peak memory of parsing, diffing, writing, code generation and end-to-end runs
+"""
+
+import os
+import io
+import sys
+import json
+import time
+import shutil
+import platform
+import tempfile
+import tracemalloc
+import argparse
+import contextlib
+from typing import Callable, Dict, List, Optional
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.project_generator import generate_project
+from ios_translator import iOSTranslator
+from src.strings_parser import StringsParser
+from src.code_generator import LocalizationCodeGenerator
+from src.translator import create_translator
+from src.stub_server import StubServer, StubServerConfig
+
+
+def measure(func: Callable[[], object], quiet: bool = True) -> Dict[str, float]:
+    """
+    Run func once and record wall time and peak traced memory
+    
+    Args:
+        func: Function to run
+        quiet: Whether to swallow anything func prints
+    
+    Returns:
+        Dict[str, float]: seconds and peak_bytes
+    """
+    output = io.StringIO() if quiet else sys.stdout
+    tracemalloc.start()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(output):
+        func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {'seconds': round(elapsed, 6), 'peak_bytes': peak}
+
+
+def _lproj_files(root_path: str) -> List[str]:
+    """Localizable.strings paths of all non-English locales"""
+    return sorted(os.path.join(root_path, name, 'Localizable.strings')
+                  for name in os.listdir(root_path)
+                  if name.endswith('.lproj') and name != 'en.lproj')
+
+
+class BenchmarkSuite:
+    """Benchmarks run against a fresh copy of a synthetic project"""
+    
+    def __init__(self, template_path: str, work_path: str, mock_options: Optional[Dict[str, object]] = None,
+                 engine: str = 'mock', stub_config: Optional[StubServerConfig] = None):
+        self.template_path = template_path
+        self.work_path = work_path
+        self.mock_options = mock_options or {}
+        self.engine = engine
+        self.stub_config = stub_config
+        self.parser = StringsParser()
+    
+    def fresh_project(self) -> str:
+        """Copy the template project so each benchmark starts from the same state"""
+        project_path = os.path.join(self.work_path, 'project')
+        if os.path.exists(project_path):
+            shutil.rmtree(project_path)
+        shutil.copytree(self.template_path, project_path)
+        return project_path
+    
+    def _english(self, project_path: str) -> Dict[str, str]:
+        """Parse the English strings of a project"""
+        return self.parser.parse_strings_file(os.path.join(project_path, 'en.lproj', 'Localizable.strings'))
+    
+    def bench_parse(self) -> Dict[str, float]:
+        """Parse English and every locale file"""
+        project_path = self.fresh_project()
+        files = [os.path.join(project_path, 'en.lproj', 'Localizable.strings')] + _lproj_files(project_path)
+        return measure(lambda: [self.parser.parse_strings_file(path) for path in files])
+    
+    def bench_diff(self) -> Dict[str, float]:
+        """Compute missing keys of every locale (files parsed beforehand)"""
+        project_path = self.fresh_project()
+        en_strings = self._english(project_path)
+        existing = [self.parser.parse_strings_file(path) for path in _lproj_files(project_path)]
+        return measure(lambda: [set(en_strings.keys()) - set(strings.keys()) for strings in existing])
+    
+    def bench_write(self) -> Dict[str, float]:
+        """Merge translations of all missing keys into every locale file"""
+        project_path = self.fresh_project()
+        en_strings = self._english(project_path)
+        files = _lproj_files(project_path)
+        
+        def run():
+            for path in files:
+                self.parser.update_strings_file(path, en_strings, en_strings)
+        
+        return measure(run)
+    
+    def bench_codegen(self) -> Dict[str, float]:
+        """Generate Swift extensions and the Objective-C header and implementation"""
+        project_path = self.fresh_project()
+        en_strings = self._english(project_path)
+        generator = LocalizationCodeGenerator()
+        
+        def run():
+            generator.write_swift_extensions(en_strings, os.path.join(project_path, 'LocalizedStrings.swift'))
+            generator.write_objc_header(en_strings, os.path.join(project_path, 'LocalizedStrings.h'))
+            generator.write_objc_implementation(en_strings, os.path.join(project_path, 'LocalizedStrings.m'))
+        
+        return measure(run)
+    
+    def bench_end_to_end(self) -> Dict[str, float]:
+        """Full iOSTranslator run with the mock translator or a real translator against the stub server"""
+        project_path = self.fresh_project()
+        
+        if self.engine == 'mock':
+            translator = create_translator('mock', **self.mock_options)
+            ios_translator = iOSTranslator(project_path, translator)
+            result = measure(lambda: ios_translator.run(generate_swift=True, generate_objc=True))
+            result['translator'] = dict(translator.stats)
+            return result
+        
+        with StubServer(config=self.stub_config) as server:
+            if self.engine == 'deepl':
+                translator = create_translator('deepl', auth_key='stub-key', server_url=server.url)
+            else:
+                translator = create_translator('llm', api_url=server.ollama_url)
+            ios_translator = iOSTranslator(project_path, translator)
+            result = measure(lambda: ios_translator.run(generate_swift=True, generate_objc=True))
+            result['stub_server'] = dict(server.stats)
+        return result
+    
+    def run(self, names: Optional[List[str]] = None) -> Dict[str, Dict[str, float]]:
+        """Run the selected benchmarks (all by default)"""
+        names = names or BENCHMARKS
+        return {name: getattr(self, f'bench_{name}')() for name in names}
+
+
+BENCHMARKS = ['parse', 'diff', 'write', 'codegen', 'end_to_end']
+
+
+def main(argv: Optional[List[str]] = None):
+    """Run the benchmark suite and report results"""
+    parser = argparse.ArgumentParser(description='Run the iOS translator benchmark suite')
+    parser.add_argument('--keys', type=int, default=2000, help='Number of English keys')
+    parser.add_argument('--locales', type=int, default=10, help='Number of non-English locales')
+    parser.add_argument('--value-length', type=int, default=40, help='Approximate value length')
+    parser.add_argument('--duplicate-ratio', type=float, default=0.1, help='Fraction of duplicate values')
+    parser.add_argument('--escape-ratio', type=float, default=0.05, help='Fraction of values with escapes')
+    parser.add_argument('--utf16-ratio', type=float, default=0.2, help='Fraction of UTF-16 locale files')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed')
+    parser.add_argument('--mock-latency', type=float, default=0.0, help='Mean simulated request latency (s)')
+    parser.add_argument('--mock-latency-distribution', default='constant',
+                        choices=['constant', 'uniform', 'normal', 'lognormal', 'exponential'],
+                        help='Simulated latency distribution')
+    parser.add_argument('--mock-latency-spread', type=float, default=0.0, help='Latency distribution spread')
+    parser.add_argument('--mock-failure-rate', type=float, default=0.0, help='Simulated request failure rate')
+    parser.add_argument('--mock-throttle-rate', type=float, default=0.0, help='Simulated HTTP 429 rate')
+    parser.add_argument('--mock-batch-size', type=int, default=None, help='Maximum texts per mock request')
+    parser.add_argument('--engine', choices=['mock', 'deepl', 'llm'], default='mock',
+                        help='Translator for end_to_end; deepl and llm run against the local stub server')
+    parser.add_argument('--stub-latency', type=float, default=0.0, help='Stub server delay per request (s)')
+    parser.add_argument('--stub-throttle-rate', type=float, default=0.0, help='Stub server HTTP 429 rate')
+    parser.add_argument('--stub-error-rate', type=float, default=0.0, help='Stub server HTTP 500 rate')
+    parser.add_argument('--only', nargs='+', choices=BENCHMARKS, help='Benchmarks to run')
+    parser.add_argument('--output', default=None, help='Write the JSON report to this file')
+    args = parser.parse_args(argv)
+    
+    config = {
+        'keys': args.keys,
+        'locales': args.locales,
+        'value_length': args.value_length,
+        'duplicate_ratio': args.duplicate_ratio,
+        'escape_ratio': args.escape_ratio,
+        'utf16_ratio': args.utf16_ratio,
+        'seed': args.seed,
+    }
+    mock_options = {
+        'latency': args.mock_latency,
+        'latency_distribution': args.mock_latency_distribution,
+        'latency_spread': args.mock_latency_spread,
+        'failure_rate': args.mock_failure_rate,
+        'throttle_rate': args.mock_throttle_rate,
+        'max_batch_size': args.mock_batch_size,
+        'seed': args.seed,
+    }
+    config['mock'] = mock_options
+    config['engine'] = args.engine
+    config['stub'] = {
+        'latency': args.stub_latency,
+        'throttle_rate': args.stub_throttle_rate,
+        'error_rate': args.stub_error_rate,
+    }
+    stub_config = StubServerConfig(latency=args.stub_latency, throttle_rate=args.stub_throttle_rate,
+                                   error_rate=args.stub_error_rate, character_limit=10 ** 12, seed=args.seed)
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        template_path = os.path.join(temp_dir, 'template')
+        generate_project(template_path, args.keys, args.locales, args.value_length, args.duplicate_ratio,
+                         args.escape_ratio, args.utf16_ratio, seed=args.seed)
+        suite = BenchmarkSuite(template_path, temp_dir, mock_options, args.engine, stub_config)
+        results = suite.run(args.only)
+    
+    report = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'config': config,
+        'results': results,
+    }
+    
+    print(f"{'benchmark':<12} {'seconds':>10} {'peak MiB':>10}")
+    for name, result in results.items():
+        print(f"{name:<12} {result['seconds']:>10.4f} {result['peak_bytes'] / 1024 / 1024:>10.2f}")
+    
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(report, file, indent=2)
+        print(f"Report written to: {args.output}")
+    
+    return report
+
+
+if __name__ == '__main__':
+    main()
@@ -10,6 +10,7 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.translator import create_translator
+from src.logging_config import configure_logging
 
 
 def demo_deepl_translator():
@@ -135,4 +136,5 @@ def main():
 
 
 if __name__ == "__main__":
+    configure_logging()
     main()
\ No newline at end of file
@@ -10,6 +10,7 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.translator import create_translator
+from src.logging_config import configure_logging
 
 
 def demo_llm_translator():
@@ -142,4 +143,5 @@ def main():
 
 
 if __name__ == "__main__":
+    configure_logging()
     main()
@@ -11,6 +11,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from ios_translator import iOSTranslator
 from src.translator import create_translator
+from src.logging_config import configure_logging
 
 
 def create_example_project():
@@ -106,4 +107,5 @@ def run_translation_example():
 
 
 if __name__ == "__main__":
+    configure_logging()
     run_translation_example()
\ No newline at end of file
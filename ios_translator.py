@@ -9,36 +9,54 @@ import os
 import sys
 import argparse
 import glob
-from typing import Dict, List, Set, Optional
+from typing import TYPE_CHECKING, Dict, List, Set, Optional
 
 from src.strings_parser import StringsParser, get_language_from_lproj, get_deepl_language_code
 from src.translator import create_translator, TranslatorBase
-from src.code_generator import LocalizationCodeGenerator, generate_objc_header
+from src.code_generator import LocalizationCodeGenerator
 from src.config_manager import get_config
+from src.metrics import Metrics
+from src.logging_config import configure_logging, get_logger
+
+if TYPE_CHECKING:
+    from src.planner import TranslationPlan
+
+
+logger = get_logger('ios_translator')
 
 
 class iOSTranslator:
     """iOS multi-language translator main class"""
     
-    def __init__(self, root_path: str, translator: TranslatorBase):
+    def __init__(self, root_path: str, translator: Optional[TranslatorBase], binary_strings: bool = False,
+                 typed_format_accessors: bool = False):
         """
         Initialize translator
         
         Args:
             root_path: Project root directory path
-            translator: Translator instance
+            translator: Translator instance, may be None when only exchanging XLIFF files
+            binary_strings: Write localized .strings files as binary property lists
+            typed_format_accessors: Generate typed Swift functions for strings with format specifiers
         """
         self.root_path = os.path.abspath(root_path)
         self.translator = translator
+        self.binary_strings = binary_strings
         self.parser = StringsParser()
-        self.code_generator = LocalizationCodeGenerator()
+        self.code_generator = LocalizationCodeGenerator(typed_format_accessors=typed_format_accessors)
+        
+        # One collector per run, shared with the translator for request-level metrics
+        self.metrics = Metrics()
+        if self.translator is not None:
+            self.translator.metrics = self.metrics
         
         # Validate path
         if not os.path.exists(self.root_path):
             raise ValueError(f"Root path does not exist: {self.root_path}")
     
     def run(self, generate_swift: bool = True, generate_objc: bool = False, 
-            output_dir: str = None) -> bool:
+            output_dir: str = None, swift_shards: int = 1, shard_by: str = 'hash',
+            generate_objc_impl: bool = False, objc_shards: int = 1) -> bool:
         """
         Run translation process
         
@@ -46,28 +64,37 @@ class iOSTranslator:
             generate_swift: Whether to generate Swift extension code
             generate_objc: Whether to generate Objective-C header file
             output_dir: Code output directory, defaults to root directory
+            swift_shards: Number of files to split the Swift extensions into
+            shard_by: How keys are assigned to Swift/Objective-C shards ('hash' or 'prefix')
+            generate_objc_impl: Whether to also generate the Objective-C implementation file
+            objc_shards: Number of files to split the Objective-C implementation into
             
         Returns:
             bool: Whether completed successfully
         """
         try:
-            print(f"Starting iOS translation for: {self.root_path}")
+            logger.info("Starting iOS translation for: %s", self.root_path)
             
             # 1. Read English strings
-            en_strings = self._load_english_strings()
+            with self.metrics.phase('parse'):
+                en_strings = self._load_english_strings()
             if not en_strings:
-                print("No English strings found. Exiting.")
+                logger.error("No English strings found. Exiting.")
                 return False
             
-            print(f"Found {len(en_strings)} English strings")
+            logger.info("Found %d English strings", len(en_strings))
+            
+            # Runs in the background while locales are discovered and diffed
+            self.translator.warm_up(en_strings)
             
             # 2. Find all language directories
-            language_dirs = self._find_language_directories()
+            with self.metrics.phase('discover'):
+                language_dirs = self._find_language_directories()
             if not language_dirs:
-                print("No language directories found. Exiting.")
+                logger.error("No language directories found. Exiting.")
                 return False
             
-            print(f"Found language directories: {language_dirs}")
+            logger.info("Found language directories: %s", language_dirs)
             
             # 3. Process each language directory
             for lang_dir in language_dirs:
@@ -75,31 +102,144 @@ class iOSTranslator:
                 if language and language != 'en' and language != 'base':
                     self._process_language_directory(lang_dir, language, en_strings)
             
-            # 4. Generate Swift code
-            if generate_swift:
-                self._generate_swift_extensions(en_strings, output_dir)
-            
-            # 5. Generate Objective-C header file
-            if generate_objc:
-                self._generate_objc_header(en_strings, output_dir)
+            with self.metrics.phase('codegen'):
+                # 4. Generate Swift code
+                if generate_swift:
+                    self._generate_swift_extensions(en_strings, output_dir, swift_shards, shard_by)
+                
+                # 5. Generate Objective-C header file
+                if generate_objc or generate_objc_impl:
+                    self._generate_objc_header(en_strings, output_dir)
+                
+                # 6. Generate Objective-C implementation file
+                if generate_objc_impl:
+                    self._generate_objc_implementation(en_strings, output_dir, objc_shards, shard_by)
             
-            print("Translation completed successfully!")
+            logger.info("Translation completed successfully!")
             return True
             
         except Exception as e:
-            print(f"Error during translation: {e}")
+            logger.error("Error during translation: %s", e)
+            return False
+    
+    def plan(self) -> Optional['TranslationPlan']:
+        """
+        Compute what a run would send to the translator, without sending translation requests
+        
+        Returns:
+            Optional[TranslationPlan]: Plan per locale, None if there are no English strings
+        """
+        from src.planner import TranslationPlan
+        
+        with self.metrics.phase('parse'):
+            en_strings = self._load_english_strings()
+        if not en_strings:
+            logger.error("No English strings found. Exiting.")
+            return None
+        
+        plan = TranslationPlan(type(self.translator).__name__)
+        with self.metrics.phase('discover'):
+            language_dirs = self._find_language_directories()
+        
+        for lang_dir in language_dirs:
+            language = get_language_from_lproj(lang_dir)
+            if not language or language in ('en', 'base'):
+                continue
+            missing = self._find_missing_strings(os.path.join(lang_dir, 'Localizable.strings'), language, en_strings)
+            if missing:
+                # A cascade also reports the requests of its fallback engines
+                engine_requests = (self.translator.plan_requests_by_engine(missing)
+                                   if hasattr(self.translator, 'plan_requests_by_engine') else None)
+                plan.add_language(language, missing, self.translator.plan_requests(missing), engine_requests)
+        
+        # Usage queries are free; they do not consume quota
+        if hasattr(self.translator, 'check_api_usage'):
+            plan.set_usage(self.translator.check_api_usage())
+        
+        return plan
+    
+    def export_xliff(self, output_path: str) -> bool:
+        """
+        Export strings missing from each language to an XLIFF file for human translation
+        
+        Args:
+            output_path: Output XLIFF file path
+            
+        Returns:
+            bool: Whether export was successful
+        """
+        en_strings = self._load_english_strings()
+        if not en_strings:
+            logger.error("No English strings found. Exiting.")
+            return False
+        
+        missing_strings = {}
+        for lang_dir in self._find_language_directories():
+            language = get_language_from_lproj(lang_dir)
+            if not language or language in ('en', 'base'):
+                continue
+            
+            existing_strings = self.parser.parse_strings_file(os.path.join(lang_dir, 'Localizable.strings'))
+            missing = {key: value for key, value in en_strings.items() if key not in existing_strings}
+            if missing:
+                missing_strings[language] = missing
+                logger.info("Exporting %d missing strings for %s", len(missing), language)
+        
+        if not missing_strings:
+            logger.info("No missing strings to export")
+            return True
+        
+        from src.xliff_handler import XliffHandler
+        success = XliffHandler().export_missing_strings(missing_strings, output_path)
+        if success:
+            logger.info("XLIFF written to: %s", output_path)
+        return success
+    
+    def import_xliff(self, xliff_path: str) -> bool:
+        """
+        Import completed translations from an XLIFF file into the .lproj directories
+        
+        Args:
+            xliff_path: Path to the XLIFF file
+            
+        Returns:
+            bool: Whether import was successful
+        """
+        if not os.path.exists(xliff_path):
+            logger.error("XLIFF file not found: %s", xliff_path)
             return False
+        
+        from src.xliff_handler import XliffHandler
+        en_strings = self._load_english_strings()
+        translations = XliffHandler().import_translations(xliff_path)
+        if not translations:
+            logger.warning("No completed translations found in %s", xliff_path)
+            return True
+        
+        success = True
+        for language, translated_texts in translations.items():
+            localizable_path = os.path.join(self.root_path, f'{language}.lproj', 'Localizable.strings')
+            if not self.parser.update_strings_file(
+                localizable_path, translated_texts, en_strings,
+                binary=True if self.binary_strings else None
+            ):
+                logger.error("Failed to update %s", localizable_path)
+                success = False
+                continue
+            logger.info("Imported %d translations for %s", len(translated_texts), language)
+        
+        return success
     
     def _load_english_strings(self) -> Dict[str, str]:
         """Load English strings"""
         en_lproj_path = os.path.join(self.root_path, 'en.lproj')
         if not os.path.exists(en_lproj_path):
-            print(f"English localization directory not found: {en_lproj_path}")
+            logger.error("English localization directory not found: %s", en_lproj_path)
             return {}
         
         localizable_path = os.path.join(en_lproj_path, 'Localizable.strings')
         if not os.path.exists(localizable_path):
-            print(f"English Localizable.strings not found: {localizable_path}")
+            logger.error("English Localizable.strings not found: %s", localizable_path)
             return {}
         
         return self.parser.parse_strings_file(localizable_path)
@@ -114,68 +254,104 @@ class iOSTranslator:
         
         return sorted(language_dirs)
     
-    def _process_language_directory(self, lang_dir: str, language: str, en_strings: Dict[str, str]) -> None:
+    def _find_missing_strings(self, localizable_path: str, language: str,
+                              en_strings: Dict[str, str]) -> Dict[str, str]:
         """
-        Process single language directory
+        Find English strings missing from a localized strings file
         
         Args:
-            lang_dir: Language directory path
+            localizable_path: Localized Localizable.strings path
             language: Language code
             en_strings: English strings dictionary
-        """
-        print(f"\nProcessing language: {language}")
-        
-        localizable_path = os.path.join(lang_dir, 'Localizable.strings')
         
+        Returns:
+            Dict[str, str]: Missing keys and their English text, in English order
+        """
         # Read existing localized strings
-        existing_strings = self.parser.parse_strings_file(localizable_path)
-        print(f"Found {len(existing_strings)} existing strings for {language}")
+        with self.metrics.phase('parse', language):
+            existing_strings = self.parser.parse_strings_file(localizable_path)
+        logger.info("Found %d existing strings for %s", len(existing_strings), language)
         
         # Find missing keys
-        missing_keys = set(en_strings.keys()) - set(existing_strings.keys())
+        with self.metrics.phase('diff', language):
+            missing_strings = {key: value for key, value in en_strings.items() if key not in existing_strings}
+        self.metrics.set_language_value(language, 'missing', len(missing_strings))
+        self.metrics.increment('keys_up_to_date', len(en_strings) - len(missing_strings))
         
-        if not missing_keys:
-            print(f"No missing strings for {language}")
-            return
+        if not missing_strings:
+            logger.info("No missing strings for %s", language,
+                        extra={'event': 'language_up_to_date', 'language': language})
+        else:
+            logger.info("Found %d missing strings for %s", len(missing_strings), language,
+                        extra={'event': 'missing_strings', 'language': language, 'count': len(missing_strings)})
+        
+        return missing_strings
+    
+    def _process_language_directory(self, lang_dir: str, language: str, en_strings: Dict[str, str]) -> None:
+        """
+        Process single language directory
         
-        print(f"Found {len(missing_keys)} missing strings for {language}")
+        Args:
+            lang_dir: Language directory path
+            language: Language code
+            en_strings: English strings dictionary
+        """
+        logger.info("Processing language: %s", language)
         
-        # Prepare translation
-        texts_to_translate = {key: en_strings[key] for key in missing_keys}
+        localizable_path = os.path.join(lang_dir, 'Localizable.strings')
+        texts_to_translate = self._find_missing_strings(localizable_path, language, en_strings)
+        if not texts_to_translate:
+            return
         
         # Get target language code
         target_language = get_deepl_language_code(language)
         
-        print(f"Translating to {target_language}...")
+        logger.info("Translating to %s...", target_language)
         
         # Translate missing texts
-        translated_texts = self.translator.translate_batch(
-            texts_to_translate, 
-            target_language, 
-            'en'
-        )
+        with self.metrics.phase('translate', language):
+            translated_texts = self.translator.translate_batch(
+                texts_to_translate, 
+                target_language, 
+                'en'
+            )
+        self.metrics.increment('keys_translated', len(translated_texts))
+        # Source text only, unlike characters_sent which includes prompts; used for --plan-baseline
+        self.metrics.increment('source_characters', sum(len(text) for text in texts_to_translate.values()
+                                                        if text.strip()))
         
         if translated_texts:
-            print(f"Successfully translated {len(translated_texts)} strings")
+            logger.info("Successfully translated %d strings", len(translated_texts))
             
             # Update strings file, preserving the order of English strings
-            success = self.parser.update_strings_file(localizable_path, translated_texts, en_strings)
+            # Keep each file's existing format unless binary output was requested
+            with self.metrics.phase('write', language):
+                success = self.parser.update_strings_file(
+                    localizable_path, translated_texts, en_strings,
+                    binary=True if self.binary_strings else None
+                )
             if success:
-                print(f"Updated {localizable_path}")
+                logger.info("Updated %s", localizable_path,
+                            extra={'event': 'strings_file_updated', 'language': language,
+                                   'path': localizable_path, 'count': len(translated_texts)})
             else:
-                print(f"Failed to update {localizable_path}")
+                logger.error("Failed to update %s", localizable_path)
         else:
-            print(f"No translations were successful for {language}")
+            logger.warning("No translations were successful for %s", language)
     
-    def _generate_swift_extensions(self, en_strings: Dict[str, str], output_dir: str = None) -> None:
+    def _generate_swift_extensions(self, en_strings: Dict[str, str], output_dir: str = None,
+                                   swift_shards: int = 1, shard_by: str = 'hash') -> None:
         """Generate Swift extension code"""
         if not output_dir:
             output_dir = self.root_path
         
-        output_path = os.path.join(output_dir, 'LocalizedStrings.swift')
+        logger.info("Generating Swift extensions...")
+        if swift_shards > 1:
+            self.code_generator.generate_swift_shards(en_strings, output_dir, swift_shards, shard_by)
+            return
         
-        print(f"\nGenerating Swift extensions...")
-        self.code_generator.generate_swift_extensions(en_strings, output_path)
+        output_path = os.path.join(output_dir, 'LocalizedStrings.swift')
+        self.code_generator.write_swift_extensions(en_strings, output_path)
     
     def _generate_objc_header(self, en_strings: Dict[str, str], output_dir: str = None) -> None:
         """Generate Objective-C header file"""
@@ -184,8 +360,58 @@ class iOSTranslator:
         
         output_path = os.path.join(output_dir, 'LocalizedStrings.h')
         
-        print(f"\nGenerating Objective-C header...")
-        generate_objc_header(en_strings, output_path)
+        logger.info("Generating Objective-C header...")
+        self.code_generator.write_objc_header(en_strings, output_path)
+    
+    def _generate_objc_implementation(self, en_strings: Dict[str, str], output_dir: str = None,
+                                      objc_shards: int = 1, shard_by: str = 'hash') -> None:
+        """Generate Objective-C implementation file"""
+        if not output_dir:
+            output_dir = self.root_path
+        
+        output_path = os.path.join(output_dir, 'LocalizedStrings.m')
+        
+        logger.info("Generating Objective-C implementation...")
+        self.code_generator.write_objc_implementation(en_strings, output_path, objc_shards, shard_by)
+
+
+def create_cli_translator(translator_type: str, args: argparse.Namespace) -> TranslatorBase:
+    """
+    Create a translator from command line options
+    
+    Args:
+        translator_type: Translator type ('deepl', 'llm', 'openai', 'mock')
+        args: Parsed command line arguments
+        
+    Returns:
+        TranslatorBase: Translator instance
+    """
+    if translator_type == 'deepl':
+        return create_translator('deepl', auth_key=args.auth_key,
+                                 server_url=args.deepl_server_url,
+                                 glossary_dir=args.glossary_dir)
+    elif translator_type == 'llm':
+        return create_translator('llm', 
+                                 api_url=args.llm_url, 
+                                 model=args.llm_model,
+                                 max_concurrency=args.llm_concurrency,
+                                 keep_alive=args.llm_keep_alive,
+                                 warm_up=args.llm_warm_up,
+                                 num_ctx=args.llm_num_ctx,
+                                 output_ratio=args.llm_output_ratio,
+                                 stream=args.llm_stream,
+                                 hedge_budget=args.llm_hedge_budget)
+    elif translator_type == 'openai':
+        return create_translator('openai',
+                                 api_url=args.llm_url,
+                                 model=args.llm_model,
+                                 api_key=args.llm_api_key,
+                                 max_concurrency=args.llm_concurrency,
+                                 stream=args.llm_stream,
+                                 hedge_budget=args.llm_hedge_budget)
+    elif translator_type == 'mock':
+        return create_translator('mock')
+    raise ValueError(f"Unsupported translator type: {translator_type}")
 
 
 def main():
@@ -198,25 +424,89 @@ def main():
     
     parser.add_argument('--auth-key', default=default_auth_key,
                         help='DeepL API authentication key')
-    parser.add_argument('--translator', choices=['deepl', 'mock', 'llm'], 
+    parser.add_argument('--deepl-server-url', default=config.get('deepl_server_url'),
+                        help='Alternative DeepL API URL, e.g. a local stub server (python -m src.stub_server)')
+    parser.add_argument('--glossary-dir', default=config.get('deepl_glossary_dir'),
+                        help='Directory with DeepL glossaries named <source>-<target>.tsv (e.g. en-de.tsv)')
+    parser.add_argument('--translator', choices=['deepl', 'mock', 'llm', 'openai'], 
                         default=config.get('default_translator', 'deepl'),
                         help='Translator type to use')
-    parser.add_argument('--llm-url', default=config.get('llm_api_url', 'http://127.0.0.1:11434/api/generate'),
-                        help='LLM API URL for LLM translator')
+    llm_url = config.get('llm_api_url', 'http://127.0.0.1:11434/api/generate')
+    parser.add_argument('--fallback', metavar='ENGINES', default=None,
+                        help='Comma-separated engines (deepl, llm, openai, mock) that take over when the previous '
+                             'one runs out of quota or becomes unavailable, e.g. --translator deepl --fallback llm')
+    parser.add_argument('--llm-url', default=llm_url if isinstance(llm_url, str) else ','.join(llm_url),
+                        help='LLM API URL for LLM translator; separate several servers with commas')
+    parser.add_argument('--llm-api-key', default=config.get('llm_api_key'),
+                        help='Bearer token for OpenAI-compatible chat APIs (--translator openai)')
+    parser.add_argument('--llm-keep-alive', metavar='DURATION', default=config.get('llm_keep_alive'),
+                        help='How long Ollama keeps the model loaded between requests, e.g. 30m (-1: forever)')
+    parser.add_argument('--llm-warm-up', action='store_true',
+                        help='Load the Ollama model in the background while the project is parsed')
+    parser.add_argument('--llm-num-ctx', metavar='TOKENS', default=None,
+                        help="Ollama context size in tokens, or 'auto' to size it to the largest chunk")
+    parser.add_argument('--llm-output-ratio', type=float, default=None,
+                        help='Cap Ollama output tokens (num_predict) at this multiple of the input tokens')
+    parser.add_argument('--llm-stream', action='store_true',
+                        help='Stream LLM responses and stop generation once every text of a batch is translated')
+    parser.add_argument('--llm-hedge-budget', type=float, default=0.0, metavar='FRACTION',
+                        help='Duplicate LLM batch requests still running at the p90 latency to a free server slot, '
+                             'at most this fraction of requests (e.g. 0.1); the first answer wins')
+    parser.add_argument('--llm-concurrency', type=int, default=config.get('llm_max_concurrency', 1),
+                        help='Maximum number of requests in flight per LLM server')
     parser.add_argument('--llm-model', default=config.get('llm_model', 'mistral:latest'),
                         help='LLM model name')
     parser.add_argument('--no-swift', action='store_true',
                         help='Skip Swift extension generation')
+    parser.add_argument('--swift-shards', type=int, default=1,
+                        help='Split generated Swift extensions into N files for parallel compilation')
+    parser.add_argument('--shard-by', choices=['hash', 'prefix'], default='hash',
+                        help='Assign keys to Swift and Objective-C shards by key hash or by key prefix')
+    parser.add_argument('--typed-format-accessors', action='store_true',
+                        help='Generate typed Swift functions for strings with format specifiers (%%@, %%d, ...)')
     parser.add_argument('--generate-objc', action='store_true',
                         help='Generate Objective-C header file')
+    parser.add_argument('--generate-objc-impl', action='store_true',
+                        help='Generate Objective-C header and implementation (.m) files')
+    parser.add_argument('--objc-shards', type=int, default=1,
+                        help='Split the generated Objective-C implementation into N files')
     parser.add_argument('--output-dir', default=None,
                         help='Output directory for generated code (default: same as root_path)')
+    parser.add_argument('--binary-plist', action='store_true',
+                        help='Write localized .strings files as binary property lists (for app bundles)')
+    parser.add_argument('--export-xliff', metavar='PATH', default=None,
+                        help='Export missing strings to an XLIFF 1.2 file and exit')
+    parser.add_argument('--import-xliff', metavar='PATH', default=None,
+                        help='Import completed translations from an XLIFF 1.2 file before translating')
+    parser.add_argument('--metrics', action='store_true',
+                        help='Print per-phase timings and request statistics after the run')
+    parser.add_argument('--metrics-json', metavar='PATH', default=None,
+                        help='Write per-phase timings and request statistics to a JSON file')
+    parser.add_argument('--profile', action='store_true',
+                        help='Profile the run with cProfile, per pipeline phase (written next to --metrics-json)')
+    parser.add_argument('--profile-memory', action='store_true',
+                        help='Record top memory allocations with tracemalloc, per pipeline phase')
+    parser.add_argument('--trace', metavar='PATH', default=None,
+                        help='Write pipeline and request spans as Chrome trace JSON (chrome://tracing, Perfetto)')
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help='Show debug output, including one line per translated key')
+    parser.add_argument('-q', '--quiet', action='store_true',
+                        help='Only show warnings and errors')
+    parser.add_argument('--log-file', metavar='PATH', default=None,
+                        help='Write all log events, including debug events, to a JSON Lines file')
+    parser.add_argument('--plan', action='store_true',
+                        help='Show keys, characters, requests, quota and estimated time per locale without translating')
+    parser.add_argument('--plan-baseline', metavar='PATH', default=None,
+                        help='Metrics JSON of an earlier run (--metrics-json) used to estimate the time of --plan')
     parser.add_argument('--check-usage', action='store_true',
                         help='Check DeepL API usage and exit')
     parser.add_argument('--show-config', action='store_true',
                         help='Show configuration status and exit')
     
     args = parser.parse_args()
+    if args.plan and args.import_xliff:
+        parser.error('--plan only estimates and cannot be combined with --import-xliff, which writes .strings files')
+    configure_logging(verbose=args.verbose, quiet=args.quiet, event_log=args.log_file)
     
     try:
         # Show configuration if requested
@@ -226,56 +516,115 @@ def main():
         
         # Check if root_path is provided
         if not args.root_path:
-            print("Error: root_path is required unless using --show-config")
+            logger.error("root_path is required unless using --show-config")
             parser.print_help()
             return
         
+        # XLIFF export does not need a translator
+        if args.export_xliff:
+            ios_translator = iOSTranslator(args.root_path, None)
+            if not ios_translator.export_xliff(args.export_xliff):
+                sys.exit(1)
+            return
+        
         # Validate configuration
         if not config.validate_config():
             return
         
         # Create translator
-        if args.translator == 'deepl':
-            translator = create_translator('deepl', auth_key=args.auth_key)
-            
-            # Check API usage
-            if args.check_usage:
-                from translator import DeepLTranslator
-                if isinstance(translator, DeepLTranslator):
-                    usage = translator.check_api_usage()
-                    if usage:
-                        print(f"API Usage: {usage}")
-                    else:
-                        print("Failed to check API usage")
-                return
-        elif args.translator == 'llm':
-            translator = create_translator('llm', 
-                                         api_url=args.llm_url, 
-                                         model=args.llm_model)
-        else:
-            translator = create_translator('mock')
+        translator = create_cli_translator(args.translator, args)
+        
+        # Check API usage
+        if args.translator == 'deepl' and args.check_usage:
+            from src.translator import DeepLTranslator
+            if isinstance(translator, DeepLTranslator):
+                usage = translator.check_api_usage()
+                if usage:
+                    print(f"API Usage: {usage}")
+                else:
+                    logger.error("Failed to check API usage")
+            return
+        
+        # Engines taking over when the previous one runs out of quota or becomes unavailable
+        fallbacks = [engine.strip() for engine in (args.fallback or '').split(',')
+                     if engine.strip() and engine.strip() != 'none']
+        if fallbacks:
+            from src.translator import CascadeTranslator
+            translator = CascadeTranslator([translator] + [create_cli_translator(engine, args) for engine in fallbacks],
+                                           names=[args.translator] + fallbacks)
         
         # Create translator instance
-        ios_translator = iOSTranslator(args.root_path, translator)
+        ios_translator = iOSTranslator(args.root_path, translator, binary_strings=args.binary_plist,
+                                       typed_format_accessors=args.typed_format_accessors)
+        
+        # Import human translations first so only the remainder is machine translated
+        if args.import_xliff and not ios_translator.import_xliff(args.import_xliff):
+            sys.exit(1)
+        
+        # Dry run: report what would be sent, fail if it does not fit the quota
+        if args.plan:
+            plan = ios_translator.plan()
+            if plan is None:
+                sys.exit(1)
+            if args.plan_baseline:
+                plan.load_baseline(args.plan_baseline)
+            print(plan.format_summary())
+            if not plan.fits_quota:
+                sys.exit(2)
+            return
         
         # Set default output directory to root_path if not specified
         output_dir = args.output_dir if args.output_dir else args.root_path
         
+        # Profile the whole run, attributed to pipeline phases
+        profiler = None
+        if args.profile or args.profile_memory:
+            from src.profiler import RunProfiler
+            profiler = RunProfiler(cpu=args.profile, memory=args.profile_memory)
+            ios_translator.metrics.phase_listeners.append(profiler)
+            profiler.start()
+        
+        # Record spans for a timeline view
+        tracer = None
+        if args.trace:
+            from src.tracing import TraceRecorder
+            tracer = TraceRecorder()
+            ios_translator.metrics.span_listeners.append(tracer)
+        
         # Run translation
-        success = ios_translator.run(
-            generate_swift=not args.no_swift,
-            generate_objc=args.generate_objc,
-            output_dir=output_dir
-        )
+        try:
+            success = ios_translator.run(
+                generate_swift=not args.no_swift,
+                generate_objc=args.generate_objc,
+                output_dir=output_dir,
+                swift_shards=args.swift_shards,
+                shard_by=args.shard_by,
+                generate_objc_impl=args.generate_objc_impl,
+                objc_shards=args.objc_shards
+            )
+        finally:
+            if profiler:
+                profiler.stop()
+        
+        if args.metrics or args.metrics_json:
+            print(f"\n{ios_translator.metrics.format_summary()}")
+        if args.metrics_json and ios_translator.metrics.write_json(args.metrics_json):
+            logger.info("Metrics written to %s", args.metrics_json)
+        if tracer and tracer.write_json(args.trace):
+            logger.info("Trace written to %s", args.trace)
+        if profiler:
+            profile_prefix = os.path.splitext(args.metrics_json)[0] if args.metrics_json else 'ios_translator'
+            for path in profiler.write_reports(profile_prefix):
+                logger.info("Profile written to %s", path)
         
         if success:
-            print("\n✅ Translation completed successfully!")
+            logger.info("✅ Translation completed successfully!")
         else:
-            print("\n❌ Translation failed!")
+            logger.error("❌ Translation failed!")
             sys.exit(1)
             
     except Exception as e:
-        print(f"Error: {e}")
+        logger.error("Run failed: %s", e)
         sys.exit(1)
 
 
@@ -7,13 +7,82 @@ Generate Swift and Objective-C code for localized strings
 
 import os
 import re
-from typing import Dict, Set
+import glob
+import json
+import zlib
+import hashlib
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from .logging_config import get_logger
+
+
+logger = get_logger(__name__)
+
+
+# Cache of generated file hashes, stored next to the generated files
+MANIFEST_FILE_NAME = '.localized_strings_manifest.json'
+
+# Single-file Swift output, replaced by shards when sharding
+SWIFT_FILE_NAME = 'LocalizedStrings.swift'
+
+# File name patterns for sharded Swift and Objective-C output
+SWIFT_SHARD_FILE_NAME = 'LocalizedStrings+Shard{index:02d}.swift'
+OBJC_SHARD_FILE_NAME = 'LocalizedStrings+Shard{index:02d}.m'
+
+# C function shared by generated Objective-C implementations for cached lookups
+OBJC_LOOKUP_FUNCTION = 'LocalizedStringsLookup'
+
+# NSObject class and instance methods without arguments; generated class methods must not override them
+OBJC_RESERVED_SELECTORS = {
+    'alloc', 'new', 'copy', 'mutableCopy', 'init', 'initialize', 'load', 'dealloc', 'finalize',
+    'class', 'superclass', 'description', 'debugDescription', 'hash', 'self', 'zone', 'isProxy',
+    'retain', 'release', 'autorelease', 'retainCount', 'version', 'classForCoder',
+    'classForKeyedArchiver', 'autoContentAccessingProxy', 'observationInfo',
+    'accessInstanceVariablesDirectly', 'useStoredAccessor', 'classFallbacksForKeyedArchiver',
+}
+
+# ARC method families: selectors such as newItem or initTitle (not initialTitle) are assumed to return retained objects
+OBJC_METHOD_FAMILY_PATTERN = re.compile(r'^(alloc|new|copy|mutableCopy|init)(?![a-z])')
+
+# Supported strategies for assigning keys to shards
+SHARD_STRATEGIES = ('hash', 'prefix')
+
+# Persisted key -> property name map, keeps names stable between runs
+NAMING_MAP_FILE_NAME = '.localized_strings_names.json'
+
+# Write buffer size for streamed code generation
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+# Precompiled patterns used for every key
+NON_IDENTIFIER_PATTERN = re.compile(r'[^a-zA-Z0-9_]')
+VALID_IDENTIFIER_PATTERN = re.compile(r'^[a-zA-Z][a-zA-Z0-9_]*$')
+SHARD_PREFIX_SPLIT_PATTERN = re.compile(r'[^a-zA-Z0-9]')
+
+# printf-style format specifier: optional position, flags, width, precision, length, conversion.
+# The space flag is left out so prose like "100% done" is not taken for "% d".
+FORMAT_SPECIFIER_PATTERN = re.compile(
+    r"%(?:(\d+)\$)?[-+0#]*(\d+|\*)?(?:\.(\d+|\*))?(hh|h|ll|l|q|L|z|t|j)?([@dDiuUxXoOfFeEgGaAcCsSp%])"
+)
+
+# Swift parameter types for the conversions used in iOS strings. Strings with other conversions
+# stay untyped: in prose, "10%OFF" or "100%x faster" is a percent sign followed by a letter
+FORMAT_ARGUMENT_TYPES = {
+    '@': 'String',
+    'd': 'Int', 'i': 'Int', 'u': 'UInt',
+    'f': 'Double',
+}
 
 
 class LocalizationCodeGenerator:
     """Localization code generator for Swift and Objective-C"""
     
-    def __init__(self):
+    def __init__(self, typed_format_accessors: bool = False):
+        """
+        Args:
+            typed_format_accessors: Generate typed static functions for strings
+                                    containing format specifiers (e.g. %@, %d)
+        """
+        self.typed_format_accessors = typed_format_accessors
         self.reserved_keywords = {
             'associatedtype', 'class', 'deinit', 'enum', 'extension', 'fileprivate', 'func',
             'import', 'init', 'inout', 'internal', 'let', 'open', 'operator', 'private',
@@ -36,7 +105,7 @@ class LocalizationCodeGenerator:
             str: Generated Swift code
         """
         # Generate valid Swift property names
-        property_names = self._generate_property_names(strings_dict)
+        property_names = self._resolve_property_names(strings_dict, os.path.dirname(output_path) if output_path else None)
         
         # Generate code
         swift_code = self._generate_swift_code(strings_dict, property_names)
@@ -44,15 +113,125 @@ class LocalizationCodeGenerator:
         # If output path is provided, write to file
         if output_path:
             try:
-                os.makedirs(os.path.dirname(output_path), exist_ok=True)
-                with open(output_path, 'w', encoding='utf-8') as file:
-                    file.write(swift_code)
-                print(f"Swift extensions written to: {output_path}")
+                if self._write_if_changed(output_path, swift_code):
+                    logger.info("Swift extensions written to: %s", output_path)
+                else:
+                    logger.info("Swift extensions unchanged, skipped: %s", output_path)
             except Exception as e:
-                print(f"Error writing Swift file {output_path}: {e}")
+                logger.error("Error writing Swift file %s: %s", output_path, e)
         
         return swift_code
     
+    def write_swift_extensions(self, strings_dict: Dict[str, str], output_path: str) -> bool:
+        """
+        Stream Swift String and LocalizedStringKey extension code to a file
+        
+        Unlike generate_swift_extensions, the code is never built as one string:
+        fragments go straight to a buffered file handle, keeping memory flat for
+        large catalogs.
+        
+        Args:
+            strings_dict: Dictionary of key-value pairs
+            output_path: Output file path
+            
+        Returns:
+            bool: Whether generation was successful
+        """
+        property_names = self._resolve_property_names(strings_dict, os.path.dirname(output_path))
+        
+        try:
+            if self._stream_if_changed(output_path, self._iter_swift_code(strings_dict, property_names)):
+                logger.info("Swift extensions written to: %s", output_path)
+            else:
+                logger.info("Swift extensions unchanged, skipped: %s", output_path)
+            # Shards of an earlier sharded run would declare every property twice
+            self._remove_stale_shards(os.path.dirname(output_path), 0, '.swift')
+            return True
+        except Exception as e:
+            logger.error("Error writing Swift file %s: %s", output_path, e)
+            return False
+    
+    def generate_swift_shards(self, strings_dict: Dict[str, str], output_dir: str, shard_count: int,
+                              shard_by: str = 'hash') -> Dict[str, int]:
+        """
+        Generate Swift extensions split across several files
+        
+        A single file with thousands of computed properties is slow to type-check
+        and compiles serially; shards compile in parallel and only the shards whose
+        keys changed are rewritten (and recompiled).
+        
+        Args:
+            strings_dict: Dictionary of key-value pairs
+            output_dir: Directory to write the shard files to
+            shard_count: Number of shard files
+            shard_by: 'hash' to spread keys evenly, 'prefix' to keep keys sharing
+                      a prefix (e.g. "settings_") in the same shard
+            
+        Returns:
+            Dict[str, int]: Mapping from shard file path to number of keys in the shard
+        """
+        # Names are resolved across all keys so they stay unique between shards
+        property_names = self._resolve_property_names(strings_dict, output_dir)
+        shards = self._split_into_shards(property_names, shard_count, shard_by)
+        
+        result = {}
+        for index, shard_property_names in enumerate(shards):
+            file_name = SWIFT_SHARD_FILE_NAME.format(index=index)
+            output_path = os.path.join(output_dir, file_name)
+            result[output_path] = len(shard_property_names)
+            
+            try:
+                fragments = self._iter_swift_code(strings_dict, shard_property_names, file_name)
+                if self._stream_if_changed(output_path, fragments):
+                    logger.info("Swift shard written to: %s (%d keys)", output_path, len(shard_property_names))
+            except Exception as e:
+                logger.error("Error writing Swift file %s: %s", output_path, e)
+        
+        self._remove_stale_shards(output_dir, shard_count, '.swift')
+        # The single file of an earlier unsharded run would declare every property twice
+        self._remove_generated_file(os.path.join(output_dir, SWIFT_FILE_NAME))
+        logger.info("Swift extensions generated in %s shards", shard_count)
+        
+        return result
+    
+    def _split_into_shards(self, property_names: Dict[str, str], shard_count: int,
+                           shard_by: str) -> List[Dict[str, str]]:
+        """Partition key -> property name mapping into shard_count shards"""
+        if shard_count < 1:
+            raise ValueError(f"shard_count must be at least 1, got {shard_count}")
+        if shard_by not in SHARD_STRATEGIES:
+            raise ValueError(f"Unsupported shard strategy: {shard_by}. Supported strategies: {list(SHARD_STRATEGIES)}")
+        
+        shards = [{} for _ in range(shard_count)]
+        for key, property_name in property_names.items():
+            shards[self._get_shard_index(key, shard_count, shard_by)][key] = property_name
+        return shards
+    
+    def _get_shard_index(self, key: str, shard_count: int, shard_by: str) -> int:
+        """Get stable shard index for a key (independent of Python's hash seed)"""
+        if shard_by == 'prefix':
+            key = SHARD_PREFIX_SPLIT_PATTERN.split(key, maxsplit=1)[0]
+        return zlib.crc32(key.encode('utf-8')) % shard_count
+    
+    def _remove_stale_shards(self, output_dir: str, shard_count: int, extension: str) -> None:
+        """Remove shard files left over from a previous run with more shards"""
+        for path in glob.glob(os.path.join(output_dir, f'LocalizedStrings+Shard*{extension}')):
+            match = re.search(r'\+Shard(\d+)' + re.escape(extension) + '$', path)
+            if match and int(match.group(1)) >= shard_count:
+                self._remove_generated_file(path)
+    
+    def _remove_generated_file(self, path: str) -> None:
+        """Remove a generated file left over from another output layout, and its manifest entry"""
+        if not os.path.exists(path):
+            return
+        os.remove(path)
+        logger.info("Removed stale generated file: %s", path)
+        
+        manifest_path = os.path.join(os.path.dirname(path), MANIFEST_FILE_NAME)
+        manifest = self._load_manifest(manifest_path)
+        if manifest.pop(os.path.basename(path), None) is not None:
+            self._save_manifest(manifest_path, manifest)
+    
     def generate_objc_header(self, strings_dict: Dict[str, str], output_path: str = None) -> str:
         """
         Generate Objective-C header file for use in Objective-C code
@@ -64,7 +243,48 @@ class LocalizationCodeGenerator:
         Returns:
             str: Generated Objective-C header file content
         """
-        header = '''//
+        property_names = self._resolve_objc_method_names(strings_dict, os.path.dirname(output_path) if output_path else None)
+        
+        objc_header = ''.join(self._iter_objc_header(strings_dict, property_names))
+        
+        # If output path is provided, write to file
+        if output_path:
+            try:
+                if self._write_if_changed(output_path, objc_header):
+                    logger.info("Objective-C header written to: %s", output_path)
+                else:
+                    logger.info("Objective-C header unchanged, skipped: %s", output_path)
+            except Exception as e:
+                logger.error("Error writing Objective-C header %s: %s", output_path, e)
+        
+        return objc_header
+    
+    def write_objc_header(self, strings_dict: Dict[str, str], output_path: str) -> bool:
+        """
+        Stream Objective-C header file to disk without building it in memory
+        
+        Args:
+            strings_dict: Dictionary of string key-value pairs
+            output_path: Output file path
+            
+        Returns:
+            bool: Whether generation was successful
+        """
+        property_names = self._resolve_objc_method_names(strings_dict, os.path.dirname(output_path))
+        
+        try:
+            if self._stream_if_changed(output_path, self._iter_objc_header(strings_dict, property_names)):
+                logger.info("Objective-C header written to: %s", output_path)
+            else:
+                logger.info("Objective-C header unchanged, skipped: %s", output_path)
+            return True
+        except Exception as e:
+            logger.error("Error writing Objective-C header %s: %s", output_path, e)
+            return False
+    
+    def _iter_objc_header(self, strings_dict: Dict[str, str], property_names: Dict[str, str]) -> Iterator[str]:
+        """Generate Objective-C header code fragments"""
+        yield '''//
 //  LocalizedStrings.h
 //  Generated by AppleStringsTranslator
 //
@@ -77,54 +297,342 @@ NS_ASSUME_NONNULL_BEGIN
 
 '''
         
-        methods = []
-        property_names = self._generate_property_names(strings_dict)
-        
-        for key, property_name in property_names.items():
-            value = strings_dict[key]
-            comment = f'/// {value}'
-            if len(value) > 50:
-                comment = f'/// {value[:47]}...'
-            
-            method = f'''{comment}
+        for index, (key, property_name) in enumerate(property_names.items()):
+            if index:
+                yield '\n'
+            yield f'''{self._doc_comment(strings_dict[key], '')}
 + (NSString *){property_name};
 '''
-            methods.append(method)
         
-        footer = '''
+        yield '''
 @end
 
 NS_ASSUME_NONNULL_END
 '''
+    
+    def generate_objc_implementation(self, strings_dict: Dict[str, str], output_path: str = None) -> str:
+        """
+        Generate Objective-C implementation file matching generate_objc_header
         
-        objc_header = header + '\n'.join(methods) + footer
+        Args:
+            strings_dict: Dictionary of string key-value pairs
+            output_path: Output file path
+            
+        Returns:
+            str: Generated Objective-C implementation file content
+        """
+        property_names = self._resolve_objc_method_names(strings_dict, os.path.dirname(output_path) if output_path else None)
+        
+        objc_implementation = ''.join(self._iter_objc_implementation(strings_dict, property_names))
         
-        # If output path is provided, write to file
         if output_path:
             try:
-                os.makedirs(os.path.dirname(output_path), exist_ok=True)
-                with open(output_path, 'w', encoding='utf-8') as file:
-                    file.write(objc_header)
-                print(f"Objective-C header written to: {output_path}")
+                if self._write_if_changed(output_path, objc_implementation):
+                    logger.info("Objective-C implementation written to: %s", output_path)
+                else:
+                    logger.info("Objective-C implementation unchanged, skipped: %s", output_path)
             except Exception as e:
-                print(f"Error writing Objective-C header {output_path}: {e}")
+                logger.error("Error writing Objective-C implementation %s: %s", output_path, e)
         
-        return objc_header
+        return objc_implementation
+    
+    def write_objc_implementation(self, strings_dict: Dict[str, str], output_path: str,
+                                  shard_count: int = 1, shard_by: str = 'hash') -> bool:
+        """
+        Stream Objective-C implementation file(s) to disk
+        
+        Methods resolve strings through a shared lookup function that caches the
+        bundle and every resolved string, instead of calling NSLocalizedString
+        each time. With shard_count > 1 the methods are split into category
+        implementations (LocalizedStrings+ShardNN.m) that compile in parallel.
+        
+        Args:
+            strings_dict: Dictionary of string key-value pairs
+            output_path: Output path of LocalizedStrings.m
+            shard_count: Number of category files to split the methods into
+            shard_by: How keys are assigned to shards ('hash' or 'prefix')
+            
+        Returns:
+            bool: Whether generation was successful
+        """
+        output_dir = os.path.dirname(output_path)
+        property_names = self._resolve_objc_method_names(strings_dict, output_dir)
+        
+        try:
+            if shard_count <= 1:
+                fragments = self._iter_objc_implementation(strings_dict, property_names)
+                if self._stream_if_changed(output_path, fragments):
+                    logger.info("Objective-C implementation written to: %s", output_path)
+                else:
+                    logger.info("Objective-C implementation unchanged, skipped: %s", output_path)
+                self._remove_stale_shards(output_dir, 0, '.m')
+                return True
+            
+            # Main file keeps only the shared lookup; methods live in the shards
+            if self._stream_if_changed(output_path, self._iter_objc_implementation(strings_dict, {}, sharded=True)):
+                logger.info("Objective-C implementation written to: %s", output_path)
+            
+            shards = self._split_into_shards(property_names, shard_count, shard_by)
+            for index, shard_property_names in enumerate(shards):
+                shard_path = os.path.join(output_dir, OBJC_SHARD_FILE_NAME.format(index=index))
+                fragments = self._iter_objc_shard(strings_dict, shard_property_names, index)
+                if self._stream_if_changed(shard_path, fragments):
+                    logger.info("Objective-C shard written to: %s (%d keys)", shard_path, len(shard_property_names))
+            
+            self._remove_stale_shards(output_dir, shard_count, '.m')
+            logger.info("Objective-C implementation generated in %s shards", shard_count)
+            return True
+        except Exception as e:
+            logger.error("Error writing Objective-C implementation %s: %s", output_path, e)
+            return False
+    
+    def _iter_objc_implementation(self, strings_dict: Dict[str, str], property_names: Dict[str, str],
+                                  sharded: bool = False) -> Iterator[str]:
+        """Generate Objective-C implementation code fragments"""
+        yield f'''//
+//  LocalizedStrings.m
+//  Generated by AppleStringsTranslator
+//
+
+#import "LocalizedStrings.h"
+
+NSString *{OBJC_LOOKUP_FUNCTION}(NSString *key);
+
+/// Resolves a key from Localizable.strings once, then serves it from memory
+NSString *{OBJC_LOOKUP_FUNCTION}(NSString *key) {{
+    static NSBundle *bundle;
+    static NSCache<NSString *, NSString *> *cache;
+    static dispatch_once_t onceToken;
+    dispatch_once(&onceToken, ^{{
+        bundle = [NSBundle mainBundle];
+        cache = [[NSCache alloc] init];
+    }});
+    
+    NSString *value = [cache objectForKey:key];
+    if (value == nil) {{
+        value = [bundle localizedStringForKey:key value:nil table:nil];
+        [cache setObject:value forKey:key];
+    }}
+    return value;
+}}
+
+'''
+        
+        if sharded:
+            # Methods are implemented in the LocalizedStrings+ShardNN.m categories
+            yield '''#pragma clang diagnostic push
+#pragma clang diagnostic ignored "-Wincomplete-implementation"
+@implementation LocalizedStrings
+@end
+#pragma clang diagnostic pop
+'''
+            return
+        
+        yield '@implementation LocalizedStrings\n\n'
+        yield from self._iter_objc_methods(strings_dict, property_names)
+        yield '\n@end\n'
+    
+    def _iter_objc_shard(self, strings_dict: Dict[str, str], property_names: Dict[str, str],
+                         index: int) -> Iterator[str]:
+        """Generate code fragments of one Objective-C category shard"""
+        category = f'Shard{index:02d}'
+        yield f'''//
+//  {OBJC_SHARD_FILE_NAME.format(index=index)}
+//  Generated by AppleStringsTranslator
+//
+
+#import "LocalizedStrings.h"
+
+NSString *{OBJC_LOOKUP_FUNCTION}(NSString *key);
+
+@implementation LocalizedStrings ({category})
+
+'''
+        yield from self._iter_objc_methods(strings_dict, property_names)
+        yield '\n@end\n'
+    
+    def _iter_objc_methods(self, strings_dict: Dict[str, str], property_names: Dict[str, str]) -> Iterator[str]:
+        """Generate Objective-C class method implementations"""
+        for index, (key, property_name) in enumerate(property_names.items()):
+            if index:
+                yield '\n'
+            yield f'''{self._doc_comment(strings_dict[key], '')}
++ (NSString *){property_name} {{
+    return {OBJC_LOOKUP_FUNCTION}(@"{self._escape_objc_string(key)}");
+}}
+'''
+    
+    def _escape_objc_string(self, text: str) -> str:
+        """Escape text for use inside an Objective-C string literal"""
+        return (text.replace('\\', '\\\\').replace('"', '\\"')
+                .replace('\n', '\\n').replace('\r', '\\r').replace('\t', '\\t'))
+    
+    def _doc_comment(self, value: str, indent: str) -> str:
+        """Build documentation comment showing the (truncated) English value"""
+        if len(value) > 50:
+            return f'{indent}/// {value[:47]}...'
+        return f'{indent}/// {value}'
+    
+    def _write_if_changed(self, output_path: str, content: str) -> bool:
+        """
+        Write generated code only if it differs from the file on disk
+        
+        Args:
+            output_path: Output file path
+            content: Generated file content
+            
+        Returns:
+            bool: True if the file was written, False if it was already up to date
+        """
+        return self._stream_if_changed(output_path, (content,))
+    
+    def _stream_if_changed(self, output_path: str, fragments: Iterable[str]) -> bool:
+        """
+        Stream generated code fragments to disk, replacing the file only if content changed
+        
+        Fragments are hashed while being written to a temporary file, which then
+        atomically replaces the output or is discarded. Leaving unchanged files
+        untouched keeps their mtime, so Xcode does not recompile everything that
+        imports them. A manifest of content hashes (with size and mtime) lets us
+        skip reading the existing file.
+        
+        Args:
+            output_path: Output file path
+            fragments: Iterable of generated code fragments
+            
+        Returns:
+            bool: True if the file was written, False if it was already up to date
+        """
+        output_dir = os.path.dirname(output_path)
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+        
+        hasher = hashlib.sha256()
+        temp_path = output_path + '.tmp'
+        try:
+            # Binary mode keeps the bytes identical to what we hashed
+            with open(temp_path, 'wb', buffering=WRITE_BUFFER_SIZE) as file:
+                for fragment in fragments:
+                    data = fragment.encode('utf-8')
+                    hasher.update(data)
+                    file.write(data)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        content_hash = hasher.hexdigest()
+        
+        manifest_path = os.path.join(output_dir, MANIFEST_FILE_NAME)
+        manifest = self._load_manifest(manifest_path)
+        file_name = os.path.basename(output_path)
+        
+        existing_hash = self._get_existing_hash(output_path, manifest.get(file_name))
+        
+        written = existing_hash != content_hash
+        if written:
+            os.replace(temp_path, output_path)
+        else:
+            os.remove(temp_path)
+        
+        stat = os.stat(output_path)
+        entry = {'sha256': content_hash, 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+        if manifest.get(file_name) != entry:
+            manifest[file_name] = entry
+            self._save_manifest(manifest_path, manifest)
+        
+        return written
+    
+    def _get_existing_hash(self, output_path: str, entry: Optional[Dict]) -> Optional[str]:
+        """Get content hash of an existing generated file, using the manifest entry when still valid"""
+        try:
+            stat = os.stat(output_path)
+        except OSError:
+            return None
+        
+        # Trust the cached hash only if the file was not touched since we recorded it
+        if entry and entry.get('size') == stat.st_size and entry.get('mtime_ns') == stat.st_mtime_ns:
+            return entry.get('sha256')
+        
+        with open(output_path, 'rb') as file:
+            return hashlib.sha256(file.read()).hexdigest()
+    
+    def _load_manifest(self, manifest_path: str) -> Dict:
+        """Load generated file manifest, empty if missing or unreadable"""
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as file:
+                manifest = json.load(file)
+            return manifest if isinstance(manifest, dict) else {}
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_manifest(self, manifest_path: str, manifest: Dict) -> None:
+        """Save generated file manifest, ignoring failures (it is only a cache)"""
+        try:
+            with open(manifest_path, 'w', encoding='utf-8') as file:
+                json.dump(manifest, file, indent=2, sort_keys=True)
+        except OSError as e:
+            logger.warning("Could not save generated file manifest %s: %s", manifest_path, e)
+    
+    def _resolve_property_names(self, strings_dict: Dict[str, str], output_dir: Optional[str] = None) -> Dict[str, str]:
+        """
+        Generate property names, reusing the naming map persisted in output_dir
+        
+        Args:
+            strings_dict: Dictionary of string key-value pairs
+            output_dir: Directory holding the naming map, None to skip persistence
+            
+        Returns:
+            Dict[str, str]: Mapping from original key names to Swift property names
+        """
+        if output_dir is None:
+            return self._generate_property_names(strings_dict)
+        
+        naming_map_path = os.path.join(output_dir, NAMING_MAP_FILE_NAME)
+        naming_map = self._load_manifest(naming_map_path)
+        
+        property_names = self._generate_property_names(strings_dict, naming_map)
+        
+        # Only current keys are kept, so removed keys free their names
+        if property_names != naming_map:
+            os.makedirs(output_dir, exist_ok=True)
+            self._save_manifest(naming_map_path, property_names)
+        
+        return property_names
     
-    def _generate_property_names(self, strings_dict: Dict[str, str]) -> Dict[str, str]:
+    def _generate_property_names(self, strings_dict: Dict[str, str],
+                                 naming_map: Optional[Dict[str, str]] = None) -> Dict[str, str]:
         """
         Generate valid Swift property names for each string key
         
+        Names from naming_map are kept when still valid, so keys keep their names
+        across runs even if other keys are added or removed. Collisions are
+        resolved with a per-base-name counter, keeping generation linear.
+        
         Args:
             strings_dict: Dictionary of string key-value pairs
+            naming_map: Previously generated key -> property name mapping
             
         Returns:
             Dict[str, str]: Mapping from original key names to Swift property names
         """
         property_names = {}
         used_names = set()
+        next_suffix = {}
+        
+        # Reserve names from the previous run first
+        if naming_map:
+            for key in strings_dict.keys():
+                property_name = naming_map.get(key)
+                if (isinstance(property_name, str) and property_name not in used_names
+                        and property_name not in self.reserved_keywords
+                        and VALID_IDENTIFIER_PATTERN.match(property_name)):
+                    property_names[key] = property_name
+                    used_names.add(property_name)
         
         for key in strings_dict.keys():
+            if key in property_names:
+                continue
+            
             # Convert to camelCase
             property_name = self._to_camel_case(key)
             
@@ -132,17 +640,51 @@ NS_ASSUME_NONNULL_END
             if property_name in self.reserved_keywords:
                 property_name = f"localized{property_name.capitalize()}"
             
-            # Ensure name is unique
-            original_name = property_name
-            counter = 1
-            while property_name in used_names:
+            # Ensure name is unique, resuming from the last suffix used for this base
+            if property_name in used_names:
+                original_name = property_name
+                counter = next_suffix.get(original_name, 1)
                 property_name = f"{original_name}{counter}"
-                counter += 1
+                while property_name in used_names:
+                    counter += 1
+                    property_name = f"{original_name}{counter}"
+                next_suffix[original_name] = counter + 1
             
             property_names[key] = property_name
             used_names.add(property_name)
         
-        return property_names
+        # Keep the order of the strings dictionary
+        return {key: property_names[key] for key in strings_dict.keys()}
+    
+    def _resolve_objc_method_names(self, strings_dict: Dict[str, str],
+                                   output_dir: Optional[str] = None) -> Dict[str, str]:
+        """
+        Get Objective-C class method names, derived from the Swift property names
+        
+        Names that are NSObject selectors or belong to an ARC method family get the
+        'localized' prefix in Objective-C only, so Swift names and the naming map stay as they are.
+        
+        Args:
+            strings_dict: Dictionary of string key-value pairs
+            output_dir: Directory holding the naming map, None to skip persistence
+            
+        Returns:
+            Dict[str, str]: Mapping from original key names to Objective-C method names
+        """
+        property_names = self._resolve_property_names(strings_dict, output_dir)
+        used_names = set(property_names.values())
+        method_names = {}
+        for key, property_name in property_names.items():
+            if property_name in OBJC_RESERVED_SELECTORS or OBJC_METHOD_FAMILY_PATTERN.match(property_name):
+                base_name = f"localized{property_name[0].upper()}{property_name[1:]}"
+                property_name = base_name
+                counter = 1
+                while property_name in used_names:
+                    property_name = f"{base_name}{counter}"
+                    counter += 1
+                used_names.add(property_name)
+            method_names[key] = property_name
+        return method_names
     
     def _to_camel_case(self, text: str) -> str:
         """
@@ -155,22 +697,16 @@ NS_ASSUME_NONNULL_END
             str: Text in camelCase format
         """
         # Remove non-alphanumeric characters, replace with underscores
-        text = re.sub(r'[^a-zA-Z0-9_]', '_', text)
+        text = NON_IDENTIFIER_PATTERN.sub('_', text)
         
-        # Split words
-        words = text.split('_')
-        
-        # Filter empty strings
-        words = [word for word in words if word]
+        # Split words, filtering empty strings
+        words = [word for word in text.split('_') if word]
         
         if not words:
             return 'localizedString'
         
         # First word lowercase, rest capitalized
-        camel_case = words[0].lower()
-        for word in words[1:]:
-            if word:
-                camel_case += word.capitalize()
+        camel_case = words[0].lower() + ''.join(word.capitalize() for word in words[1:])
         
         # Ensure starts with a letter
         if not camel_case[0].isalpha():
@@ -178,12 +714,18 @@ NS_ASSUME_NONNULL_END
         
         return camel_case
     
-    def _generate_swift_code(self, strings_dict: Dict[str, str], property_names: Dict[str, str]) -> str:
+    def _generate_swift_code(self, strings_dict: Dict[str, str], property_names: Dict[str, str],
+                             file_name: str = 'LocalizedStrings.swift') -> str:
         """Generate Swift extension code"""
+        return ''.join(self._iter_swift_code(strings_dict, property_names, file_name))
+    
+    def _iter_swift_code(self, strings_dict: Dict[str, str], property_names: Dict[str, str],
+                         file_name: str = 'LocalizedStrings.swift') -> Iterator[str]:
+        """Generate Swift extension code fragments"""
         
         # File header comment
-        header = '''//
-//  LocalizedStrings.swift
+        yield f'''//
+//  {file_name}
 //  Generated by AppleStringsTranslator
 //
 //  This file contains extensions for String and LocalizedStringKey
@@ -195,67 +737,136 @@ import SwiftUI
 
 '''
         
+        # Format arguments are scanned in a single pass over the values
+        format_arguments = self._scan_format_arguments(strings_dict, property_names) if self.typed_format_accessors else {}
+        
         # String extension
-        string_extension = self._generate_string_extension(strings_dict, property_names)
+        yield from self._iter_string_extension(strings_dict, property_names, format_arguments)
         
-        # LocalizedStringKey extension
-        localized_string_key_extension = self._generate_localized_string_key_extension(strings_dict, property_names)
+        yield '\n'
         
-        return header + string_extension + '\n' + localized_string_key_extension
+        # LocalizedStringKey extension
+        yield from self._iter_localized_string_key_extension(strings_dict, property_names)
     
     def _generate_string_extension(self, strings_dict: Dict[str, str], property_names: Dict[str, str]) -> str:
         """Generate String extension"""
+        return ''.join(self._iter_string_extension(strings_dict, property_names))
+    
+    def _iter_string_extension(self, strings_dict: Dict[str, str], property_names: Dict[str, str],
+                               format_arguments: Optional[Dict[str, List[str]]] = None) -> Iterator[str]:
+        """Generate String extension code fragments"""
+        format_arguments = format_arguments or {}
         
-        extension_start = '''// MARK: - String Extension for Localized Strings
+        yield '''// MARK: - String Extension for Localized Strings
 extension String {
 '''
         
-        extension_end = '}\n'
-        
-        properties = []
-        
         # Generate static properties
-        for key, property_name in property_names.items():
-            value = strings_dict[key]
-            comment = f'    /// {value}'
-            if len(value) > 50:
-                comment = f'    /// {value[:47]}...'
-            
-            property_code = f'''{comment}
+        for index, (key, property_name) in enumerate(property_names.items()):
+            if index:
+                yield '\n'
+            if key in format_arguments:
+                yield self._format_accessor_code(strings_dict[key], key, property_name, format_arguments[key])
+                continue
+            yield f'''{self._doc_comment(strings_dict[key], '    ')}
     static var {property_name}: String {{
         return NSLocalizedString("{key}", comment: "")
     }}
 '''
-            properties.append(property_code)
         
-        return extension_start + '\n'.join(properties) + extension_end
+        yield '}\n'
+    
+    def _format_accessor_code(self, value: str, key: str, property_name: str, argument_types: List[str]) -> str:
+        """Generate a typed static function that formats the localized string"""
+        parameters = ', '.join(f'_ arg{i}: {arg_type}' for i, arg_type in enumerate(argument_types, 1))
+        arguments = ', '.join(f'arg{i}' for i in range(1, len(argument_types) + 1))
+        return f'''{self._doc_comment(value, '    ')}
+    static func {property_name}({parameters}) -> String {{
+        return String(format: NSLocalizedString("{key}", comment: ""), {arguments})
+    }}
+'''
+    
+    def _scan_format_arguments(self, strings_dict: Dict[str, str], property_names: Dict[str, str]) -> Dict[str, List[str]]:
+        """
+        Find format arguments of each value using one precompiled pattern
+        
+        Args:
+            strings_dict: Dictionary of string key-value pairs
+            property_names: Keys to scan
+            
+        Returns:
+            Dict[str, List[str]]: Mapping from key to Swift argument types, only for
+                                  keys with supported, consistent format specifiers
+        """
+        result = {}
+        
+        for key in property_names.keys():
+            value = strings_dict[key]
+            if '%' not in value:
+                continue
+            
+            argument_types = self._parse_format_arguments(value)
+            if argument_types:
+                result[key] = argument_types
+        
+        return result
+    
+    def _parse_format_arguments(self, value: str) -> Optional[List[str]]:
+        """Get Swift argument types of a format string, None if it has none or can't be typed safely"""
+        positions = {}
+        next_position = 1
+        
+        for match in FORMAT_SPECIFIER_PATTERN.finditer(value):
+            position, width, precision, _, conversion = match.groups()
+            if conversion == '%':
+                continue
+            
+            arg_type = FORMAT_ARGUMENT_TYPES.get(conversion)
+            # Star width/precision consumes extra arguments; leave those untyped
+            if arg_type is None or width == '*' or precision == '*':
+                return None
+            # "%dollars" or "5%ile" may be prose; skipping the match would mistype the other arguments
+            if conversion != '@' and value[match.end():match.end() + 1].isalpha():
+                return None
+            
+            if position:
+                index = int(position)
+            else:
+                index = next_position
+                next_position += 1
+            
+            if positions.get(index, arg_type) != arg_type:
+                return None
+            positions[index] = arg_type
+        
+        if not positions or sorted(positions) != list(range(1, len(positions) + 1)):
+            return None
+        
+        return [positions[index] for index in range(1, len(positions) + 1)]
     
     def _generate_localized_string_key_extension(self, strings_dict: Dict[str, str], property_names: Dict[str, str]) -> str:
         """Generate LocalizedStringKey extension"""
+        return ''.join(self._iter_localized_string_key_extension(strings_dict, property_names))
+    
+    def _iter_localized_string_key_extension(self, strings_dict: Dict[str, str],
+                                             property_names: Dict[str, str]) -> Iterator[str]:
+        """Generate LocalizedStringKey extension code fragments"""
         
-        extension_start = '''// MARK: - LocalizedStringKey Extension for SwiftUI
+        yield '''// MARK: - LocalizedStringKey Extension for SwiftUI
 extension LocalizedStringKey {
 '''
         
-        extension_end = '}\n'
-        
-        properties = []
-        
         # Generate static properties
-        for key, property_name in property_names.items():
-            value = strings_dict[key]
-            comment = f'    /// {value}'
-            if len(value) > 50:
-                comment = f'    /// {value[:47]}...'
-            
-            property_code = f'''{comment}
+        for index, (key, property_name) in enumerate(property_names.items()):
+            if index:
+                yield '\n'
+            yield f'''{self._doc_comment(strings_dict[key], '    ')}
     static var {property_name}: LocalizedStringKey {{
         return LocalizedStringKey("{key}")
     }}
 '''
-            properties.append(property_code)
         
-        return extension_start + '\n'.join(properties) + extension_end
+        yield '}\n'
     
     def generate_usage_example(self, strings_dict: Dict[str, str], property_names: Dict[str, str]) -> str:
         """Generate usage example code"""
@@ -9,6 +9,11 @@ import os
 import sys
 from typing import Dict, Any, Optional
 
+from .logging_config import get_logger
+
+
+logger = get_logger(__name__)
+
 
 class ConfigManager:
     """Configuration manager with multiple source support"""
@@ -35,9 +40,14 @@ class ConfigManager:
         """Load default configuration"""
         self.config = {
             'deepl_api_key': 'your-deepl-api-key-here',
+            'deepl_server_url': None,  # Official DeepL API unless overridden (e.g. stub server)
+            'deepl_glossary_dir': None,  # Directory with <source>-<target>.tsv glossaries
             'llm_api_url': 'http://127.0.0.1:11434/api/generate',
             'llm_model': 'mistral:latest',
             'llm_timeout': 60,
+            'llm_max_concurrency': 1,  # Requests in flight per LLM endpoint
+            'llm_api_key': None,  # Bearer token of OpenAI-compatible gateways
+            'llm_keep_alive': None,  # How long Ollama keeps the model loaded, e.g. '30m'
             'default_translator': 'deepl',
             'rate_limit_delay': 1.0,
             'preserve_order': True,
@@ -53,15 +63,25 @@ class ConfigManager:
             sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
             import config
             
-                    # Update configuration with values from config.py
-        if hasattr(config, 'DEEPL_API_KEY') and config.DEEPL_API_KEY != 'your-deepl-api-key-here':
-            self.config['deepl_api_key'] = config.DEEPL_API_KEY
+            # Update configuration with values from config.py
+            if hasattr(config, 'DEEPL_API_KEY') and config.DEEPL_API_KEY != 'your-deepl-api-key-here':
+                self.config['deepl_api_key'] = config.DEEPL_API_KEY
+            
+            if hasattr(config, 'DEEPL_SERVER_URL'):
+                self.config['deepl_server_url'] = config.DEEPL_SERVER_URL
+            
+            if hasattr(config, 'DEEPL_GLOSSARY_DIR'):
+                self.config['deepl_glossary_dir'] = config.DEEPL_GLOSSARY_DIR
             
             if hasattr(config, 'LLM_CONFIG'):
                 llm_config = config.LLM_CONFIG
                 self.config['llm_api_url'] = llm_config.get('api_url', self.config['llm_api_url'])
                 self.config['llm_model'] = llm_config.get('model', self.config['llm_model'])
                 self.config['llm_timeout'] = llm_config.get('timeout', self.config['llm_timeout'])
+                self.config['llm_max_concurrency'] = llm_config.get('max_concurrency',
+                                                                    self.config['llm_max_concurrency'])
+                self.config['llm_api_key'] = llm_config.get('api_key', self.config['llm_api_key'])
+                self.config['llm_keep_alive'] = llm_config.get('keep_alive', self.config['llm_keep_alive'])
             
             if hasattr(config, 'TRANSLATION_CONFIG'):
                 trans_config = config.TRANSLATION_CONFIG
@@ -79,15 +99,20 @@ class ConfigManager:
             # config.py doesn't exist, use defaults
             pass
         except Exception as e:
-            print(f"Warning: Error loading config.py: {e}")
+            logger.warning("Could not load config.py: %s", e)
     
     def _load_env_variables(self):
         """Load configuration from environment variables"""
         env_mappings = {
             'DEEPL_API_KEY': 'deepl_api_key',
+            'DEEPL_SERVER_URL': 'deepl_server_url',
+            'DEEPL_GLOSSARY_DIR': 'deepl_glossary_dir',
             'LLM_API_URL': 'llm_api_url',
             'LLM_MODEL': 'llm_model',
             'LLM_TIMEOUT': 'llm_timeout',
+            'LLM_MAX_CONCURRENCY': 'llm_max_concurrency',
+            'LLM_API_KEY': 'llm_api_key',
+            'LLM_KEEP_ALIVE': 'llm_keep_alive',
             'DEFAULT_TRANSLATOR': 'default_translator',
             'DEFAULT_OUTPUT_DIR': 'output_dir'
         }
@@ -96,7 +121,7 @@ class ConfigManager:
             value = os.getenv(env_var)
             if value:
                 # Convert types if needed
-                if config_key in ['llm_timeout']:
+                if config_key in ['llm_timeout', 'llm_max_concurrency']:
                     try:
                         value = int(value)
                     except ValueError:
@@ -128,19 +153,27 @@ class ConfigManager:
                             # Map environment variable names to config keys
                             env_mappings = {
                                 'DEEPL_API_KEY': 'deepl_api_key',
+                                'DEEPL_SERVER_URL': 'deepl_server_url',
+                                'DEEPL_GLOSSARY_DIR': 'deepl_glossary_dir',
                                 'LLM_API_URL': 'llm_api_url',
                                 'LLM_MODEL': 'llm_model',
+                                'LLM_MAX_CONCURRENCY': 'llm_max_concurrency',
+                                'LLM_API_KEY': 'llm_api_key',
+                                'LLM_KEEP_ALIVE': 'llm_keep_alive',
                                 'DEFAULT_TRANSLATOR': 'default_translator',
                                 'DEFAULT_OUTPUT_DIR': 'output_dir'
                             }
                             
-                            if key in env_mappings:
+                            if key == 'LLM_MAX_CONCURRENCY':
+                                if value.isdigit():
+                                    self.config['llm_max_concurrency'] = int(value)
+                            elif key in env_mappings:
                                 self.config[env_mappings[key]] = value
                             elif key == 'DEFAULT_OUTPUT_DIR':
                                 self.config['output_dir'] = value
                                 
             except Exception as e:
-                print(f"Warning: Error loading .env file: {e}")
+                logger.warning("Could not load .env file: %s", e)
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value"""
@@ -158,7 +191,10 @@ class ConfigManager:
         return {
             'api_url': self.get('llm_api_url'),
             'model': self.get('llm_model'),
-            'timeout': self.get('llm_timeout', 60)
+            'timeout': self.get('llm_timeout', 60),
+            'max_concurrency': self.get('llm_max_concurrency', 1),
+            'api_key': self.get('llm_api_key'),
+            'keep_alive': self.get('llm_keep_alive')
         }
     
     def validate_config(self) -> bool:
@@ -172,9 +208,9 @@ class ConfigManager:
                 issues.append("DeepL API key is not configured. Please set DEEPL_API_KEY or use --auth-key")
         
         if issues:
-            print("Configuration issues:")
+            logger.error("Configuration issues:")
             for issue in issues:
-                print(f"  - {issue}")
+                logger.error("  - %s", issue)
             return False
         
         return True
@@ -201,6 +237,10 @@ class ConfigManager:
         else:
             print(f"  DeepL API Key: Not configured")
         
+        if self.get('deepl_server_url'):
+            print(f"  DeepL Server URL: {self.get('deepl_server_url')}")
+        if self.get('deepl_glossary_dir'):
+            print(f"  DeepL Glossary Directory: {self.get('deepl_glossary_dir')}")
         print(f"  Default Translator: {self.get('default_translator')}")
         print(f"  LLM API URL: {self.get('llm_api_url')}")
         print(f"  LLM Model: {self.get('llm_model')}")
@@ -208,10 +248,20 @@ class ConfigManager:
         print(f"  Output Directory: {output_dir or 'Project root directory (default)'}")
 
 
-# Global configuration instance
-config_manager = ConfigManager()
+# Global configuration instance, created on first use
+_config_manager: Optional[ConfigManager] = None
 
 
 def get_config() -> ConfigManager:
     """Get global configuration manager instance"""
-    return config_manager
+    global _config_manager
+    if _config_manager is None:
+        _config_manager = ConfigManager()
+    return _config_manager
+
+
+def __getattr__(name):
+    """Keep the module-level config_manager attribute for backward compatibility"""
+    if name == 'config_manager':
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Logging configuration module
+Console output with verbosity levels, a JSONL event log and aggregated progress reporting
+"""
+
+import sys
+import json
+import time
+import logging
+from typing import Optional
+
+
+# Parent logger of every module, independent of whether modules are imported as src.* or directly
+LOGGER_NAME = 'ios_translator'
+
+# Minimum seconds between two progress lines
+PROGRESS_INTERVAL = 2.0
+PROGRESS_BAR_WIDTH = 20
+
+# Attributes every LogRecord has; anything else was passed through extra= and belongs to the event
+_STANDARD_RECORD_ATTRIBUTES = set(vars(logging.LogRecord('', 0, '', 0, '', None, None))) | {'message', 'asctime'}
+
+
+def get_logger(module_name: str) -> logging.Logger:
+    """
+    Get the logger of a module
+    
+    Args:
+        module_name: Module __name__, e.g. 'src.translators.deepl_translator'
+    
+    Returns:
+        logging.Logger: Child of the project logger, e.g. 'ios_translator.deepl_translator'
+    """
+    return logging.getLogger(f"{LOGGER_NAME}.{module_name.rsplit('.', 1)[-1]}")
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Format records as one JSON object per line, including extra= fields"""
+    
+    def format(self, record: logging.LogRecord) -> str:
+        event = {
+            'time': round(record.created, 6),
+            'level': record.levelname.lower(),
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        for name, value in vars(record).items():
+            if name not in _STANDARD_RECORD_ATTRIBUTES and not name.startswith('_'):
+                event[name] = value
+        if record.exc_info:
+            event['exception'] = self.formatException(record.exc_info)
+        return json.dumps(event, ensure_ascii=False, default=str)
+
+
+def configure_logging(verbose: bool = False, quiet: bool = False, event_log: Optional[str] = None) -> None:
+    """
+    Configure console and event log output of the project logger
+    
+    Modules only log; applications using them as a library (like the examples) call this once
+    at startup. Without it, Python's last-resort handler only prints warnings and errors.
+    
+    Args:
+        verbose: Also show debug messages such as per-key progress
+        quiet: Only show warnings and errors on the console
+        event_log: Path of a JSONL file receiving every event, including debug events
+    """
+    logger = logging.getLogger(LOGGER_NAME)
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        handler.close()
+    logger.propagate = False
+    
+    console_level = logging.DEBUG if verbose else logging.WARNING if quiet else logging.INFO
+    console = logging.StreamHandler(sys.stdout)
+    console.setLevel(console_level)
+    console.setFormatter(logging.Formatter('%(message)s'))
+    logger.addHandler(console)
+    
+    logger_level = console_level
+    if event_log:
+        file_handler = logging.FileHandler(event_log, mode='w', encoding='utf-8')
+        file_handler.setLevel(logging.DEBUG)
+        file_handler.setFormatter(JsonLinesFormatter())
+        logger.addHandler(file_handler)
+        logger_level = logging.DEBUG
+    
+    logger.setLevel(logger_level)
+
+
+class ProgressReporter:
+    """Aggregate progress of a long loop into periodic lines instead of one line per item"""
+    
+    def __init__(self, logger: logging.Logger, label: str, total: int, interval: float = PROGRESS_INTERVAL):
+        """
+        Args:
+            logger: Logger receiving the progress lines
+            label: Description of the work, e.g. 'Translating to FR'
+            total: Number of items
+            interval: Minimum seconds between two progress lines
+        """
+        self.logger = logger
+        self.label = label
+        self.total = total
+        self.interval = interval
+        self.done = 0
+        self.failed = 0
+        self._start = time.perf_counter()
+        self._last_report = self._start
+    
+    def update(self, count: int = 1, failed: int = 0) -> None:
+        """
+        Record finished items
+        
+        Args:
+            count: Number of items finished, including failed ones
+            failed: Number of those items that failed
+        """
+        self.done += count
+        self.failed += failed
+        
+        now = time.perf_counter()
+        if self.done < self.total and now - self._last_report >= self.interval:
+            self._last_report = now
+            self.logger.info("%s %s", self.label, self._format_bar(),
+                             extra={'event': 'progress', 'done': self.done, 'total': self.total,
+                                    'failed': self.failed})
+    
+    def close(self) -> None:
+        """Log the aggregate result"""
+        elapsed = time.perf_counter() - self._start
+        self.logger.info("%s: %d/%d done, %d failed in %.1fs", self.label, self.done - self.failed,
+                         self.total, self.failed, elapsed,
+                         extra={'event': 'progress_done', 'done': self.done, 'total': self.total,
+                                'failed': self.failed, 'seconds': round(elapsed, 6)})
+    
+    def _format_bar(self) -> str:
+        """Render e.g. [#####---------------] 25% 250/1000"""
+        fraction = self.done / self.total if self.total else 1.0
+        filled = int(fraction * PROGRESS_BAR_WIDTH)
+        bar = '#' * filled + '-' * (PROGRESS_BAR_WIDTH - filled)
+        return f"[{bar}] {fraction:4.0%} {self.done}/{self.total}"
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Run metrics module
+Collect per-phase timings, per-request latencies and counters of a translation run
+"""
+
+import json
+import math
+import time
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+from .logging_config import get_logger
+
+
+logger = get_logger(__name__)
+
+
+# Pipeline phases in report order
+PHASES = ['discover', 'parse', 'diff', 'translate', 'write', 'codegen']
+
+
+class Metrics:
+    """Thread-safe collector of timings and counters"""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.phases: Dict[str, float] = {}
+        self.languages: Dict[str, Dict[str, float]] = {}
+        self.counters: Dict[str, int] = {}
+        self.timings: Dict[str, List[float]] = {}
+        self.started_at = time.time()
+        self._start = time.perf_counter()
+        # Objects with phase_started(name, language) and phase_finished(name, language, seconds)
+        self.phase_listeners = []
+        # Objects with add_span(name, category, start, seconds, details), start on the perf_counter clock
+        self.span_listeners = []
+    
+    @contextmanager
+    def phase(self, name: str, language: Optional[str] = None) -> Iterator[None]:
+        """
+        Time a pipeline phase; durations of repeated phases are summed
+        
+        Args:
+            name: Phase name (see PHASES)
+            language: Also attribute the duration to this language
+        """
+        for listener in self.phase_listeners:
+            listener.phase_started(name, language)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            for listener in reversed(self.phase_listeners):
+                listener.phase_finished(name, language, elapsed)
+            self._emit_span(name, 'phase', start, elapsed, {'language': language} if language else {})
+            with self._lock:
+                self.phases[name] = self.phases.get(name, 0.0) + elapsed
+                if language:
+                    language_metrics = self.languages.setdefault(language, {})
+                    key = f'{name}_seconds'
+                    language_metrics[key] = language_metrics.get(key, 0.0) + elapsed
+    
+    @contextmanager
+    def timer(self, name: str, **details) -> Iterator[None]:
+        """
+        Record the duration of one event (e.g. an API request) under name
+        
+        Args:
+            name: Event name
+            **details: Extra span attributes, e.g. the number of texts in a request
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.record(name, elapsed)
+            self._emit_span(name, 'event', start, elapsed, details)
+    
+    def record(self, name: str, seconds: float) -> None:
+        """Record an event duration"""
+        with self._lock:
+            self.timings.setdefault(name, []).append(seconds)
+    
+    def increment(self, name: str, amount: int = 1) -> None:
+        """Increase a counter"""
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+    
+    def set_language_value(self, language: str, name: str, value) -> None:
+        """Store a per-language value (e.g. number of missing keys)"""
+        with self._lock:
+            self.languages.setdefault(language, {})[name] = value
+    
+    def sleep(self, seconds: float, name: str = 'sleep') -> None:
+        """
+        Sleep and account the time as throttling delay
+        
+        Args:
+            seconds: Time to sleep
+            name: Timing name, e.g. 'retry_wait' for backoff after throttling
+        """
+        if seconds <= 0:
+            return
+        start = time.perf_counter()
+        time.sleep(seconds)
+        self.record(name, seconds)
+        self._emit_span(name, 'wait', start, time.perf_counter() - start, {})
+    
+    def to_dict(self) -> Dict:
+        """Build the JSON-serializable report"""
+        with self._lock:
+            timings = {name: _summarize(values) for name, values in self.timings.items()}
+            return {
+                'started_at': self.started_at,
+                'total_seconds': round(time.perf_counter() - self._start, 6),
+                'phases': {name: round(seconds, 6) for name, seconds in self._ordered_phases()},
+                'languages': {language: dict(values) for language, values in sorted(self.languages.items())},
+                'counters': dict(sorted(self.counters.items())),
+                'timings': timings,
+            }
+    
+    def write_json(self, file_path: str) -> bool:
+        """
+        Write the report as JSON
+        
+        Args:
+            file_path: Output file path
+        
+        Returns:
+            bool: Whether write was successful
+        """
+        try:
+            with open(file_path, 'w', encoding='utf-8') as file:
+                json.dump(self.to_dict(), file, indent=2)
+            return True
+        except Exception as e:
+            logger.error("Error writing metrics file %s: %s", file_path, e)
+            return False
+    
+    def format_summary(self) -> str:
+        """Build a human-readable summary table"""
+        report = self.to_dict()
+        lines = ['Run Metrics:', '=' * 50, f"{'Phase':<28}{'Seconds':>12}"]
+        for name, seconds in report['phases'].items():
+            lines.append(f"{name:<28}{seconds:>12.3f}")
+        lines.append(f"{'total':<28}{report['total_seconds']:>12.3f}")
+        
+        if report['languages']:
+            lines += ['', f"{'Language':<16}{'Missing':>10}{'Translate s':>14}{'Write s':>10}"]
+            for language, values in report['languages'].items():
+                lines.append(f"{language:<16}{values.get('missing', 0):>10}"
+                             f"{values.get('translate_seconds', 0.0):>14.3f}{values.get('write_seconds', 0.0):>10.3f}")
+        
+        if report['timings']:
+            lines += ['', f"{'Timing':<16}{'Count':>8}{'Total s':>10}{'p50 s':>9}{'p90 s':>9}{'Max s':>9}"]
+            for name, summary in report['timings'].items():
+                lines.append(f"{name:<16}{summary['count']:>8}{summary['total']:>10.3f}"
+                             f"{summary['p50']:>9.3f}{summary['p90']:>9.3f}{summary['max']:>9.3f}")
+        
+        if report['counters']:
+            lines += ['', f"{'Counter':<28}{'Value':>12}"]
+            for name, value in report['counters'].items():
+                lines.append(f"{name:<28}{value:>12}")
+        
+        return '\n'.join(lines)
+    
+    def _emit_span(self, name: str, category: str, start: float, seconds: float, details: Dict) -> None:
+        for listener in self.span_listeners:
+            listener.add_span(name, category, start, seconds, details)
+    
+    def _ordered_phases(self):
+        """Known phases in pipeline order, then any others"""
+        known = [(name, self.phases[name]) for name in PHASES if name in self.phases]
+        others = [(name, seconds) for name, seconds in self.phases.items() if name not in PHASES]
+        return known + others
+
+
+def _percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of already sorted values"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(fraction * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def _summarize(values: List[float]) -> Dict[str, float]:
+    """Count, total and distribution of event durations"""
+    ordered = sorted(values)
+    return {
+        'count': len(ordered),
+        'total': round(sum(ordered), 6),
+        'p50': round(_percentile(ordered, 0.5), 6),
+        'p90': round(_percentile(ordered, 0.9), 6),
+        'max': round(ordered[-1], 6) if ordered else 0.0,
+    }
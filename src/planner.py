@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Translation planning module
+Dry-run estimate of the keys, characters, requests, quota and time a run would need
+"""
+
+import json
+from typing import Dict, List, Optional
+
+from .logging_config import get_logger
+
+
+logger = get_logger(__name__)
+
+
+class TranslationPlan:
+    """What a translation run would send, per locale, without sending anything"""
+    
+    def __init__(self, engine: str):
+        """
+        Args:
+            engine: Name of the translation engine, e.g. 'DeepLTranslator'
+        """
+        self.engine = engine
+        self.languages: Dict[str, Dict[str, int]] = {}
+        # Requests per engine of a cascade, per locale: language -> engine name -> requests
+        self.engine_requests: Dict[str, Dict[str, int]] = {}
+        self.usage: Optional[Dict] = None
+        self.seconds_per_character: Optional[float] = None
+        self.seconds_per_key: Optional[float] = None
+    
+    def add_language(self, language: str, texts: Dict[str, str], requests: int,
+                     engine_requests: Optional[Dict[str, int]] = None) -> None:
+        """
+        Add the missing strings of one locale
+        
+        Args:
+            language: iOS language code
+            texts: Missing keys and their English text
+            requests: Number of API requests the engine would send for texts
+            engine_requests: For a cascade, the requests each engine would send for texts
+        """
+        if engine_requests:
+            self.engine_requests[language] = engine_requests
+        non_empty = [text for text in texts.values() if text.strip()]
+        self.languages[language] = {
+            'keys': len(texts),
+            'characters': sum(len(text) for text in non_empty),
+            'unique_texts': len(set(non_empty)),
+            'requests': requests,
+        }
+    
+    def set_usage(self, usage: Optional[Dict]) -> None:
+        """Set the engine's quota usage, as returned by check_api_usage()"""
+        self.usage = usage
+    
+    def load_baseline(self, file_path: str) -> bool:
+        """
+        Derive throughput from the metrics report of an earlier run (--metrics-json)
+        
+        Args:
+            file_path: Metrics JSON path
+        
+        Returns:
+            bool: Whether a throughput could be derived
+        """
+        try:
+            with open(file_path, 'r', encoding='utf-8') as file:
+                report = json.load(file)
+        except (OSError, ValueError) as e:
+            logger.error("Error reading metrics baseline %s: %s", file_path, e)
+            return False
+        
+        # Translate phase time includes request latency, retries and rate-limit sleeps.
+        # Source characters, not characters_sent: LLM engines also send prompt templates
+        seconds = report.get('phases', {}).get('translate', 0.0)
+        counters = report.get('counters', {})
+        if seconds > 0 and counters.get('source_characters'):
+            self.seconds_per_character = seconds / counters['source_characters']
+        if seconds > 0 and counters.get('keys_translated'):
+            self.seconds_per_key = seconds / counters['keys_translated']
+        return self.seconds_per_character is not None or self.seconds_per_key is not None
+    
+    @property
+    def totals(self) -> Dict[str, int]:
+        """Sums over all locales"""
+        names = ('keys', 'characters', 'unique_texts', 'requests')
+        return {name: sum(values[name] for values in self.languages.values()) for name in names}
+    
+    @property
+    def remaining_characters(self) -> Optional[int]:
+        """Characters left in the quota, None if the engine has no known quota"""
+        if not self.usage or not self.usage.get('character_limit'):
+            return None
+        return max(0, self.usage['character_limit'] - self.usage.get('character_count', 0))
+    
+    @property
+    def fits_quota(self) -> bool:
+        """Whether all locales can be translated within the remaining quota"""
+        remaining = self.remaining_characters
+        return remaining is None or self.totals['characters'] <= remaining
+    
+    @property
+    def exhausted_at(self) -> Optional[str]:
+        """First locale, in processing order, that would run out of quota"""
+        remaining = self.remaining_characters
+        if remaining is None:
+            return None
+        used = 0
+        for language, values in self.languages.items():
+            used += values['characters']
+            if used > remaining:
+                return language
+        return None
+    
+    @property
+    def estimated_seconds(self) -> Optional[float]:
+        """Estimated translation time from the baseline throughput"""
+        totals = self.totals
+        if self.seconds_per_character is not None:
+            return totals['characters'] * self.seconds_per_character
+        if self.seconds_per_key is not None:
+            return totals['keys'] * self.seconds_per_key
+        return None
+    
+    @property
+    def engines(self) -> Dict[str, Dict]:
+        """
+        Keys, characters and requests per engine of a cascade, empty for a single engine
+        
+        Locales are assigned in processing order. A locale that does not fit the remaining
+        quota of an engine moves to the next engine, together with every later locale,
+        as the cascade does when an engine runs out of quota.
+        """
+        if not self.engine_requests:
+            return {}
+        names = list(next(iter(self.engine_requests.values())))
+        usages = (self.usage or {}).get('engines') or {}
+        engines = {name: {'locales': [], 'keys': 0, 'characters': 0, 'requests': 0} for name in names}
+        
+        current = 0
+        used = 0
+        for language, values in self.languages.items():
+            while current < len(names) - 1:
+                usage = usages.get(names[current])
+                limit = usage.get('character_limit') if usage else None
+                if not limit or used + values['characters'] <= limit - usage.get('character_count', 0):
+                    break
+                current += 1
+                used = 0
+            used += values['characters']
+            engine = engines[names[current]]
+            engine['locales'].append(language)
+            engine['keys'] += values['keys']
+            engine['characters'] += values['characters']
+            engine['requests'] += self.engine_requests.get(language, {}).get(names[current], 0)
+        return engines
+    
+    def to_dict(self) -> Dict:
+        """Build the JSON-serializable plan"""
+        estimated = self.estimated_seconds
+        return {
+            'engine': self.engine,
+            'languages': self.languages,
+            'totals': self.totals,
+            'usage': self.usage,
+            'remaining_characters': self.remaining_characters,
+            'fits_quota': self.fits_quota,
+            'exhausted_at': self.exhausted_at,
+            'engines': self.engines,
+            'estimated_seconds': round(estimated, 3) if estimated is not None else None,
+        }
+    
+    def format_summary(self) -> str:
+        """Build a human-readable plan"""
+        lines: List[str] = [f"Translation Plan ({self.engine}):", '=' * 50,
+                            f"{'Language':<16}{'Keys':>8}{'Unique':>8}{'Characters':>12}{'Requests':>10}"]
+        for language, values in self.languages.items():
+            lines.append(f"{language:<16}{values['keys']:>8}{values['unique_texts']:>8}"
+                         f"{values['characters']:>12}{values['requests']:>10}")
+        totals = self.totals
+        lines.append(f"{'total':<16}{totals['keys']:>8}{totals['unique_texts']:>8}"
+                     f"{totals['characters']:>12}{totals['requests']:>10}")
+        lines.append('')
+        
+        engines = self.engines
+        if engines:
+            lines.append("Requests above are those of the first engine; with failover when a quota runs out:")
+            lines.append(f"{'Engine':<16}{'Keys':>8}{'Characters':>12}{'Requests':>10}  Locales")
+            for name, values in engines.items():
+                lines.append(f"{name:<16}{values['keys']:>8}{values['characters']:>12}{values['requests']:>10}  "
+                             f"{', '.join(values['locales']) or '-'}")
+            lines.append('')
+        
+        remaining = self.remaining_characters
+        usages = (self.usage or {}).get('engines')
+        if remaining is None and usages:
+            lines.append("Quota: not limited, an engine without a known quota takes over when the others run out")
+        elif remaining is None:
+            lines.append("Quota: not reported by this engine")
+        elif self.fits_quota:
+            lines.append(f"Quota: {totals['characters']} of {remaining} remaining characters needed")
+        else:
+            lines.append(f"Quota: {totals['characters']} characters needed but only {remaining} remaining; "
+                         f"the run would run out while translating {self.exhausted_at}")
+        for name, usage in (usages or {}).items():
+            if usage and usage.get('character_limit'):
+                lines.append(f"  {name}: {usage.get('character_count', 0)} of {usage['character_limit']} characters used")
+            else:
+                lines.append(f"  {name}: no quota reported")
+        
+        estimated = self.estimated_seconds
+        if estimated is None:
+            lines.append("Estimated time: unknown (pass the --metrics-json report of an earlier run "
+                         "with --plan-baseline)")
+        else:
+            lines.append(f"Estimated time: {estimated:.1f}s")
+        
+        return '\n'.join(lines)
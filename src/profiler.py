@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Run profiler module
+Capture cProfile statistics and tracemalloc allocations of a run, split by pipeline phase
+"""
+
+import io
+import cProfile
+import pstats
+import tracemalloc
+from collections import Counter
+from typing import Dict, List, Optional
+
+from .logging_config import get_logger
+from .metrics import PHASES
+
+
+logger = get_logger(__name__)
+
+
+# Label of everything that runs outside a pipeline phase
+OUTSIDE_PHASES = 'other'
+
+# Allocations of the profiler itself are not interesting
+_MEMORY_FILTERS = [
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+]
+
+
+class RunProfiler:
+    """Phase listener for Metrics that attributes CPU time and allocations to pipeline phases"""
+    
+    def __init__(self, cpu: bool = True, memory: bool = False, top: int = 25, memory_frames: int = 1):
+        """
+        Args:
+            cpu: Collect cProfile statistics
+            memory: Collect tracemalloc allocation statistics
+            top: Number of functions / allocation sites listed per phase
+            memory_frames: Traceback depth stored per allocation
+        """
+        self.cpu = cpu
+        self.memory = memory
+        self.top = top
+        self.memory_frames = memory_frames
+        
+        self._profiles: Dict[str, cProfile.Profile] = {}
+        self._labels: List[str] = []
+        self._snapshots: List[tracemalloc.Snapshot] = []
+        self._allocations: Dict[str, Counter] = {}
+        self._allocation_counts: Dict[str, Counter] = {}
+        self._peaks: Dict[str, int] = {}
+        self._started_tracemalloc = False
+    
+    def start(self) -> None:
+        """Start profiling; time outside phases is attributed to 'other'"""
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start(self.memory_frames)
+            self._started_tracemalloc = True
+        self._labels = [OUTSIDE_PHASES]
+        self._enable(OUTSIDE_PHASES)
+    
+    def stop(self) -> None:
+        """Stop profiling"""
+        if self._labels:
+            self._disable(self._labels[-1])
+        self._labels = []
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+    
+    def phase_started(self, name: str, language: Optional[str] = None) -> None:
+        """Switch attribution to the phase"""
+        if not self._labels:
+            return
+        self._disable(self._labels[-1])
+        self._labels.append(name)
+        
+        if self.memory and tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+            self._snapshots.append(self._take_snapshot())
+        self._enable(name)
+    
+    def phase_finished(self, name: str, language: Optional[str] = None, seconds: float = 0.0) -> None:
+        """Record the phase and switch attribution back to the enclosing phase"""
+        if len(self._labels) < 2:
+            return
+        self._disable(name)
+        self._labels.pop()
+        
+        if self.memory and tracemalloc.is_tracing() and self._snapshots:
+            _, peak = tracemalloc.get_traced_memory()
+            self._peaks[name] = max(self._peaks.get(name, 0), peak)
+            before = self._snapshots.pop()
+            sizes = self._allocations.setdefault(name, Counter())
+            counts = self._allocation_counts.setdefault(name, Counter())
+            for stat in self._take_snapshot().compare_to(before, 'lineno'):
+                if stat.size_diff:
+                    site = str(stat.traceback)
+                    sizes[site] += stat.size_diff
+                    counts[site] += stat.count_diff
+        self._enable(self._labels[-1])
+    
+    def write_reports(self, path_prefix: str) -> List[str]:
+        """
+        Write the collected statistics
+        
+        Writes <prefix>.prof (all phases, for pstats/snakeviz) and <prefix>.profile.txt
+        when CPU profiling, and <prefix>.memory.txt when memory profiling.
+        
+        Args:
+            path_prefix: Output path without extension
+        
+        Returns:
+            List[str]: Written file paths
+        """
+        written = []
+        
+        try:
+            profiles = [self._profiles[label] for label in self._ordered_labels(self._profiles)]
+            if self.cpu and profiles:
+                stats = pstats.Stats(profiles[0])
+                for profile in profiles[1:]:
+                    stats.add(profile)
+                stats.dump_stats(f'{path_prefix}.prof')
+                written.append(f'{path_prefix}.prof')
+                
+                with open(f'{path_prefix}.profile.txt', 'w', encoding='utf-8') as file:
+                    file.write(self.format_cpu_report())
+                written.append(f'{path_prefix}.profile.txt')
+            
+            if self.memory:
+                with open(f'{path_prefix}.memory.txt', 'w', encoding='utf-8') as file:
+                    file.write(self.format_memory_report())
+                written.append(f'{path_prefix}.memory.txt')
+        except Exception as e:
+            logger.error("Error writing profile %s: %s", path_prefix, e)
+        
+        return written
+    
+    def format_cpu_report(self) -> str:
+        """Top functions by cumulative time, one section per phase"""
+        sections = []
+        for label in self._ordered_labels(self._profiles):
+            output = io.StringIO()
+            stats = pstats.Stats(self._profiles[label], stream=output)
+            stats.sort_stats('cumulative').print_stats(self.top)
+            sections.append(f"==== Phase: {label} ====\n{output.getvalue().strip()}\n")
+        return '\n'.join(sections)
+    
+    def format_memory_report(self) -> str:
+        """Top allocation sites by net allocated size, one section per phase"""
+        sections = []
+        for label in self._ordered_labels(self._allocations):
+            lines = [f"==== Phase: {label} (peak {self._peaks.get(label, 0) / 1024:.1f} KiB) ===="]
+            counts = self._allocation_counts[label]
+            for site, size in self._allocations[label].most_common(self.top):
+                lines.append(f"{size / 1024:>12.1f} KiB {counts[site]:>+10} blocks  {site}")
+            sections.append('\n'.join(lines) + '\n')
+        return '\n'.join(sections)
+    
+    def _enable(self, label: str) -> None:
+        if self.cpu:
+            if label not in self._profiles:
+                self._profiles[label] = cProfile.Profile()
+            self._profiles[label].enable()
+    
+    def _disable(self, label: str) -> None:
+        if self.cpu and label in self._profiles:
+            self._profiles[label].disable()
+    
+    def _take_snapshot(self) -> tracemalloc.Snapshot:
+        return tracemalloc.take_snapshot().filter_traces(_MEMORY_FILTERS)
+    
+    def _ordered_labels(self, collected: Dict) -> List[str]:
+        """Pipeline phases in order, then other labels"""
+        known = [name for name in PHASES if name in collected]
+        return known + [name for name in collected if name not in PHASES]
@@ -7,8 +7,18 @@ Parse key-value pairs from iOS Localizable.strings files
 
 import re
 import os
+import plistlib
 from typing import Dict, Optional
 
+from .logging_config import get_logger
+
+
+logger = get_logger(__name__)
+
+
+# Magic header of binary property lists (compiled .strings files in app bundles)
+BINARY_PLIST_MAGIC = b'bplist00'
+
 
 class StringsParser:
     """Class for parsing and processing iOS Localizable.strings files"""
@@ -33,6 +43,9 @@ class StringsParser:
         if not os.path.exists(file_path):
             return {}
         
+        if is_binary_plist(file_path):
+            return self.parse_binary_plist_file(file_path)
+        
         try:
             with open(file_path, 'r', encoding='utf-8') as file:
                 content = file.read()
@@ -42,14 +55,39 @@ class StringsParser:
                 with open(file_path, 'r', encoding='utf-16') as file:
                     content = file.read()
             except Exception as e:
-                print(f"Error reading file {file_path}: {e}")
+                logger.error("Error reading file %s: %s", file_path, e)
                 return {}
         except Exception as e:
-            print(f"Error reading file {file_path}: {e}")
+            logger.error("Error reading file %s: %s", file_path, e)
             return {}
         
         return self.parse_strings_content(content)
     
+    def parse_binary_plist_file(self, file_path: str) -> Dict[str, str]:
+        """
+        Parse binary property list .strings file (as found in compiled app bundles)
+        
+        Args:
+            file_path: Path to the binary .strings file
+            
+        Returns:
+            Dict[str, str]: Dictionary of key-value pairs
+        """
+        try:
+            with open(file_path, 'rb') as file:
+                data = plistlib.load(file, fmt=plistlib.FMT_BINARY)
+        except Exception as e:
+            logger.error("Error reading binary plist %s: %s", file_path, e)
+            return {}
+        
+        if not isinstance(data, dict):
+            logger.error("Unexpected binary plist content in %s: not a dictionary", file_path)
+            return {}
+        
+        # Values are already unescaped in binary plists; skip non-string entries
+        return {key: value for key, value in data.items()
+                if isinstance(key, str) and isinstance(value, str)}
+    
     def parse_strings_content(self, content: str) -> Dict[str, str]:
         """
         Parse strings file content
@@ -76,7 +114,8 @@ class StringsParser:
         
         return result
     
-    def write_strings_file(self, strings_dict: Dict[str, str], file_path: str, preserve_order: bool = True) -> bool:
+    def write_strings_file(self, strings_dict: Dict[str, str], file_path: str, preserve_order: bool = True,
+                           binary: bool = False) -> bool:
         """
         Write key-value pairs dictionary to .strings file
         
@@ -84,6 +123,7 @@ class StringsParser:
             strings_dict: Dictionary of key-value pairs
             file_path: Output file path
             preserve_order: Whether to preserve the order of keys (default: True)
+            binary: Whether to write a binary property list instead of text (default: False)
             
         Returns:
             bool: Whether write was successful
@@ -92,6 +132,13 @@ class StringsParser:
             # Ensure directory exists
             os.makedirs(os.path.dirname(file_path), exist_ok=True)
             
+            if binary:
+                # Keep insertion order unless sorting was requested
+                with open(file_path, 'wb') as file:
+                    plistlib.dump(dict(strings_dict), file, fmt=plistlib.FMT_BINARY,
+                                  sort_keys=not preserve_order)
+                return True
+            
             with open(file_path, 'w', encoding='utf-8') as file:
                 file.write('/* Localizable.strings */\n\n')
                 
@@ -105,10 +152,11 @@ class StringsParser:
             
             return True
         except Exception as e:
-            print(f"Error writing file {file_path}: {e}")
+            logger.error("Error writing file %s: %s", file_path, e)
             return False
     
-    def update_strings_file(self, file_path: str, new_strings: Dict[str, str], reference_order: Dict[str, str] = None) -> bool:
+    def update_strings_file(self, file_path: str, new_strings: Dict[str, str], reference_order: Dict[str, str] = None,
+                            binary: Optional[bool] = None) -> bool:
         """
         Update existing .strings file, adding new key-value pairs while preserving order
         
@@ -116,10 +164,14 @@ class StringsParser:
             file_path: Path to .strings file
             new_strings: New key-value pairs to add
             reference_order: Reference dictionary to maintain key order (usually English strings)
+            binary: Write a binary property list; None keeps the existing file's format
             
         Returns:
             bool: Whether update was successful
         """
+        if binary is None:
+            binary = is_binary_plist(file_path)
+        
         # Read existing strings
         existing_strings = self.parse_strings_file(file_path)
         
@@ -143,7 +195,7 @@ class StringsParser:
             existing_strings = ordered_strings
         
         # Write back to file
-        return self.write_strings_file(existing_strings, file_path)
+        return self.write_strings_file(existing_strings, file_path, binary=binary)
     
     def _escape_string(self, text: str) -> str:
         """Escape special characters in string"""
@@ -164,6 +216,23 @@ class StringsParser:
         return text
 
 
+def is_binary_plist(file_path: str) -> bool:
+    """
+    Check whether a file is a binary property list by sniffing its magic header
+    
+    Args:
+        file_path: Path to the file
+        
+    Returns:
+        bool: True if the file starts with the bplist00 magic
+    """
+    try:
+        with open(file_path, 'rb') as file:
+            return file.read(len(BINARY_PLIST_MAGIC)) == BINARY_PLIST_MAGIC
+    except OSError:
+        return False
+
+
 def get_language_from_lproj(lproj_path: str) -> Optional[str]:
     """
     Extract language code from .lproj folder path
@@ -0,0 +1,503 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Local stand-in HTTP server for the DeepL, Ollama and OpenAI-compatible chat APIs
+Lets the real translators run end-to-end without network access, with
+configurable latency, throttling and errors for throughput benchmarks
+"""
+
+import re
+import json
+import time
+import uuid
+import random
+import argparse
+import itertools
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+
+# Languages reported by the DeepL /v2/languages endpoint
+STUB_DEEPL_LANGUAGES = ['AR', 'DA', 'DE', 'EN-GB', 'EN-US', 'ES', 'FI', 'FR', 'HI', 'IT', 'JA', 'KO',
+                        'NB', 'NL', 'PL', 'PT-BR', 'PT-PT', 'RU', 'SV', 'TR', 'ZH', 'ZH-HANT']
+
+# DeepL glossary endpoints: list and create at the prefix, get and delete at <prefix>/<id>
+GLOSSARY_PATH_PREFIX = '/v2/glossaries'
+
+# Prompt patterns of LLMTranslator, used to build plausible responses
+NUMBERED_LINE_PATTERN = re.compile(r'^(\d+)\. (.*)$', re.MULTILINE)
+SINGLE_TEXT_PATTERN = re.compile(r'Text to translate: "(.*)"', re.DOTALL)
+TARGET_LANGUAGE_PATTERN = re.compile(r' to ([^.\n]+?)[.\n]')
+
+# Appended to streamed responses, like models that keep talking after the last translation
+STUB_RAMBLE_LINES = ['', 'Note: The translations keep the tone of the original texts.',
+                     'Let me know if you need any adjustments.']
+
+
+class StubServerConfig:
+    """Behaviour of the stub server"""
+    
+    def __init__(self, latency: float = 0.0, per_item_latency: float = 0.0, throttle_rate: float = 0.0,
+                 error_rate: float = 0.0, retry_after: int = 1, character_limit: int = 500000,
+                 models: Optional[List[str]] = None, seed: Optional[int] = None):
+        """
+        Args:
+            latency: Delay added to every request in seconds
+            per_item_latency: Additional delay per text (DeepL) or per prompt line (Ollama)
+            throttle_rate: Probability of answering HTTP 429 with a Retry-After header
+            error_rate: Probability of answering HTTP 500
+            retry_after: Retry-After value sent with 429 responses, in seconds
+            character_limit: DeepL character quota; HTTP 456 once exceeded
+            models: Model names reported by /api/tags and /v1/models
+            seed: Random seed for reproducible runs
+        """
+        self.latency = latency
+        self.per_item_latency = per_item_latency
+        self.throttle_rate = throttle_rate
+        self.error_rate = error_rate
+        self.retry_after = retry_after
+        self.character_limit = character_limit
+        self.models = models or ['mistral:latest']
+        self.seed = seed
+
+
+class _StubRequestHandler(BaseHTTPRequestHandler):
+    """Request handler dispatching to the DeepL and Ollama endpoints"""
+    
+    server_version = 'TranslatorStub/1.0'
+    protocol_version = 'HTTP/1.1'
+    
+    def log_message(self, format, *args):
+        """Keep benchmark output clean"""
+        pass
+    
+    def do_GET(self):
+        path = urlparse(self.path).path
+        routes = {
+            '/v2/usage': self._deepl_usage,
+            '/v2/languages': self._deepl_languages,
+            '/v2/glossaries': self._deepl_list_glossaries,
+            '/api/tags': self._ollama_tags,
+            '/v1/models': self._openai_models,
+        }
+        handler = routes.get(path)
+        if handler is None and path.startswith(GLOSSARY_PATH_PREFIX):
+            handler = self._deepl_get_glossary
+        self._dispatch(handler, {})
+    
+    def do_DELETE(self):
+        path = urlparse(self.path).path
+        handler = self._deepl_delete_glossary if path.startswith(GLOSSARY_PATH_PREFIX) else None
+        self._dispatch(handler, {})
+    
+    def do_POST(self):
+        path = urlparse(self.path).path
+        length = int(self.headers.get('Content-Length', 0) or 0)
+        body = self.rfile.read(length) if length else b''
+        try:
+            payload = json.loads(body) if body else {}
+        except ValueError:
+            self._send_json(400, {'message': 'Invalid JSON body'})
+            return
+        
+        routes = {
+            '/v2/translate': self._deepl_translate,
+            '/v2/languages': self._deepl_languages,
+            '/v2/glossaries': self._deepl_create_glossary,
+            '/api/generate': self._ollama_generate,
+            '/v1/chat/completions': self._openai_chat_completions,
+        }
+        self._dispatch(routes.get(path), payload)
+    
+    def _dispatch(self, handler, payload: Dict):
+        """Apply injected faults, then call the endpoint handler"""
+        stub = self.server.stub
+        if handler is None:
+            self._send_json(404, {'message': f'Unknown endpoint: {self.path}'})
+            return
+        
+        stub.record('requests')
+        roll = stub.random()
+        if roll < stub.config.throttle_rate:
+            stub.record('throttled')
+            self._send_json(429, {'message': 'Too many requests'},
+                            {'Retry-After': str(stub.config.retry_after)})
+            return
+        if roll < stub.config.throttle_rate + stub.config.error_rate:
+            stub.record('errors')
+            self._send_json(500, {'message': 'Injected server error'})
+            return
+        
+        if stub.config.latency > 0:
+            time.sleep(stub.config.latency)
+        handler(payload)
+    
+    def _send_json(self, status: int, data, headers: Optional[Dict[str, str]] = None):
+        """Send a JSON response, or an empty body when data is None"""
+        body = json.dumps(data, ensure_ascii=False).encode('utf-8') if data is not None else b''
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+    
+    # DeepL endpoints
+    
+    def _deepl_translate(self, payload: Dict):
+        stub = self.server.stub
+        texts = payload.get('text') or []
+        if isinstance(texts, str):
+            texts = [texts]
+        target_lang = str(payload.get('target_lang', '')).upper()
+        if not texts or not target_lang:
+            self._send_json(400, {'message': 'Parameters text and target_lang are required'})
+            return
+        
+        characters = sum(len(text) for text in texts)
+        if not stub.consume_characters(characters):
+            self._send_json(456, {'message': 'Quota exceeded'})
+            return
+        
+        entries = {}
+        glossary_id = payload.get('glossary_id')
+        if glossary_id:
+            glossary = stub.glossaries.get(glossary_id)
+            if glossary is None:
+                self._send_json(404, {'message': 'Glossary not found'})
+                return
+            entries = glossary['entries']
+            stub.record('glossary_requests')
+        
+        if stub.config.per_item_latency > 0:
+            time.sleep(stub.config.per_item_latency * len(texts))
+        
+        self._send_json(200, {'translations': [
+            {'detected_source_language': str(payload.get('source_lang') or 'EN').upper(),
+             'text': f'[{target_lang}] {_apply_glossary(text, entries)}',
+             'billed_characters': len(text)}
+            for text in texts
+        ]})
+    
+    def _deepl_usage(self, payload: Dict):
+        stub = self.server.stub
+        self._send_json(200, {'character_count': stub.character_count,
+                              'character_limit': stub.config.character_limit})
+    
+    def _deepl_languages(self, payload: Dict):
+        self._send_json(200, [{'language': code, 'name': code, 'supports_formality': False}
+                              for code in STUB_DEEPL_LANGUAGES])
+    
+    def _deepl_create_glossary(self, payload: Dict):
+        if payload.get('entries_format', 'tsv') != 'tsv' or not payload.get('name'):
+            self._send_json(400, {'message': 'Parameters name and tsv entries are required'})
+            return
+        
+        entries = {}
+        for line in str(payload.get('entries', '')).splitlines():
+            if '\t' in line:
+                source, target = line.split('\t', 1)
+                entries[source] = target
+        if not entries:
+            self._send_json(400, {'message': 'Glossary entries must not be empty'})
+            return
+        
+        glossary = {
+            'glossary_id': str(uuid.uuid4()),
+            'name': payload['name'],
+            'ready': True,
+            'source_lang': str(payload.get('source_lang', '')).lower(),
+            'target_lang': str(payload.get('target_lang', '')).lower(),
+            'creation_time': time.strftime('%Y-%m-%dT%H:%M:%S.000000Z', time.gmtime()),
+            'entry_count': len(entries),
+        }
+        self.server.stub.add_glossary(glossary, entries)
+        self._send_json(201, glossary)
+    
+    def _deepl_list_glossaries(self, payload: Dict):
+        glossaries = self.server.stub.glossaries.values()
+        self._send_json(200, {'glossaries': [glossary['info'] for glossary in glossaries]})
+    
+    def _deepl_get_glossary(self, payload: Dict):
+        glossary = self.server.stub.glossaries.get(self._glossary_id())
+        if glossary is None:
+            self._send_json(404, {'message': 'Glossary not found'})
+            return
+        self._send_json(200, glossary['info'])
+    
+    def _deepl_delete_glossary(self, payload: Dict):
+        if not self.server.stub.delete_glossary(self._glossary_id()):
+            self._send_json(404, {'message': 'Glossary not found'})
+            return
+        self._send_json(204, None)
+    
+    def _glossary_id(self) -> str:
+        return urlparse(self.path).path[len(GLOSSARY_PATH_PREFIX):].strip('/')
+    
+    # Ollama endpoints
+    
+    def _ollama_tags(self, payload: Dict):
+        self._send_json(200, {'models': [{'name': name} for name in self.server.stub.config.models]})
+    
+    def _ollama_generate(self, payload: Dict):
+        self.server.stub.record_payload(payload)
+        prompt = payload.get('prompt', '')
+        if not prompt:
+            # Ollama loads the model and returns without generating
+            self._send_json(200, {'model': payload.get('model', ''), 'response': '', 'done': True,
+                                  'done_reason': 'load'})
+            return
+        response = stub_llm_response(prompt)
+        
+        if payload.get('stream'):
+            model = payload.get('model', '')
+            chunks = (json.dumps({'model': model, 'response': fragment, 'done': False}) + '\n'
+                      for fragment in self._stream_fragments(response))
+            self._send_stream('application/x-ndjson', chunks,
+                              json.dumps({'model': model, 'response': '', 'done': True}) + '\n')
+            return
+        
+        per_item_latency = self.server.stub.config.per_item_latency
+        if per_item_latency > 0:
+            time.sleep(per_item_latency * max(1, response.count('\n') + 1))
+        
+        self._send_json(200, {'model': payload.get('model', ''), 'response': response, 'done': True})
+    
+    def _stream_fragments(self, response: str):
+        """Yield a response in token-like pieces, one line per per_item_latency, followed by rambling"""
+        per_item_latency = self.server.stub.config.per_item_latency
+        for line in response.split('\n') + STUB_RAMBLE_LINES:
+            if per_item_latency > 0:
+                time.sleep(per_item_latency)
+            middle = len(line) // 2
+            yield line[:middle]
+            yield line[middle:] + '\n'
+    
+    def _send_stream(self, content_type: str, chunks, last_chunk: str):
+        """Send chunks with chunked transfer encoding; count streams the client closed early"""
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+        try:
+            for chunk in itertools.chain(chunks, [last_chunk]):
+                data = chunk.encode('utf-8')
+                self.wfile.write(f'{len(data):x}\r\n'.encode('ascii') + data + b'\r\n')
+                self.wfile.flush()
+            self.wfile.write(b'0\r\n\r\n')
+            self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            self.server.stub.record('streams_cancelled')
+            self.close_connection = True
+    
+    # OpenAI-compatible endpoints
+    
+    def _openai_models(self, payload: Dict):
+        self._send_json(200, {'object': 'list',
+                              'data': [{'id': name, 'object': 'model'} for name in self.server.stub.config.models]})
+    
+    def _openai_chat_completions(self, payload: Dict):
+        messages = payload.get('messages') or []
+        system = '\n'.join(m.get('content', '') for m in messages if m.get('role') == 'system')
+        prompt = '\n'.join(m.get('content', '') for m in messages if m.get('role') != 'system')
+        response = stub_llm_response(prompt)
+        
+        # Emulate prefix caching: a system prompt seen before counts as cached prompt tokens
+        cached_tokens = len(system) // 4 if self.server.stub.cache_prefix(system) else 0
+        prompt_tokens = (len(system) + len(prompt)) // 4
+        usage = {'prompt_tokens': prompt_tokens, 'completion_tokens': len(response) // 4,
+                 'prompt_tokens_details': {'cached_tokens': cached_tokens}}
+        
+        if payload.get('stream'):
+            model = payload.get('model', '')
+            chunks = ('data: ' + json.dumps({'object': 'chat.completion.chunk', 'model': model,
+                                             'choices': [{'index': 0, 'delta': {'content': fragment}}]}) + '\n\n'
+                      for fragment in self._stream_fragments(response))
+            final = ('data: ' + json.dumps({'object': 'chat.completion.chunk', 'model': model,
+                                            'choices': [], 'usage': usage}) + '\n\ndata: [DONE]\n\n')
+            self._send_stream('text/event-stream', chunks, final)
+            return
+        
+        self._send_json(200, {
+            'object': 'chat.completion',
+            'model': payload.get('model', ''),
+            'choices': [{'index': 0, 'message': {'role': 'assistant', 'content': response},
+                         'finish_reason': 'stop'}],
+            'usage': usage,
+        })
+
+
+def _apply_glossary(text: str, entries: Dict[str, str]) -> str:
+    """Replace glossary source terms, so tests can tell whether a glossary was used"""
+    for source, target in entries.items():
+        text = text.replace(source, target)
+    return text
+
+
+def stub_llm_response(prompt: str) -> str:
+    """
+    Build a deterministic "translation" for an LLMTranslator prompt
+    
+    Args:
+        prompt: Prompt sent by LLMTranslator
+    
+    Returns:
+        str: Response in the format LLMTranslator parses
+    """
+    match = TARGET_LANGUAGE_PATTERN.search(prompt)
+    language = match.group(1).strip() if match else 'Translated'
+    
+    numbered = NUMBERED_LINE_PATTERN.findall(prompt)
+    if numbered:
+        return '\n'.join(f'{number}. [{language}] {text}' for number, text in numbered)
+    
+    match = SINGLE_TEXT_PATTERN.search(prompt)
+    text = match.group(1) if match else prompt
+    return f'[{language}] {text}'
+
+
+class StubServer:
+    """Threaded stub server serving the DeepL, Ollama and OpenAI-compatible APIs on one local port"""
+    
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, config: Optional[StubServerConfig] = None):
+        """
+        Args:
+            host: Interface to bind
+            port: Port to bind, 0 picks a free port
+            config: Server behaviour, defaults to a fast and reliable server
+        """
+        self.config = config or StubServerConfig()
+        self.character_count = 0
+        self.stats = {'requests': 0, 'throttled': 0, 'errors': 0, 'glossaries_created': 0, 'glossary_requests': 0,
+                      'streams_cancelled': 0}
+        self.glossaries: Dict[str, Dict] = {}
+        # System prompts received by the chat endpoint
+        self.system_prompts = set()
+        # Bodies received by the Ollama generate endpoint
+        self.generate_payloads: List[Dict] = []
+        self._random = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+        self._thread = None
+        
+        self._server = ThreadingHTTPServer((host, port), _StubRequestHandler)
+        self._server.daemon_threads = True
+        self._server.stub = self
+    
+    @property
+    def url(self) -> str:
+        """Base URL of the server, usable as DeepL server_url"""
+        host, port = self._server.server_address[:2]
+        return f'http://{host}:{port}'
+    
+    @property
+    def ollama_url(self) -> str:
+        """Ollama generate endpoint, usable as LLMTranslator api_url"""
+        return f'{self.url}/api/generate'
+    
+    @property
+    def openai_url(self) -> str:
+        """OpenAI-compatible chat completions endpoint, usable as OpenAIChatTranslator api_url"""
+        return f'{self.url}/v1/chat/completions'
+    
+    def start(self) -> 'StubServer':
+        """Serve requests in a background thread"""
+        self._thread = threading.Thread(target=self._server.serve_forever, name='stub-server', daemon=True)
+        self._thread.start()
+        return self
+    
+    def stop(self) -> None:
+        """Stop serving and release the port"""
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+    
+    def serve_forever(self) -> None:
+        """Serve requests in the calling thread until interrupted"""
+        try:
+            self._server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._server.server_close()
+    
+    def __enter__(self) -> 'StubServer':
+        return self.start()
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
+    
+    def random(self) -> float:
+        """Thread-safe random roll for fault injection"""
+        with self._lock:
+            return self._random.random()
+    
+    def record(self, counter: str) -> None:
+        """Increment a statistics counter"""
+        with self._lock:
+            self.stats[counter] += 1
+    
+    def record_payload(self, payload: Dict) -> None:
+        """Keep a generate request body for inspection"""
+        with self._lock:
+            self.generate_payloads.append(payload)
+    
+    def cache_prefix(self, system_prompt: str) -> bool:
+        """Remember a system prompt, True if it was seen before"""
+        with self._lock:
+            seen = system_prompt in self.system_prompts
+            self.system_prompts.add(system_prompt)
+            return seen
+    
+    def add_glossary(self, info: Dict, entries: Dict[str, str]) -> None:
+        """Store a created glossary"""
+        with self._lock:
+            self.glossaries[info['glossary_id']] = {'info': info, 'entries': entries}
+            self.stats['glossaries_created'] += 1
+    
+    def delete_glossary(self, glossary_id: str) -> bool:
+        """Delete a glossary, False if it does not exist"""
+        with self._lock:
+            return self.glossaries.pop(glossary_id, None) is not None
+    
+    def consume_characters(self, count: int) -> bool:
+        """Charge DeepL characters against the quota, False if it would be exceeded"""
+        with self._lock:
+            if self.character_count + count > self.config.character_limit:
+                return False
+            self.character_count += count
+            return True
+
+
+def main():
+    """Run the stub server in the foreground"""
+    parser = argparse.ArgumentParser(description='Local stand-in server for the DeepL, Ollama and OpenAI APIs')
+    parser.add_argument('--host', default='127.0.0.1', help='Interface to bind')
+    parser.add_argument('--port', type=int, default=8765, help='Port to bind')
+    parser.add_argument('--latency', type=float, default=0.0, help='Delay per request in seconds')
+    parser.add_argument('--per-item-latency', type=float, default=0.0, help='Additional delay per text')
+    parser.add_argument('--throttle-rate', type=float, default=0.0, help='Fraction of requests answered with 429')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of requests answered with 500')
+    parser.add_argument('--character-limit', type=int, default=500000, help='DeepL character quota')
+    parser.add_argument('--model', action='append', dest='models', help='Model reported by /api/tags and /v1/models')
+    parser.add_argument('--seed', type=int, default=None, help='Random seed')
+    args = parser.parse_args()
+    
+    config = StubServerConfig(latency=args.latency, per_item_latency=args.per_item_latency,
+                              throttle_rate=args.throttle_rate, error_rate=args.error_rate,
+                              character_limit=args.character_limit, models=args.models, seed=args.seed)
+    server = StubServer(args.host, args.port, config)
+    print(f"Stub server listening on {server.url}")
+    print(f"  DeepL:  --deepl-server-url {server.url}")
+    print(f"  Ollama: --llm-url {server.ollama_url}")
+    print(f"  OpenAI: --translator openai --llm-url {server.openai_url}")
+    
+    server.serve_forever()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Trace export module
+Record pipeline spans and export them as Chrome trace-event JSON (chrome://tracing, Perfetto)
+"""
+
+import os
+import json
+import time
+import threading
+from typing import Dict, List
+
+from .logging_config import get_logger
+
+
+logger = get_logger(__name__)
+
+
+class TraceRecorder:
+    """Span listener for Metrics collecting complete ('X') trace events per thread"""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._events: List[Dict] = []
+        self._thread_ids: Dict[int, int] = {}
+        self._thread_names: Dict[int, str] = {}
+        self._pid = os.getpid()
+        # Trace timestamps are microseconds since the recorder was created
+        self._origin = time.perf_counter()
+    
+    def add_span(self, name: str, category: str, start: float, seconds: float, details: Dict) -> None:
+        """
+        Record a finished span
+        
+        Args:
+            name: Span name, e.g. 'parse' or 'request'
+            category: 'phase', 'event' or 'wait'
+            start: Start time on the time.perf_counter clock
+            seconds: Duration
+            details: Attributes shown for the span in the viewer
+        """
+        with self._lock:
+            event = {
+                'name': name,
+                'cat': category,
+                'ph': 'X',
+                'ts': round((start - self._origin) * 1e6, 3),
+                'dur': round(seconds * 1e6, 3),
+                'pid': self._pid,
+                'tid': self._thread_id(),
+            }
+            if details:
+                event['args'] = details
+            self._events.append(event)
+    
+    def to_dict(self) -> Dict:
+        """Build the trace-event document"""
+        with self._lock:
+            metadata = [
+                {'name': 'process_name', 'ph': 'M', 'pid': self._pid, 'tid': 0,
+                 'args': {'name': 'ios_translator'}},
+            ]
+            metadata += [
+                {'name': 'thread_name', 'ph': 'M', 'pid': self._pid, 'tid': tid, 'args': {'name': name}}
+                for tid, name in sorted(self._thread_names.items())
+            ]
+            return {
+                'traceEvents': metadata + sorted(self._events, key=lambda event: event['ts']),
+                'displayTimeUnit': 'ms',
+            }
+    
+    def write_json(self, file_path: str) -> bool:
+        """
+        Write the trace as JSON
+        
+        Args:
+            file_path: Output file path
+        
+        Returns:
+            bool: Whether write was successful
+        """
+        try:
+            with open(file_path, 'w', encoding='utf-8') as file:
+                json.dump(self.to_dict(), file, default=str)
+            return True
+        except Exception as e:
+            logger.error("Error writing trace file %s: %s", file_path, e)
+            return False
+    
+    def _thread_id(self) -> int:
+        """Small stable id of the current thread (caller holds the lock)"""
+        ident = threading.get_ident()
+        tid = self._thread_ids.get(ident)
+        if tid is None:
+            tid = len(self._thread_ids) + 1
+            self._thread_ids[ident] = tid
+            self._thread_names[tid] = threading.current_thread().name
+        return tid
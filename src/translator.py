@@ -6,14 +6,9 @@ This module provides backward compatibility for existing code while
 supporting the new modular translator structure.
 """
 
-# Import all translators from the new modular structure
-from .translators import (
-    TranslatorBase,
-    DeepLTranslator, 
-    MockTranslator,
-    LLMTranslator,
-    create_translator
-)
+# Import translators from the new modular structure; backends stay lazy
+from . import translators
+from .translators import TranslatorBase, create_translator
 
 # Re-export for backward compatibility
 __all__ = [
@@ -21,5 +16,14 @@ __all__ = [
     'DeepLTranslator',
     'MockTranslator', 
     'LLMTranslator',
+    'OpenAIChatTranslator',
+    'CascadeTranslator',
     'create_translator'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    """Resolve translator backends lazily through the translators package"""
+    if name in __all__:
+        return getattr(translators, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
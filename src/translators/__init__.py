@@ -2,18 +2,41 @@
 # -*- coding: utf-8 -*-
 """
 Translator modules package
+
+Backends are imported on first access, so importing the package (or using
+the mock translator) does not pay for the deepl and requests libraries.
 """
 
+import importlib
+
 from .base import TranslatorBase
-from .deepl_translator import DeepLTranslator
-from .mock_translator import MockTranslator
-from .llm_translator import LLMTranslator
 from .factory import create_translator
 
+# Translator class name -> module providing it
+_LAZY_TRANSLATORS = {
+    'DeepLTranslator': '.deepl_translator',
+    'MockTranslator': '.mock_translator',
+    'LLMTranslator': '.llm_translator',
+    'OpenAIChatTranslator': '.openai_translator',
+    'CascadeTranslator': '.cascade_translator',
+}
+
 __all__ = [
     'TranslatorBase',
     'DeepLTranslator', 
     'MockTranslator',
     'LLMTranslator',
+    'OpenAIChatTranslator',
+    'CascadeTranslator',
     'create_translator'
 ]
+
+
+def __getattr__(name):
+    """Import translator backends on first use"""
+    if name in _LAZY_TRANSLATORS:
+        module = importlib.import_module(_LAZY_TRANSLATORS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
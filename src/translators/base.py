@@ -4,16 +4,25 @@
 Base translator class
 """
 
-import time
 from abc import ABC, abstractmethod
 from typing import Dict, List, Optional
 
+from ..metrics import Metrics
+from ..logging_config import ProgressReporter, get_logger
+
+
+logger = get_logger(__name__)
+
 
 class TranslatorBase(ABC):
     """Base class for translators"""
     
     def __init__(self):
         self.rate_limit_delay = 1.0  # seconds, API call interval
+        # Replaced by the pipeline's collector so all translators report into one run
+        self.metrics = Metrics()
+        # Why the engine cannot translate anymore in this run (e.g. quota exhausted), None while usable
+        self.unavailable: Optional[str] = None
     
     @abstractmethod
     def translate(self, text: str, target_language: str, source_language: str = 'en') -> Optional[str]:
@@ -40,6 +49,30 @@ class TranslatorBase(ABC):
         """
         pass
     
+    def warm_up(self, texts: Dict[str, str]) -> None:
+        """
+        Prepare the engine for a run without blocking, e.g. load a model; called once after parsing
+        
+        Args:
+            texts: All source texts of the run
+        """
+        pass
+    
+    def plan_requests(self, texts: Dict[str, str]) -> int:
+        """
+        Number of API requests translate_batch would send for texts, without sending any
+        
+        Args:
+            texts: Dictionary of key-value pairs to translate
+            
+        Returns:
+            int: Expected number of requests, ignoring retries and fallbacks
+        """
+        non_empty = sum(1 for text in texts.values() if text.strip())
+        if hasattr(self, 'translate_batch_optimized'):
+            return 1 if non_empty else 0
+        return non_empty
+    
     def translate_batch(self, texts: Dict[str, str], target_language: str, source_language: str = 'en') -> Dict[str, str]:
         """
         Translate multiple texts in batch
@@ -59,19 +92,23 @@ class TranslatorBase(ABC):
         # Default individual translation approach
         result = {}
         total = len(texts)
+        progress = ProgressReporter(logger, f"Translating to {target_language}", total)
         
         for i, (key, text) in enumerate(texts.items(), 1):
-            print(f"Translating {i}/{total}: {key}")
+            logger.debug("Translating %d/%d: %s", i, total, key)
             
             translated = self.translate(text, target_language, source_language)
             if translated:
                 result[key] = translated
             else:
-                print(f"Failed to translate: {key} = {text}")
+                logger.debug("Failed to translate: %s = %s", key, text,
+                             extra={'event': 'translation_failed', 'key': key})
                 result[key] = text  # Keep original text
+            progress.update(failed=0 if translated else 1)
             
             # Add delay to avoid triggering API limits
             if i < total:
-                time.sleep(self.rate_limit_delay)
+                self.metrics.sleep(self.rate_limit_delay)
         
+        progress.close()
         return result
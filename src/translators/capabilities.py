@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Engine capability cache
+Keep model lists and supported-language lists on disk, refreshed in the background
+"""
+
+import os
+import json
+import time
+import threading
+from typing import Callable, Dict, List, Optional
+
+from ..logging_config import get_logger
+
+
+logger = get_logger(__name__)
+
+
+CAPABILITY_CACHE_FILE_NAME = 'capabilities.json'
+
+# Cached lists younger than this are used without refreshing
+DEFAULT_TTL = 24 * 3600
+
+# Entries not refreshed for this long belong to endpoints that are no longer used
+MAX_ENTRY_AGE = 30 * 24 * 3600
+
+# Overrides the cache directory, e.g. to share it between CI jobs
+CACHE_DIR_ENV = 'IOS_TRANSLATOR_CACHE_DIR'
+
+
+def default_cache_dir() -> str:
+    """$IOS_TRANSLATOR_CACHE_DIR, else $XDG_CACHE_HOME/ios_translator, else ~/.cache/ios_translator"""
+    if os.getenv(CACHE_DIR_ENV):
+        return os.environ[CACHE_DIR_ENV]
+    base = os.getenv('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'ios_translator')
+
+
+class CapabilityCache:
+    """Disk cache of engine capability lists with stale-while-refresh semantics"""
+    
+    def __init__(self, cache_dir: Optional[str] = None, ttl: float = DEFAULT_TTL):
+        """
+        Args:
+            cache_dir: Directory of the cache file, defaults to default_cache_dir()
+            ttl: Seconds after which a cached list is refreshed in the background
+        """
+        self.cache_path = os.path.join(cache_dir or default_cache_dir(), CAPABILITY_CACHE_FILE_NAME)
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: Optional[Dict[str, Dict]] = None
+        self._refreshing: Dict[str, threading.Thread] = {}
+    
+    def get(self, key: str, fetch: Callable[[], Optional[List[str]]], block: bool = False) -> Optional[List[str]]:
+        """
+        Get a cached list, refreshing it in the background when stale or missing
+        
+        Args:
+            key: Cache key, e.g. 'ollama-models:<tags url>'
+            fetch: Network call returning the list, or None if it failed
+            block: Fetch synchronously when nothing is cached yet
+        
+        Returns:
+            Optional[List[str]]: Cached list (possibly stale), None if not known yet
+        """
+        entry = self._entry(key)
+        if entry is None and block:
+            return self._refresh(key, fetch)
+        if entry is None or time.time() - entry['fetched_at'] >= self.ttl:
+            self.refresh_in_background(key, fetch)
+        return entry['value'] if entry else None
+    
+    def peek(self, key: str) -> Optional[List[str]]:
+        """Get a cached list without touching the network"""
+        entry = self._entry(key)
+        return entry['value'] if entry else None
+    
+    def refresh_in_background(self, key: str, fetch: Callable[[], Optional[List[str]]]) -> None:
+        """Start a refresh of the key unless one is already running"""
+        with self._lock:
+            running = self._refreshing.get(key)
+            if running is not None and running.is_alive():
+                return
+            thread = threading.Thread(target=self._refresh, args=(key, fetch),
+                                      name='capability-refresh', daemon=True)
+            self._refreshing[key] = thread
+        thread.start()
+    
+    def wait(self, timeout: Optional[float] = None) -> None:
+        """Wait for running background refreshes"""
+        with self._lock:
+            threads = list(self._refreshing.values())
+        for thread in threads:
+            thread.join(timeout)
+    
+    def _refresh(self, key: str, fetch: Callable[[], Optional[List[str]]]) -> Optional[List[str]]:
+        """Fetch a list and store it; failures are not cached so the next run tries again"""
+        value = fetch()
+        if value is None:
+            return None
+        with self._lock:
+            entries = self._load()
+            entries[key] = {'value': value, 'fetched_at': time.time()}
+            self._entries = entries
+            self._save(entries)
+        logger.debug("Refreshed capability cache entry %s (%d items)", key, len(value))
+        return value
+    
+    def _entry(self, key: str) -> Optional[Dict]:
+        with self._lock:
+            if self._entries is None:
+                self._entries = self._load()
+            return self._entries.get(key)
+    
+    def _load(self) -> Dict[str, Dict]:
+        """Read the cache file; other processes may have written entries since it was last read"""
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as file:
+                entries = json.load(file)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(entries, dict):
+            return {}
+        return {key: entry for key, entry in entries.items()
+                if isinstance(entry, dict) and isinstance(entry.get('value'), list)
+                and isinstance(entry.get('fetched_at'), (int, float))}
+    
+    def _save(self, entries: Dict[str, Dict]) -> None:
+        """Write atomically, so concurrent runs never read a partial file"""
+        now = time.time()
+        entries = {key: entry for key, entry in entries.items() if now - entry['fetched_at'] < MAX_ENTRY_AGE}
+        temp_path = f'{self.cache_path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            with open(temp_path, 'w', encoding='utf-8') as file:
+                json.dump(entries, file, indent=2, sort_keys=True)
+            os.replace(temp_path, self.cache_path)
+        except OSError as e:
+            logger.warning("Could not save capability cache %s: %s", self.cache_path, e)
+
+
+# Global capability cache instance, created on first use
+_capability_cache: Optional[CapabilityCache] = None
+
+
+def get_capability_cache() -> CapabilityCache:
+    """Get global capability cache instance"""
+    global _capability_cache
+    if _capability_cache is None:
+        _capability_cache = CapabilityCache()
+    return _capability_cache
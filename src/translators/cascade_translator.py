@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Cascade translator implementation
+Route work to the next engine when one runs out of quota or becomes unavailable
+"""
+
+from typing import Dict, List, Optional
+
+from .base import TranslatorBase
+from ..logging_config import get_logger
+
+
+logger = get_logger(__name__)
+
+
+# Engine recorded for texts no engine translated
+NO_ENGINE = 'none'
+
+
+class CascadeTranslator(TranslatorBase):
+    """Try engines in order, e.g. DeepL -> LLM, moving on when an engine becomes unavailable"""
+    
+    def __init__(self, translators: List[TranslatorBase], names: Optional[List[str]] = None):
+        """
+        Args:
+            translators: Engines in order of preference
+            names: Engine names used in reports, defaults to the class names
+        """
+        if not translators:
+            raise ValueError("Cascade translator requires at least one translator")
+        self.translators = translators
+        self.names = names or [type(translator).__name__ for translator in translators]
+        # Engine that produced each string: target language -> key -> engine name, 'none' if untranslated
+        self.produced_by: Dict[str, Dict[str, str]] = {}
+        self._skipped = set()
+        super().__init__()
+    
+    @property
+    def metrics(self):
+        return self._metrics
+    
+    @metrics.setter
+    def metrics(self, metrics) -> None:
+        """Share the collector with every engine"""
+        self._metrics = metrics
+        for translator in self.translators:
+            translator.metrics = metrics
+    
+    def translate(self, text: str, target_language: str, source_language: str = 'en') -> Optional[str]:
+        """Translate text with the first engine that is still available"""
+        for translator in self._available():
+            translated = translator.translate(text, target_language, source_language)
+            if translated is not None or not translator.unavailable:
+                return translated
+        return None
+    
+    def translate_batch_optimized(self, texts: Dict[str, str], target_language: str,
+                                  source_language: str = 'en') -> Dict[str, str]:
+        """
+        Translate a batch, handing the texts an engine left untranslated to the next engine
+        when that engine became unavailable
+        
+        Args:
+            texts: Dictionary of key-value pairs, keys are identifiers, values are texts to translate
+            target_language: Target language code
+            source_language: Source language code
+        
+        Returns:
+            Dict[str, str]: Dictionary of translated key-value pairs
+        """
+        result = dict(texts)
+        producers = self.produced_by.setdefault(target_language, {})
+        remaining = {key: text for key, text in texts.items() if text.strip()}
+        
+        for translator in self._available():
+            if not remaining:
+                break
+            name = self.names[self.translators.index(translator)]
+            translated = translator.translate_batch(remaining, target_language, source_language)
+            
+            # An unavailable engine returns the source text for everything it could not translate
+            failed_over = {}
+            done = 0
+            for key, text in remaining.items():
+                value = translated.get(key)
+                if translator.unavailable and (value is None or value == text):
+                    failed_over[key] = text
+                elif value is not None and value != text:
+                    result[key] = value
+                    producers[key] = name
+                    done += 1
+                else:
+                    producers[key] = NO_ENGINE
+            
+            if done:
+                self.metrics.increment(f'translated_by_{name}', done)
+                self.metrics.set_language_value(target_language, f'translated_by_{name}', done)
+            if failed_over:
+                logger.warning("%s is unavailable (%s); %d texts for %s go to the next engine",
+                               name, translator.unavailable, len(failed_over), target_language,
+                               extra={'event': 'engine_failover', 'engine': name,
+                                      'reason': translator.unavailable, 'remaining': len(failed_over)})
+            remaining = failed_over
+        
+        for key in remaining:
+            producers[key] = NO_ENGINE
+        # Kept in the metrics report (--metrics-json), so the attribution outlives the run
+        self.metrics.set_language_value(target_language, 'produced_by', dict(producers))
+        if remaining:
+            logger.error("No engine left to translate %d texts for %s", len(remaining), target_language)
+            self.unavailable = 'all engines unavailable'
+        return result
+    
+    def get_supported_languages(self) -> List[str]:
+        """Languages of the first available engine"""
+        available = self._available()
+        return available[0].get_supported_languages() if available else []
+    
+    def plan_requests(self, texts: Dict[str, str]) -> int:
+        """Requests of the first available engine, assuming it does not fail over"""
+        available = self._available()
+        return available[0].plan_requests(texts) if available else 0
+    
+    def plan_requests_by_engine(self, texts: Dict[str, str]) -> Dict[str, int]:
+        """Requests each available engine would send if it translated all texts"""
+        return {name: translator.plan_requests(texts)
+                for name, translator in zip(self.names, self.translators) if translator in self._available()}
+    
+    def warm_up(self, texts: Dict[str, str]) -> None:
+        """Warm up the first available engine; fallback engines are only used when needed"""
+        available = self._available()
+        if available:
+            available[0].warm_up(texts)
+    
+    def check_api_usage(self) -> Optional[Dict]:
+        """
+        Quota usage of the available engines
+        
+        Returns:
+            Optional[Dict]: Usage per engine name under 'engines' (None for engines without a quota);
+            character_count and character_limit are summed when every engine reports a quota,
+            and left out otherwise, since an engine without a quota covers any overrun.
+            None if no engine is available.
+        """
+        engines = {}
+        for name, translator in zip(self.names, self.translators):
+            if translator in self._available():
+                engines[name] = translator.check_api_usage() if hasattr(translator, 'check_api_usage') else None
+        if not engines:
+            return None
+        
+        usage = {'engines': engines}
+        if all(engine_usage and engine_usage.get('character_limit') for engine_usage in engines.values()):
+            usage['character_count'] = sum(engine_usage.get('character_count', 0) for engine_usage in engines.values())
+            usage['character_limit'] = sum(engine_usage['character_limit'] for engine_usage in engines.values())
+        return usage
+    
+    def _available(self) -> List[TranslatorBase]:
+        """Engines that did not become unavailable, logging each newly skipped engine once"""
+        available = []
+        for name, translator in zip(self.names, self.translators):
+            if not translator.unavailable:
+                available.append(translator)
+            elif name not in self._skipped:
+                self._skipped.add(name)
+                logger.info("Skipping %s for the rest of the run: %s", name, translator.unavailable)
+        return available
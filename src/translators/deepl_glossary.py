@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+DeepL glossary management
+Create DeepL glossaries from local TSV files and reuse them across runs
+"""
+
+import os
+import json
+import hashlib
+from typing import Dict, Optional
+
+from ..logging_config import get_logger
+
+
+logger = get_logger(__name__)
+
+
+# Glossary IDs by account and language pair, stored in the glossary directory
+GLOSSARY_CACHE_FILE_NAME = '.deepl_glossaries.json'
+
+# Local glossary files, e.g. en-de.tsv with one "source<TAB>target" entry per line
+GLOSSARY_FILE_NAME = '{source}-{target}.tsv'
+
+
+def load_glossary_file(file_path: str) -> Dict[str, str]:
+    """
+    Read glossary entries from a TSV file
+    
+    Blank lines and lines starting with '#' are ignored.
+    
+    Args:
+        file_path: TSV file path
+    
+    Returns:
+        Dict[str, str]: Mapping of source term -> target term
+    """
+    entries = {}
+    with open(file_path, 'r', encoding='utf-8') as file:
+        for line_number, line in enumerate(file, 1):
+            line = line.rstrip('\r\n')
+            if not line.strip() or line.lstrip().startswith('#'):
+                continue
+            if '\t' not in line:
+                logger.warning("Skipping glossary line without tab in %s:%d", file_path, line_number)
+                continue
+            source, target = (part.strip() for part in line.split('\t', 1))
+            if source and target:
+                entries[source] = target
+    return entries
+
+
+def glossary_hash(entries: Dict[str, str]) -> str:
+    """Content hash of glossary entries, independent of their order in the file"""
+    content = '\n'.join(f'{source}\t{target}' for source, target in sorted(entries.items()))
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+class DeepLGlossaryCache:
+    """Resolve DeepL glossary IDs for language pairs, creating glossaries only when their content changed"""
+    
+    def __init__(self, translator, glossary_dir: str, auth_key: str):
+        """
+        Args:
+            translator: deepl.Translator instance
+            glossary_dir: Directory containing <source>-<target>.tsv files
+            auth_key: DeepL API key; glossaries belong to an account, so cached IDs are kept per key
+        """
+        self.translator = translator
+        self.glossary_dir = glossary_dir
+        self.cache_path = os.path.join(glossary_dir, GLOSSARY_CACHE_FILE_NAME)
+        self.account = hashlib.sha256(auth_key.encode('utf-8')).hexdigest()[:12]
+        # Resolved IDs of this run, None for pairs without a glossary file
+        self._resolved: Dict[str, Optional[str]] = {}
+    
+    def get_glossary_id(self, source_lang: str, target_lang: str) -> Optional[str]:
+        """
+        Get the glossary ID for a language pair
+        
+        Args:
+            source_lang: DeepL source language code, e.g. 'EN'
+            target_lang: DeepL target language code, e.g. 'PT-BR'
+        
+        Returns:
+            Optional[str]: Glossary ID, None if there is no glossary file for the pair
+        """
+        pair = self._pair(source_lang, target_lang)
+        if pair not in self._resolved:
+            self._resolved[pair] = self._resolve(pair)
+        return self._resolved[pair]
+    
+    def _resolve(self, pair: str) -> Optional[str]:
+        """Reuse the cached glossary of a pair or create it"""
+        source, target = pair.split('-', 1)
+        file_path = os.path.join(self.glossary_dir, GLOSSARY_FILE_NAME.format(source=source, target=target))
+        if not os.path.exists(file_path):
+            return None
+        
+        try:
+            entries = load_glossary_file(file_path)
+        except OSError as e:
+            logger.error("Error reading glossary file %s: %s", file_path, e)
+            return None
+        if not entries:
+            return None
+        
+        content_hash = glossary_hash(entries)
+        cache = self._load_cache()
+        cache_key = self._cache_key(pair)
+        cached = cache.get(cache_key)
+        if cached and cached.get('hash') == content_hash:
+            if self._exists(cached['glossary_id']):
+                logger.debug("Reusing DeepL glossary %s for %s", cached['glossary_id'], pair)
+                return cached['glossary_id']
+            logger.info("DeepL glossary %s for %s was deleted on the server, creating it again",
+                        cached['glossary_id'], pair)
+        
+        try:
+            glossary = self.translator.create_glossary(
+                f'ios-translator {pair} {content_hash[:12]}', source, target, entries
+            )
+        except Exception as e:
+            logger.error("Failed to create DeepL glossary for %s: %s", pair, e)
+            return None
+        logger.info("Created DeepL glossary %s for %s (%d entries)", glossary.glossary_id, pair, len(entries),
+                    extra={'event': 'glossary_created', 'pair': pair, 'entries': len(entries)})
+        
+        # The previous version of this glossary is no longer used
+        if cached:
+            try:
+                self.translator.delete_glossary(cached['glossary_id'])
+            except Exception as e:
+                logger.debug("Could not delete old glossary %s: %s", cached['glossary_id'], e)
+        
+        cache[cache_key] = {'hash': content_hash, 'glossary_id': glossary.glossary_id, 'entry_count': len(entries)}
+        self._save_cache(cache)
+        return glossary.glossary_id
+    
+    def _exists(self, glossary_id: str) -> bool:
+        """Check a cached glossary once per run; assume it exists if the check itself fails"""
+        import deepl
+        try:
+            self.translator.get_glossary(glossary_id)
+            return True
+        except deepl.exceptions.GlossaryNotFoundException:
+            return False
+        except Exception as e:
+            logger.debug("Could not check glossary %s: %s", glossary_id, e)
+            return True
+    
+    def _pair(self, source_lang: str, target_lang: str) -> str:
+        """Glossaries are not regional: PT-BR and PT-PT share the en-pt glossary"""
+        return f"{source_lang.split('-')[0].lower()}-{target_lang.split('-')[0].lower()}"
+    
+    def _cache_key(self, pair: str) -> str:
+        return f'{self.account}:{pair}'
+    
+    def _load_cache(self) -> Dict[str, Dict]:
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as file:
+                cache = json.load(file)
+            return cache if isinstance(cache, dict) else {}
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_cache(self, cache: Dict[str, Dict]) -> None:
+        try:
+            with open(self.cache_path, 'w', encoding='utf-8') as file:
+                json.dump(cache, file, indent=2, sort_keys=True)
+        except OSError as e:
+            logger.warning("Could not save glossary cache %s: %s", self.cache_path, e)
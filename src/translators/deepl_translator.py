@@ -4,25 +4,44 @@
 DeepL translator implementation
 """
 
-import time
 from typing import Dict, List, Optional
 
+from .base import TranslatorBase
+from .capabilities import CapabilityCache, get_capability_cache
+from .deepl_glossary import DeepLGlossaryCache
+from ..logging_config import ProgressReporter, get_logger
+
+
+logger = get_logger(__name__)
+
 try:
     import deepl
 except ImportError:
-    print("Warning: deepl library not found. Please install it with: pip install deepl")
+    logger.warning("deepl library not found. Please install it with: pip install deepl")
     deepl = None
 
-from .base import TranslatorBase
+# Retries of a request that could not reach DeepL, with exponential backoff
+CONNECTION_RETRIES = 3
 
 
 class DeepLTranslator(TranslatorBase):
     """DeepL API translator implementation"""
     
-    def __init__(self, auth_key: str):
+    def __init__(self, auth_key: str, server_url: Optional[str] = None, glossary_dir: Optional[str] = None,
+                 capability_cache: Optional[CapabilityCache] = None):
+        """
+        Args:
+            auth_key: DeepL API authentication key
+            server_url: Alternative API base URL, e.g. a local stub server
+            glossary_dir: Directory with <source>-<target>.tsv glossaries applied to every translation
+            capability_cache: Cache of supported languages, defaults to the shared on-disk cache
+        """
         super().__init__()
         self.auth_key = auth_key
+        self.server_url = server_url
         self.rate_limit_delay = 1.2  # DeepL free tier has stricter limits
+        self.connection_retry_delay = 1.0  # seconds, doubled on every retry
+        self.capabilities = capability_cache or get_capability_cache()
         
         # Check if deepl library is available
         if deepl is None:
@@ -30,10 +49,13 @@ class DeepLTranslator(TranslatorBase):
         
         # Initialize DeepL translator
         try:
-            self.translator = deepl.Translator(auth_key)
+            self.translator = deepl.Translator(auth_key, server_url=server_url)
         except Exception as e:
             raise ValueError(f"Failed to initialize DeepL translator: {e}")
         
+        # Glossaries are created once per content version and reused across runs
+        self.glossaries = DeepLGlossaryCache(self.translator, glossary_dir, auth_key) if glossary_dir else None
+        
         # DeepL supported language code mapping (iOS -> DeepL)
         # Using lowercase keys to match the _convert_language_code method
         self.language_mapping = {
@@ -71,41 +93,82 @@ class DeepLTranslator(TranslatorBase):
         source_lang = self._convert_language_code(source_language) if source_language != 'en' else 'EN'
         
         if not target_lang:
-            print(f"Unsupported target language: {target_language}")
+            logger.error("Unsupported target language: %s", target_language)
             return None
         
         try:
             # Use official DeepL library for translation
-            result = self.translator.translate_text(
-                text, 
-                target_lang=target_lang,
-                source_lang=source_lang
-            )
+            self.metrics.increment('requests')
+            self.metrics.increment('characters_sent', len(text))
+            with self.metrics.timer('request', items=1, target_language=target_lang):
+                result = self._translate_text(text, target_lang, source_lang)
             return result.text
             
         except deepl.exceptions.AuthorizationException:
-            print(f"DeepL API authorization failed. Please check your API key.")
+            logger.error("DeepL API authorization failed. Please check your API key.")
+            self.unavailable = 'authorization failed'
             return None
         except deepl.exceptions.QuotaExceededException:
-            print(f"DeepL API quota exceeded. Please check your usage.")
+            logger.error("DeepL API quota exceeded. Please check your usage.")
+            self.unavailable = 'quota exceeded'
             return None
         except deepl.exceptions.TooManyRequestsException:
-            print(f"Too many requests to DeepL API. Please try again later.")
+            logger.error("Too many requests to DeepL API. Please try again later.")
+            return None
+        except deepl.exceptions.ConnectionException as e:
+            # Transient: later requests try again, so DeepL is not marked unavailable
+            logger.error("Could not connect to DeepL API: %s", e)
             return None
         except Exception as e:
-            print(f"Translation error: {e}")
+            logger.error("Translation error: %s", e)
             return None
     
     def get_supported_languages(self) -> List[str]:
-        """Get list of DeepL supported language codes"""
+        """Get list of DeepL supported language codes, cached on disk and refreshed in the background"""
+        # Free and Pro accounts use different endpoints
+        endpoint = self.server_url or ('free' if self.auth_key.endswith(':fx') else 'pro')
+        languages = self.capabilities.get(f'deepl-target-languages:{endpoint}', self._get_target_languages,
+                                          block=True)
+        return languages if languages is not None else list(self.language_mapping.values())
+    
+    def _get_target_languages(self) -> Optional[List[str]]:
+        """Get supported target languages from DeepL, None if the request failed"""
         try:
-            # Get supported target languages
             target_languages = self.translator.get_target_languages()
             return [lang.code for lang in target_languages]
             
         except Exception as e:
-            print(f"Failed to get supported languages: {e}")
-            return list(self.language_mapping.values())
+            logger.warning("Failed to get supported languages: %s", e)
+            return None
+    
+    def _translate_text(self, text, target_lang: str, source_lang: str):
+        """
+        Call DeepL with the glossary of the language pair, if any
+        
+        Args:
+            text: Text or list of texts
+            target_lang: DeepL target language code
+            source_lang: DeepL source language code
+        
+        Returns:
+            TextResult or list of TextResult, as returned by deepl.Translator.translate_text
+        
+        Raises:
+            deepl.exceptions.ConnectionException: If DeepL could not be reached after CONNECTION_RETRIES retries
+        """
+        glossary_id = self.glossaries.get_glossary_id(source_lang, target_lang) if self.glossaries else None
+        for attempt in range(CONNECTION_RETRIES + 1):
+            try:
+                return self.translator.translate_text(
+                    text, target_lang=target_lang, source_lang=source_lang, glossary=glossary_id
+                )
+            except deepl.exceptions.ConnectionException as e:
+                if attempt == CONNECTION_RETRIES:
+                    raise
+                delay = self.connection_retry_delay * 2 ** attempt
+                logger.warning("Could not connect to DeepL API (%s), retrying in %.1fs", e, delay)
+                self.metrics.increment('retries')
+                self.metrics.sleep(delay, 'retry_wait')
     
     def _convert_language_code(self, language_code: str) -> Optional[str]:
         """Convert common language code to DeepL API format"""
@@ -127,7 +190,7 @@ class DeepLTranslator(TranslatorBase):
                 'document_limit_reached': usage.document.limit_reached if usage.document else False
             }
         except Exception as e:
-            print(f"Failed to check API usage: {e}")
+            logger.error("Failed to check API usage: %s", e)
             return None
     
     def translate_batch_optimized(self, texts: Dict[str, str], target_language: str, source_language: str = 'en') -> Dict[str, str]:
@@ -150,7 +213,7 @@ class DeepLTranslator(TranslatorBase):
         source_lang = self._convert_language_code(source_language) if source_language != 'en' else 'EN'
         
         if not target_lang:
-            print(f"Unsupported target language: {target_language}")
+            logger.error("Unsupported target language: %s", target_language)
             return {}
         
         # Prepare text list and key mapping
@@ -171,14 +234,13 @@ class DeepLTranslator(TranslatorBase):
         result = {}
         
         try:
-            print(f"Batch translating {len(non_empty_texts)} texts to {target_language}...")
+            logger.info("Batch translating %d texts to %s...", len(non_empty_texts), target_language)
             
             # Use DeepL batch translation
-            translations = self.translator.translate_text(
-                non_empty_texts,
-                target_lang=target_lang,
-                source_lang=source_lang
-            )
+            self.metrics.increment('requests')
+            self.metrics.increment('characters_sent', sum(len(text) for text in non_empty_texts))
+            with self.metrics.timer('request', items=len(non_empty_texts), target_language=target_lang):
+                translations = self._translate_text(non_empty_texts, target_lang, source_lang)
             
             # Process translation results
             for i, key in enumerate(keys):
@@ -188,28 +250,36 @@ class DeepLTranslator(TranslatorBase):
                     if translation_index < len(translations):
                         translation = translations[translation_index]
                         result[key] = translation.text
-                        print(f"✓ {key}: {texts[key][:50]}{'...' if len(texts[key]) > 50 else ''}")
+                        logger.debug("✓ %s: %s", key, texts[key][:50])
                     else:
                         result[key] = texts[key]  # Keep original text
-                        print(f"✗ {key}: Translation failed")
+                        logger.debug("✗ %s: Translation failed", key)
                 else:
                     result[key] = texts[key]  # Keep empty text as is
             
             translated_count = len([key for key in result.keys() if result[key] != texts[key]])
-            print(f"Successfully translated {translated_count}/{len(texts)} texts")
+            logger.info("Successfully translated %d/%d texts", translated_count, len(texts),
+                        extra={'event': 'batch_translated', 'target_language': target_language,
+                               'translated': translated_count, 'total': len(texts)})
             
         except deepl.exceptions.AuthorizationException:
-            print(f"DeepL API authorization failed. Please check your API key.")
+            logger.error("DeepL API authorization failed. Please check your API key.")
+            self.unavailable = 'authorization failed'
             return texts  # Return original texts
         except deepl.exceptions.QuotaExceededException:
-            print(f"DeepL API quota exceeded. Please check your usage.")
+            logger.error("DeepL API quota exceeded. Please check your usage.")
+            self.unavailable = 'quota exceeded'
             return texts  # Return original texts
         except deepl.exceptions.TooManyRequestsException:
-            print(f"Too many requests to DeepL API. Please try again later.")
+            logger.error("Too many requests to DeepL API. Please try again later.")
+            return texts  # Return original texts
+        except deepl.exceptions.ConnectionException as e:
+            # Transient: later requests try again, so DeepL is not marked unavailable
+            logger.error("Could not connect to DeepL API: %s", e)
             return texts  # Return original texts
         except Exception as e:
-            print(f"Batch translation error: {e}")
-            print("Falling back to individual translations...")
+            logger.warning("Batch translation error: %s", e)
+            logger.warning("Falling back to individual translations...")
             # If batch translation fails, fallback to individual translation
             return self._fallback_individual_translation(texts, target_language, source_language)
         
@@ -219,19 +289,29 @@ class DeepLTranslator(TranslatorBase):
         """Fallback method for individual translation"""
         result = {}
         total = len(texts)
+        progress = ProgressReporter(logger, f"Translating to {target_language}", total)
         
         for i, (key, text) in enumerate(texts.items(), 1):
-            print(f"Translating {i}/{total}: {key}")
+            # Nothing more can be translated, e.g. the quota ran out during this batch
+            if self.unavailable:
+                result[key] = text  # Keep original text
+                progress.update(failed=1)
+                continue
+            
+            logger.debug("Translating %d/%d: %s", i, total, key)
             
             translated = self.translate(text, target_language, source_language)
             if translated:
                 result[key] = translated
             else:
-                print(f"Failed to translate: {key} = {text}")
+                logger.debug("Failed to translate: %s = %s", key, text,
+                             extra={'event': 'translation_failed', 'key': key})
                 result[key] = text  # Keep original text
+            progress.update(failed=0 if translated else 1)
             
             # Add delay to avoid triggering API limits
             if i < total:
-                time.sleep(self.rate_limit_delay)
+                self.metrics.sleep(self.rate_limit_delay)
         
+        progress.close()
         return result
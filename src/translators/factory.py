@@ -5,18 +5,19 @@ Translator factory
 """
 
 from .base import TranslatorBase
-from .deepl_translator import DeepLTranslator
-from .mock_translator import MockTranslator
-from .llm_translator import LLMTranslator
 
 
 def create_translator(translator_type: str = 'deepl', **kwargs) -> TranslatorBase:
     """
     Create translator instance
     
+    Backend modules are imported here rather than at module level, so only
+    the selected translator's dependencies are loaded.
+    
     Args:
-        translator_type: Translator type ('deepl', 'mock', 'llm')
-        **kwargs: Translator initialization parameters
+        translator_type: Translator type ('deepl', 'mock', 'llm', 'openai', 'cascade')
+        **kwargs: Translator initialization parameters; 'cascade' takes engines, a list of
+            translator types (e.g. ['deepl', 'llm']) created with the same parameters
         
     Returns:
         TranslatorBase: Translator instance
@@ -27,17 +28,54 @@ def create_translator(translator_type: str = 'deepl', **kwargs) -> TranslatorBas
         auth_key = kwargs.get('auth_key')
         if not auth_key:
             raise ValueError("DeepL translator requires auth_key parameter")
-        return DeepLTranslator(auth_key)
+        from .deepl_translator import DeepLTranslator
+        return DeepLTranslator(auth_key, server_url=kwargs.get('server_url'),
+                               glossary_dir=kwargs.get('glossary_dir'),
+                               capability_cache=kwargs.get('capability_cache'))
     
     elif translator_type == 'mock':
-        return MockTranslator()
+        from .mock_translator import MockTranslator
+        mock_options = ('latency', 'latency_spread', 'latency_distribution', 'per_item_latency',
+                        'failure_rate', 'throttle_rate', 'max_batch_size', 'max_retries',
+                        'retry_delay', 'seed')
+        return MockTranslator(**{name: kwargs[name] for name in mock_options if name in kwargs})
     
     elif translator_type == 'llm':
         api_url = kwargs.get('api_url', 'http://127.0.0.1:11434/api/generate')
         model = kwargs.get('model', 'mistral:latest')
         timeout = kwargs.get('timeout', 60)
-        return LLMTranslator(api_url=api_url, model=model, timeout=timeout)
+        from .llm_translator import LLMTranslator
+        return LLMTranslator(api_url=api_url, model=model, timeout=timeout,
+                             capability_cache=kwargs.get('capability_cache'),
+                             max_concurrency=kwargs.get('max_concurrency', 1),
+                             chunk_size=kwargs.get('chunk_size', 0),
+                             keep_alive=kwargs.get('keep_alive'),
+                             warm_up=kwargs.get('warm_up', False),
+                             num_ctx=kwargs.get('num_ctx'),
+                             output_ratio=kwargs.get('output_ratio'),
+                             stream=kwargs.get('stream', False),
+                             hedge_budget=kwargs.get('hedge_budget', 0.0))
+    
+    elif translator_type == 'openai':
+        from .openai_translator import OpenAIChatTranslator
+        return OpenAIChatTranslator(api_url=kwargs.get('api_url', 'http://127.0.0.1:8000/v1/chat/completions'),
+                                    model=kwargs.get('model', 'mistral:latest'),
+                                    timeout=kwargs.get('timeout', 60),
+                                    api_key=kwargs.get('api_key'),
+                                    capability_cache=kwargs.get('capability_cache'),
+                                    max_concurrency=kwargs.get('max_concurrency', 1),
+                                    chunk_size=kwargs.get('chunk_size', 0),
+                                    stream=kwargs.get('stream', False),
+                                    hedge_budget=kwargs.get('hedge_budget', 0.0))
+    
+    elif translator_type == 'cascade':
+        from .cascade_translator import CascadeTranslator
+        engines = [engine.lower() for engine in kwargs.get('engines', []) if engine.lower() != 'none']
+        if not engines or 'cascade' in engines:
+            raise ValueError("Cascade translator requires engines, e.g. engines=['deepl', 'llm']")
+        options = {name: value for name, value in kwargs.items() if name != 'engines'}
+        return CascadeTranslator([create_translator(engine, **options) for engine in engines], names=engines)
     
     else:
-        supported_types = ['deepl', 'mock', 'llm']
+        supported_types = ['deepl', 'mock', 'llm', 'openai', 'cascade']
         raise ValueError(f"Unsupported translator type: {translator_type}. Supported types: {supported_types}")
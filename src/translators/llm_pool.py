@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+LLM endpoint pool
+Spread requests over several LLM servers with per-endpoint concurrency limits and outlier ejection
+"""
+
+import time
+import threading
+from typing import Callable, Dict, List, Optional, Set
+
+from ..logging_config import get_logger
+
+
+logger = get_logger(__name__)
+
+
+# Consecutive failures after which an endpoint stops receiving requests
+FAILURE_THRESHOLD = 3
+
+# Seconds an ejected endpoint is left alone before it is checked again
+EJECTION_SECONDS = 30.0
+
+
+class LLMEndpoint:
+    """One LLM server and its load and health state"""
+    
+    def __init__(self, url: str, max_concurrency: int = 1):
+        """
+        Args:
+            url: Generate endpoint URL
+            max_concurrency: Maximum number of requests in flight to this endpoint
+        """
+        self.url = url
+        self.max_concurrency = max(1, max_concurrency)
+        self.outstanding = 0
+        self.requests = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        # Monotonic time until which the endpoint is ejected, 0.0 while healthy
+        self.ejected_until = 0.0
+        self.probing = False
+    
+    @property
+    def ejected(self) -> bool:
+        return self.ejected_until > 0.0
+    
+    def to_dict(self) -> Dict:
+        return {
+            'url': self.url,
+            'max_concurrency': self.max_concurrency,
+            'requests': self.requests,
+            'failures': self.failures,
+            'ejected': self.ejected,
+        }
+
+
+class EndpointPool:
+    """Least-outstanding-requests balancer over LLM endpoints"""
+    
+    def __init__(self, urls: List[str], max_concurrency: int = 1, failure_threshold: int = FAILURE_THRESHOLD,
+                 ejection_seconds: float = EJECTION_SECONDS,
+                 health_check: Optional[Callable[[str], bool]] = None):
+        """
+        Args:
+            urls: Generate endpoint URLs
+            max_concurrency: Maximum number of requests in flight per endpoint
+            failure_threshold: Consecutive failures after which an endpoint is ejected, unless it is
+                the last one not ejected
+            ejection_seconds: Time an ejected endpoint receives no requests
+            health_check: Called with an endpoint URL before an ejected endpoint is readmitted;
+                without it, the endpoint is readmitted and ejected again by its next failure
+        """
+        if not urls:
+            raise ValueError("At least one LLM endpoint is required")
+        self.endpoints = [LLMEndpoint(url, max_concurrency) for url in urls]
+        self.failure_threshold = max(1, failure_threshold)
+        self.ejection_seconds = ejection_seconds
+        self.health_check = health_check
+        self._condition = threading.Condition()
+    
+    @property
+    def capacity(self) -> int:
+        """Number of requests the pool can have in flight"""
+        return sum(endpoint.max_concurrency for endpoint in self.endpoints)
+    
+    def acquire(self, exclude: Optional[Set[str]] = None, block: bool = True) -> Optional[LLMEndpoint]:
+        """
+        Reserve a request slot, waiting while all healthy endpoints are busy
+        
+        Args:
+            exclude: URLs not to use, e.g. endpoints that already failed this request
+            block: Wait for a free slot; without it, None is returned when all slots are busy
+        
+        Returns:
+            Optional[LLMEndpoint]: Endpoint with the fewest outstanding requests,
+            None if every endpoint is ejected or excluded
+        """
+        exclude = exclude or set()
+        probed = set()
+        while True:
+            with self._condition:
+                probe = self._readmit_expired(probed)
+                if probe is None:
+                    candidates = [endpoint for endpoint in self.endpoints
+                                  if not endpoint.ejected and endpoint.url not in exclude]
+                    if not candidates:
+                        if not block or not any(endpoint.probing for endpoint in self.endpoints):
+                            return None
+                        self._condition.wait()
+                        continue
+                    free = [endpoint for endpoint in candidates if endpoint.outstanding < endpoint.max_concurrency]
+                    if free:
+                        endpoint = min(free, key=lambda e: (e.outstanding / e.max_concurrency, e.requests))
+                        endpoint.outstanding += 1
+                        endpoint.requests += 1
+                        return endpoint
+                    if not block:
+                        return None
+                    self._condition.wait(self._next_expiry())
+                    continue
+            
+            # Health checks run outside the lock, other requests keep flowing meanwhile
+            probed.add(probe.url)
+            healthy = self._check_health(probe)
+            with self._condition:
+                probe.probing = False
+                if healthy:
+                    self._readmit(probe)
+                else:
+                    probe.ejected_until = time.monotonic() + self.ejection_seconds
+                self._condition.notify_all()
+    
+    def release(self, endpoint: LLMEndpoint, success: bool) -> None:
+        """
+        Return a request slot and record the outcome
+        
+        Args:
+            endpoint: Endpoint returned by acquire()
+            success: Whether the request succeeded
+        """
+        with self._condition:
+            endpoint.outstanding -= 1
+            if success:
+                endpoint.consecutive_failures = 0
+            else:
+                endpoint.failures += 1
+                endpoint.consecutive_failures += 1
+                # The last admitted endpoint is never ejected, requests keep being retried on it
+                if (endpoint.consecutive_failures >= self.failure_threshold and not endpoint.ejected
+                        and any(not other.ejected for other in self.endpoints if other is not endpoint)):
+                    endpoint.ejected_until = time.monotonic() + self.ejection_seconds
+                    logger.warning("Ejecting LLM endpoint %s after %d consecutive failures",
+                                   endpoint.url, endpoint.consecutive_failures,
+                                   extra={'event': 'endpoint_ejected', 'url': endpoint.url})
+            self._condition.notify_all()
+    
+    def to_dict(self) -> List[Dict]:
+        """Per-endpoint request statistics"""
+        with self._condition:
+            return [endpoint.to_dict() for endpoint in self.endpoints]
+    
+    def _readmit_expired(self, probed: Set[str]) -> Optional[LLMEndpoint]:
+        """Readmit endpoints whose ejection expired; return one that needs a health check first (caller holds the lock)"""
+        now = time.monotonic()
+        for endpoint in self.endpoints:
+            if endpoint.ejected and not endpoint.probing and endpoint.url not in probed and endpoint.ejected_until <= now:
+                if self.health_check is None:
+                    self._readmit(endpoint)
+                else:
+                    endpoint.probing = True
+                    return endpoint
+        return None
+    
+    def _readmit(self, endpoint: LLMEndpoint) -> None:
+        """Half-open: a single further failure ejects the endpoint again (caller holds the lock)"""
+        endpoint.ejected_until = 0.0
+        endpoint.consecutive_failures = self.failure_threshold - 1
+        logger.info("Readmitting LLM endpoint %s", endpoint.url,
+                    extra={'event': 'endpoint_readmitted', 'url': endpoint.url})
+    
+    def _next_expiry(self) -> Optional[float]:
+        """Seconds until the next ejection expires, None if no endpoint is ejected (caller holds the lock)"""
+        expiries = [endpoint.ejected_until for endpoint in self.endpoints if endpoint.ejected]
+        return max(0.0, min(expiries) - time.monotonic()) if expiries else None
+    
+    def _check_health(self, endpoint: LLMEndpoint) -> bool:
+        try:
+            return bool(self.health_check(endpoint.url))
+        except Exception as e:
+            logger.debug("Health check of %s failed: %s", endpoint.url, e)
+            return False
@@ -5,31 +5,116 @@ LLM translator implementation
 Support for local and remote LLM APIs
 """
 
+import re
 import json
+import math
+import time
+import queue
+import threading
 import requests
-from typing import Dict, List, Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Set, Tuple, Union
 from .base import TranslatorBase
+from .capabilities import CapabilityCache, get_capability_cache
+from .llm_pool import EndpointPool, LLMEndpoint
+from ..logging_config import ProgressReporter, get_logger
+
+
+logger = get_logger(__name__)
+
+
+# Rough characters per token for context sizing, conservative for non-Latin scripts
+CHARS_PER_TOKEN = 3
+
+# Bounds of automatically sized Ollama contexts (num_ctx)
+MIN_CONTEXT_TOKENS = 2048
+MAX_CONTEXT_TOKENS = 131072
+
+# Tokens allowed on top of output_ratio * input, for numbering and short texts
+OUTPUT_MARGIN_TOKENS = 64
+
+# Batch requests still waiting at this percentile of recent batch latencies are hedged
+HEDGE_PERCENTILE = 0.9
+
+# Batch latencies observed before hedging starts, and how many recent ones are kept
+HEDGE_MIN_SAMPLES = 5
+HEDGE_WINDOW = 100
+
+# HTTP statuses that do not go away by retrying, and what they mean for the run
+NON_TRANSIENT_STATUSES = {
+    401: 'authorization failed',
+    403: 'authorization failed',
+    404: 'endpoint or model not found',
+}
+
+# Numbered line of a batch response, e.g. "3. Bonjour"
+_NUMBERED_LINE_PATTERN = re.compile(r'^\s*(\d+)[.)]\s')
 
 
 class LLMTranslator(TranslatorBase):
     """LLM-based translator implementation"""
     
-    def __init__(self, api_url: str = "http://127.0.0.1:11434/api/generate", 
-                 model: str = "mistral:latest", timeout: int = 60):
+    def __init__(self, api_url: Union[str, List[str]] = "http://127.0.0.1:11434/api/generate", 
+                 model: str = "mistral:latest", timeout: int = 60,
+                 capability_cache: Optional[CapabilityCache] = None,
+                 max_concurrency: int = 1, chunk_size: int = 0,
+                 keep_alive: Optional[str] = None, warm_up: bool = False,
+                 num_ctx: Union[int, str, None] = None, output_ratio: Optional[float] = None,
+                 stream: bool = False, hedge_budget: float = 0.0):
+        """
+        Args:
+            api_url: Generate endpoint URL, or several URLs (list or comma-separated) serving the same model
+            model: Model name
+            timeout: Request timeout in seconds
+            capability_cache: Cache of available models, defaults to the shared on-disk cache
+            max_concurrency: Maximum number of requests in flight per endpoint
+            chunk_size: Texts per batch request; 0 splits a batch evenly over all request slots
+            keep_alive: Ollama only: how long the model stays loaded after a request, e.g. '30m' or '-1'
+            warm_up: Ollama only: load the model on every endpoint when the run starts
+            num_ctx: Ollama only: context size in tokens, or 'auto' to size it to the largest chunk
+            output_ratio: Ollama only: cap generated tokens (num_predict) at this multiple of the input tokens
+            stream: Stream responses, parse translations as they arrive and stop generation once
+                every text of a batch has been translated
+            hedge_budget: Send a duplicate of a batch request still running at the p90 latency to a free
+                endpoint slot and use whichever answers first; at most this fraction of batch requests
+                is duplicated, 0 disables hedging
+        """
         super().__init__()
-        self.api_url = api_url
+        urls = api_url.split(',') if isinstance(api_url, str) else list(api_url)
+        urls = [url.strip() for url in urls if url.strip()]
+        self.api_url = urls[0] if urls else ''
         self.model = model
         self.timeout = timeout
+        self.chunk_size = chunk_size
+        self.keep_alive = keep_alive
+        self.warm_up_enabled = warm_up
+        self.num_ctx = num_ctx if num_ctx in (None, 'auto') else int(num_ctx)
+        self.output_ratio = output_ratio
+        self.stream = stream
+        self.hedge_budget = hedge_budget
+        # Latencies of recent batch requests, and batch requests and hedges sent, for hedging
+        self._batch_latencies = deque(maxlen=HEDGE_WINDOW)
+        self._batch_calls = 0
+        self._hedges = 0
+        self._hedge_lock = threading.Lock()
+        # Endpoints that rejected requests for a non-transient reason: URL -> reason
+        self._rejections: Dict[str, str] = {}
+        self._rejection_lock = threading.Lock()
+        # Context size chosen for num_ctx='auto'; it only grows, since every change reloads the model
+        self._auto_context: Optional[int] = None
+        self._context_lock = threading.Lock()
         self.rate_limit_delay = 2.0  # LLM responses can be slower
+        self.capabilities = capability_cache or get_capability_cache()
+        self.pool = EndpointPool(urls, max_concurrency,
+                                 health_check=self._is_endpoint_healthy if self._models_url(self.api_url) else None)
         
-        # Auto-detect available models if using Ollama
-        if self._is_ollama_api():
-            available_models = self._get_available_models()
-            if available_models and model not in available_models:
-                print(f"Warning: Model '{model}' not found. Available models: {available_models}")
-                if available_models:
-                    self.model = available_models[0]
-                    print(f"Using first available model: {self.model}")
+        # Auto-detect available models if using Ollama, from the cache so construction never waits
+        # for the network; an unknown model list is refreshed in the background and checked again
+        # before the first request
+        self._model_checked = self._models_url(self.api_url) is None
+        if not self._model_checked:
+            self._check_model(self.capabilities.get(self._models_cache_key(), self._get_available_models))
         
         # Language name mapping for better LLM understanding
         self.language_names = {
@@ -81,11 +166,11 @@ class LLMTranslator(TranslatorBase):
                 translation = self._extract_translation(response)
                 return translation
             else:
-                print(f"LLM API call failed for text: {text[:50]}...")
+                logger.error("LLM API call failed for text: %s...", text[:50])
                 return None
-                
+        
         except Exception as e:
-            print(f"LLM translation error: {e}")
+            logger.error("LLM translation error: %s", e)
             return None
     
     def get_supported_languages(self) -> List[str]:
@@ -102,53 +187,384 @@ Text to translate: "{text}"
 Translation:"""
         return prompt
     
-    def _call_llm_api(self, prompt: str) -> Optional[str]:
-        """Call LLM API with the given prompt"""
+    def _call_llm_api(self, prompt: str, expected_lines: int = 0,
+                      on_line: Optional[Callable[[int, str], None]] = None) -> Optional[str]:
+        """
+        Call LLM API with the given prompt, trying other endpoints if one fails
+        
+        Args:
+            prompt: Prompt text
+            expected_lines: Number of numbered lines a batch prompt asks for; when streaming,
+                generation is stopped once all of them arrived
+            on_line: When streaming, called with the number and text of each numbered line as it arrives
+        
+        Returns:
+            Optional[str]: Generated text, None if all endpoints failed
+        """
+        if not self._model_checked:
+            self._check_model(self.capabilities.peek(self._models_cache_key()))
+        
+        if self.hedge_budget > 0 and expected_lines:
+            return self._call_hedged(prompt, expected_lines, on_line)
+        return self._call_with_failover(prompt, expected_lines, on_line)
+    
+    def _call_with_failover(self, prompt: str, expected_lines: int = 0,
+                            on_line: Optional[Callable[[int, str], None]] = None,
+                            cancelled: Optional[threading.Event] = None,
+                            tried: Optional[List[str]] = None) -> Optional[str]:
+        """
+        Send a prompt, trying other endpoints if one fails, until it succeeds or is cancelled
+        
+        Args:
+            tried: Receives the URL of every endpoint used, in order; hedges avoid them
+        """
+        tried = [] if tried is None else tried
+        while len(tried) < len(self.pool.endpoints) and not (cancelled and cancelled.is_set()):
+            endpoint = self.pool.acquire(exclude=set(tried))
+            if endpoint is None:
+                break
+            tried.append(endpoint.url)
+            success, result = self._send(endpoint, prompt, expected_lines, on_line, cancelled)
+            if success:
+                return result
+        
+        # A transient condition; later calls try again once endpoints are readmitted
+        if not tried:
+            logger.error("No healthy LLM endpoint available")
+        return None
+    
+    def _send(self, endpoint: LLMEndpoint, prompt: str, expected_lines: int,
+              on_line: Optional[Callable[[int, str], None]],
+              cancelled: Optional[threading.Event] = None) -> Tuple[bool, Optional[str]]:
+        """
+        Send a prompt to an acquired endpoint and release it
+        
+        Returns:
+            Tuple[bool, Optional[str]]: Whether the request succeeded, and the generated text
+        """
+        success = False
         try:
-            # Prepare request payload (adjust based on your LLM API format)
-            payload = {
-                "model": self.model,
-                "prompt": prompt,
-                "stream": False
-            }
-            
-            headers = {
-                "Content-Type": "application/json"
-            }
-            
-            # Make API request
+            result = self._post_prompt(endpoint.url, prompt, expected_lines, on_line, cancelled)
+            success = True
+            self._clear_rejection(endpoint.url)
+            return success, result
+        except requests.exceptions.HTTPError as e:
+            logger.error("LLM API request failed: %s", e)
+            status = e.response.status_code if e.response is not None else None
+            if status in NON_TRANSIENT_STATUSES:
+                self._reject(endpoint.url, NON_TRANSIENT_STATUSES[status])
+        except requests.exceptions.RequestException as e:
+            logger.error("LLM API request failed: %s", e)
+        except json.JSONDecodeError as e:
+            logger.error("Failed to parse LLM response: %s", e)
+        except Exception as e:
+            logger.error("LLM API call error: %s", e)
+        finally:
+            self.pool.release(endpoint, success)
+        return success, None
+    
+    def _reject(self, url: str, reason: str) -> None:
+        """Record a non-transient rejection; the engine is unavailable once every endpoint rejected requests"""
+        with self._rejection_lock:
+            self._rejections[url] = reason
+            if len(self._rejections) < len(self.pool.endpoints) or self.unavailable:
+                return
+            self.unavailable = reason
+        logger.error("LLM translator unavailable for the rest of the run: %s", reason,
+                     extra={'event': 'engine_unavailable', 'reason': reason})
+    
+    def _clear_rejection(self, url: str) -> None:
+        with self._rejection_lock:
+            self._rejections.pop(url, None)
+    
+    def _call_hedged(self, prompt: str, expected_lines: int,
+                     on_line: Optional[Callable[[int, str], None]]) -> Optional[str]:
+        """
+        Send a batch prompt and, if it is still running at the p90 of recent batch latencies,
+        a duplicate to a free endpoint slot; the first successful response wins
+        
+        The losing request is cancelled: streams are closed, which stops generation, and
+        failover retries stop. A non-streamed request runs to completion and is discarded.
+        """
+        start = time.perf_counter()
+        with self._hedge_lock:
+            self._batch_calls += 1
+        delay = self._hedge_delay()
+        if delay is None:
+            result = self._call_with_failover(prompt, expected_lines, on_line)
+            self._record_batch_latency(start, result)
+            return result
+        
+        # Lines of both requests are reported once
+        reported = set()
+        report_lock = threading.Lock()
+        
+        def report_once(number: int, line: str) -> None:
+            with report_lock:
+                if number in reported:
+                    return
+                reported.add(number)
+            if on_line:
+                on_line(number, line)
+        
+        responses = queue.Queue()
+        cancelled = threading.Event()
+        tried = []
+        threading.Thread(target=lambda: responses.put(
+            (False, self._call_with_failover(prompt, expected_lines, report_once, cancelled, tried))),
+            name='llm-request', daemon=True).start()
+        pending = 1
+        try:
+            hedged, result = responses.get(timeout=delay)
+            pending -= 1
+        except queue.Empty:
+            endpoint = self._acquire_hedge(set(tried))
+            if endpoint is not None:
+                logger.debug("Batch request still running after %.3fs, hedging on %s", delay, endpoint.url,
+                             extra={'event': 'request_hedged', 'url': endpoint.url})
+                threading.Thread(target=lambda: responses.put(
+                    (True, self._send(endpoint, prompt, expected_lines, report_once, cancelled)[1])),
+                    name='llm-hedge', daemon=True).start()
+                pending += 1
+            hedged, result = responses.get()
+            pending -= 1
+        
+        # If the first response failed, the other request may still succeed
+        while result is None and pending:
+            hedged, result = responses.get()
+            pending -= 1
+        cancelled.set()
+        
+        if result is not None and hedged:
+            self.metrics.increment('hedge_wins')
+        self._record_batch_latency(start, result)
+        return result
+    
+    def _hedge_delay(self) -> Optional[float]:
+        """p90 of recent batch latencies, None until enough batches were observed"""
+        with self._hedge_lock:
+            if len(self._batch_latencies) < HEDGE_MIN_SAMPLES:
+                return None
+            ordered = sorted(self._batch_latencies)
+        return ordered[min(len(ordered) - 1, math.ceil(HEDGE_PERCENTILE * len(ordered)) - 1)]
+    
+    def _record_batch_latency(self, start: float, result: Optional[str]) -> None:
+        if result is not None:
+            with self._hedge_lock:
+                self._batch_latencies.append(time.perf_counter() - start)
+    
+    def _acquire_hedge(self, primary_urls: Set[str]) -> Optional[LLMEndpoint]:
+        """
+        Free endpoint slot for a hedge, None if the budget is spent or every slot is busy
+        
+        Args:
+            primary_urls: Endpoints the primary request used; with several endpoints the hedge
+                goes elsewhere, since a duplicate on the slow endpoint would not help
+        """
+        with self._hedge_lock:
+            if self._hedges + 1 > self.hedge_budget * self._batch_calls:
+                return None
+            self._hedges += 1
+        exclude = primary_urls if len(self.pool.endpoints) > 1 else None
+        endpoint = self.pool.acquire(exclude=exclude, block=False)
+        if endpoint is None:
+            with self._hedge_lock:
+                self._hedges -= 1
+            return None
+        self.metrics.increment('hedged_requests')
+        return endpoint
+    
+    def _post_prompt(self, url: str, prompt: str, expected_lines: int = 0,
+                     on_line: Optional[Callable[[int, str], None]] = None,
+                     cancelled: Optional[threading.Event] = None) -> Optional[str]:
+        """
+        Send one generate request
+        
+        Args:
+            url: Endpoint URL
+            prompt: Prompt text
+            expected_lines: See _call_llm_api
+            on_line: See _call_llm_api
+            cancelled: When streaming, set to stop reading, e.g. because a hedged duplicate answered first
+        
+        Returns:
+            Optional[str]: Generated text, None if the response has an unknown format
+        
+        Raises:
+            requests.exceptions.RequestException: If the request fails
+        """
+        # Make API request
+        self.metrics.increment('requests')
+        self.metrics.increment('characters_sent', len(prompt))
+        with self.metrics.timer('request', model=self.model, endpoint=url):
             response = requests.post(
-                self.api_url,
-                json=payload,
-                headers=headers,
-                timeout=self.timeout
+                url,
+                json=self._build_payload(prompt),
+                headers=self._headers(),
+                timeout=self.timeout,
+                stream=self.stream
             )
-            
+            if self.stream:
+                response.raise_for_status()
+                return self._read_stream(response, expected_lines, on_line, cancelled)
+        
+        response.raise_for_status()
+        
+        # Parse response (adjust based on your LLM API response format)
+        return self._extract_response_text(response.json())
+    
+    def _build_payload(self, prompt: str) -> Dict:
+        """Request body for a prompt (adjust based on your LLM API format)"""
+        payload = {
+            "model": self.model,
+            "prompt": prompt,
+            "stream": self.stream
+        }
+        if self._is_ollama_api():
+            num_predict = self._output_budget(prompt)
+            options = {}
+            num_ctx = self._context_size(prompt, num_predict)
+            if num_ctx:
+                options["num_ctx"] = num_ctx
+            if num_predict:
+                options["num_predict"] = num_predict
+            if options:
+                payload["options"] = options
+            if self.keep_alive is not None:
+                payload["keep_alive"] = self.keep_alive
+        return payload
+    
+    def _read_stream(self, response: requests.Response, expected_lines: int,
+                     on_line: Optional[Callable[[int, str], None]],
+                     cancelled: Optional[threading.Event] = None) -> str:
+        """
+        Collect a streamed completion line by line
+        
+        Closing the connection early makes the server stop generating, which saves the
+        time models spend on explanations after the last translation.
+        
+        Returns:
+            str: Generated text up to the last complete line, or all of it if not stopped early
+        """
+        text = ''
+        buffer = ''
+        received = set()
+        start = time.perf_counter()
+        try:
+            for raw_line in response.iter_lines():
+                if cancelled and cancelled.is_set():
+                    break
+                if not raw_line:
+                    continue
+                fragment, done = self._parse_stream_line(raw_line.decode('utf-8'))
+                buffer += fragment
+                while '\n' in buffer:
+                    line, buffer = buffer.split('\n', 1)
+                    text += line + '\n'
+                    match = _NUMBERED_LINE_PATTERN.match(line)
+                    if not match:
+                        continue
+                    if not received:
+                        self.metrics.record('first_line', time.perf_counter() - start)
+                    received.add(int(match.group(1)))
+                    if on_line:
+                        on_line(int(match.group(1)), line)
+                    if expected_lines and received.issuperset(range(1, expected_lines + 1)):
+                        self.metrics.increment('streams_stopped_early')
+                        logger.debug("All %d translations received, stopping generation", expected_lines)
+                        return text
+                if done:
+                    break
+        finally:
+            response.close()
+        return text + buffer
+    
+    def _parse_stream_line(self, line: str) -> Tuple[str, bool]:
+        """
+        Parse one line of a streamed response (Ollama NDJSON)
+        
+        Returns:
+            Tuple[str, bool]: Generated text fragment and whether generation is complete
+        """
+        chunk = json.loads(line)
+        return chunk.get('response', ''), bool(chunk.get('done'))
+    
+    def warm_up(self, texts: Dict[str, str]) -> None:
+        """
+        Load the model on every Ollama endpoint in the background, so the first chunk does not pay for it
+        
+        With num_ctx='auto', the context is sized here to the largest chunk the texts can produce,
+        so later requests do not reload the model with a different context size.
+        
+        Args:
+            texts: All source texts of the run
+        """
+        if not self._is_ollama_api():
+            return
+        if self.num_ctx == 'auto' and texts:
+            size = self.chunk_size or math.ceil(len(texts) / self.pool.capacity)
+            longest = sorted(texts.values(), key=len, reverse=True)[:size]
+            longest_language = max(self.language_names.values(), key=len)
+            prompt = self._create_batch_prompt(dict(enumerate(longest)), 'English', longest_language)
+            self._context_size(prompt, self._output_budget(prompt))
+        if not self.warm_up_enabled:
+            return
+        
+        for endpoint in self.pool.endpoints:
+            threading.Thread(target=self._warm_up_endpoint, args=(endpoint.url,),
+                             name='llm-warm-up', daemon=True).start()
+    
+    def _warm_up_endpoint(self, url: str) -> None:
+        """An empty prompt makes Ollama load the model without generating anything"""
+        payload = {"model": self.model, "prompt": "", "stream": False}
+        if self.keep_alive is not None:
+            payload["keep_alive"] = self.keep_alive
+        num_ctx = self._context_size('', None)
+        if num_ctx:
+            payload["options"] = {"num_ctx": num_ctx}
+        try:
+            with self.metrics.timer('warm_up', model=self.model, endpoint=url):
+                response = requests.post(url, json=payload, headers=self._headers(), timeout=self.timeout)
             response.raise_for_status()
-            
-            # Parse response (adjust based on your LLM API response format)
-            result = response.json()
-            
-            # Extract text from response (this may vary based on API)
-            if 'response' in result:
-                return result['response']
-            elif 'text' in result:
-                return result['text']
-            elif 'choices' in result and len(result['choices']) > 0:
-                # OpenAI-style response
-                return result['choices'][0].get('text', '')
-            else:
-                print(f"Unexpected LLM response format: {result}")
-                return None
-                
+            logger.debug("Loaded model %s on %s", self.model, url, extra={'event': 'llm_warm_up', 'url': url})
         except requests.exceptions.RequestException as e:
-            print(f"LLM API request failed: {e}")
-            return None
-        except json.JSONDecodeError as e:
-            print(f"Failed to parse LLM response: {e}")
+            logger.warning("LLM warm-up of %s failed: %s", url, e)
+    
+    def _output_budget(self, prompt: str) -> Optional[int]:
+        """num_predict for a prompt, None when output is not capped"""
+        if not self.output_ratio:
             return None
-        except Exception as e:
-            print(f"LLM API call error: {e}")
+        return int(math.ceil(len(prompt) / CHARS_PER_TOKEN) * self.output_ratio) + OUTPUT_MARGIN_TOKENS
+    
+    def _context_size(self, prompt: str, num_predict: Optional[int]) -> Optional[int]:
+        """num_ctx for a prompt: the configured size, or for 'auto' a power of two covering prompt and output"""
+        if self.num_ctx != 'auto':
+            return self.num_ctx or None
+        
+        prompt_tokens = math.ceil(len(prompt) / CHARS_PER_TOKEN)
+        needed = prompt_tokens + (num_predict or prompt_tokens)
+        size = MIN_CONTEXT_TOKENS
+        while size < needed and size < MAX_CONTEXT_TOKENS:
+            size *= 2
+        with self._context_lock:
+            if self._auto_context is None or size > self._auto_context:
+                if self._auto_context is not None:
+                    logger.debug("Growing LLM context from %d to %d tokens", self._auto_context, size)
+                self._auto_context = size
+            return self._auto_context
+    
+    def _extract_response_text(self, result: Dict) -> Optional[str]:
+        """Generated text of a response body, None if the format is unknown"""
+        # Extract text from response (this may vary based on API)
+        if 'response' in result:
+            return result['response']
+        elif 'text' in result:
+            return result['text']
+        elif 'choices' in result and len(result['choices']) > 0:
+            # OpenAI-style response
+            return result['choices'][0].get('text', '')
+        else:
+            logger.error("Unexpected LLM response format: %s", result)
             return None
     
     def _extract_translation(self, response: str) -> str:
@@ -195,13 +611,41 @@ Translation:"""
             texts: Dictionary of key-value pairs, keys are identifiers, values are texts to translate
             target_language: Target language code
             source_language: Source language code
-            
+        
         Returns:
             Dict[str, str]: Dictionary of translated key-value pairs
         """
         if not texts:
             return {}
         
+        # Chunks are sent concurrently, spread over the endpoint pool
+        chunks = self._split_chunks(texts)
+        if len(chunks) == 1:
+            return self._translate_chunk(texts, target_language, source_language)
+        
+        result = {}
+        with ThreadPoolExecutor(max_workers=min(len(chunks), self.pool.capacity),
+                                thread_name_prefix='llm-chunk') as executor:
+            futures = [executor.submit(self._translate_chunk, chunk, target_language, source_language)
+                       for chunk in chunks]
+            for future in futures:
+                result.update(future.result())
+        return result
+    
+    def plan_requests(self, texts: Dict[str, str]) -> int:
+        """Number of chunk requests translate_batch_optimized would send"""
+        return len(self._split_chunks(texts)) if any(text.strip() for text in texts.values()) else 0
+    
+    def _split_chunks(self, texts: Dict[str, str]) -> List[Dict[str, str]]:
+        """Split a batch into chunks of chunk_size, or evenly over the pool capacity"""
+        if not texts:
+            return []
+        size = self.chunk_size or math.ceil(len(texts) / self.pool.capacity)
+        items = list(texts.items())
+        return [dict(items[start:start + size]) for start in range(0, len(items), size)]
+    
+    def _translate_chunk(self, texts: Dict[str, str], target_language: str, source_language: str) -> Dict[str, str]:
+        """Translate one chunk with a single batch prompt, falling back to individual translations"""
         # Get language names
         source_lang_name = self.language_names.get(source_language.lower(), source_language)
         target_lang_name = self.language_names.get(target_language.lower(), target_language)
@@ -210,26 +654,35 @@ Translation:"""
         prompt = self._create_batch_prompt(texts, source_lang_name, target_lang_name)
         
         try:
-            print(f"Batch translating {len(texts)} texts to {target_language} using LLM...")
+            logger.info("Batch translating %d texts to %s using LLM...", len(texts), target_language)
             
-            # Call LLM API
-            response = self._call_llm_api(prompt)
+            # Call LLM API; when streaming, lines are reported as they arrive
+            keys = list(texts.keys())
+            
+            def on_line(number: int, line: str) -> None:
+                if 0 < number <= len(keys):
+                    logger.debug("Received %s: %s", keys[number - 1], line,
+                                 extra={'event': 'translation_streamed', 'key': keys[number - 1]})
+            
+            response = self._call_llm_api(prompt, len(texts), on_line)
             
             if response:
                 # Parse batch response
                 result = self._parse_batch_response(response, texts)
                 
                 translated_count = len([key for key in result.keys() if result[key] != texts[key]])
-                print(f"Successfully translated {translated_count}/{len(texts)} texts")
+                logger.info("Successfully translated %d/%d texts", translated_count, len(texts),
+                            extra={'event': 'batch_translated', 'target_language': target_language,
+                                   'translated': translated_count, 'total': len(texts)})
                 
                 return result
             else:
-                print("LLM batch translation failed, falling back to individual translations...")
+                logger.warning("LLM batch translation failed, falling back to individual translations...")
                 return self._fallback_individual_translation(texts, target_language, source_language)
-                
+        
         except Exception as e:
-            print(f"LLM batch translation error: {e}")
-            print("Falling back to individual translations...")
+            logger.warning("LLM batch translation error: %s", e)
+            logger.warning("Falling back to individual translations...")
             return self._fallback_individual_translation(texts, target_language, source_language)
     
     def _create_batch_prompt(self, texts: Dict[str, str], source_lang: str, target_lang: str) -> str:
@@ -239,7 +692,7 @@ Return the translations in the same order, one per line, without any additional
 
 Texts to translate:
 """
-        
+
         for i, (key, text) in enumerate(texts.items(), 1):
             prompt += f"{i}. {text}\n"
         
@@ -276,10 +729,10 @@ Texts to translate:
         for i, key in enumerate(keys):
             if i < len(translations):
                 result[key] = translations[i]
-                print(f"✓ {key}: {original_texts[key][:30]}... -> {translations[i][:30]}...")
+                logger.debug("✓ %s: %s... -> %s...", key, original_texts[key][:30], translations[i][:30])
             else:
                 result[key] = original_texts[key]  # Keep original if no translation
-                print(f"✗ {key}: No translation found")
+                logger.debug("✗ %s: No translation found", key)
         
         return result
     
@@ -287,43 +740,85 @@ Texts to translate:
         """Check if this is an Ollama API endpoint"""
         return "11434" in self.api_url or "/api/generate" in self.api_url
     
-    def _get_available_models(self) -> List[str]:
-        """Get list of available models from Ollama"""
+    def _check_model(self, available_models: Optional[List[str]]) -> None:
+        """Switch to the first available model if the configured one is not installed"""
+        if available_models is None:
+            return
+        self._model_checked = True
+        if not available_models:
+            logger.error("No models installed on %s", self.api_url)
+            self.unavailable = 'no model installed'
+        elif self.model not in available_models:
+            logger.warning("Model '%s' not found. Available models: %s", self.model, available_models)
+            self.model = available_models[0]
+            logger.warning("Using first available model: %s", self.model)
+    
+    def _is_endpoint_healthy(self, url: str) -> bool:
+        """Health check of an ejected endpoint before it receives requests again"""
         try:
-            tags_url = self.api_url.replace('/api/generate', '/api/tags')
-            response = requests.get(tags_url, timeout=5)
+            response = requests.get(self._models_url(url), headers=self._headers(), timeout=5)
+            return response.status_code == 200
+        except requests.exceptions.RequestException:
+            return False
+    
+    def _headers(self) -> Dict[str, str]:
+        """HTTP headers of every request"""
+        return {"Content-Type": "application/json"}
+    
+    def _models_url(self, url: str) -> Optional[str]:
+        """Model list endpoint of a server, None if the API has none"""
+        if "11434" in url or "/api/generate" in url:
+            return url.replace('/api/generate', '/api/tags')
+        return None
+    
+    def _parse_models(self, data: Dict) -> List[str]:
+        """Model names from a model list response"""
+        return [model.get('name', '') for model in data.get('models', [])]
+    
+    def _models_cache_key(self) -> str:
+        return f"llm-models:{self._models_url(self.api_url)}"
+    
+    def _get_available_models(self) -> Optional[List[str]]:
+        """Get list of available models from the server, None if the request failed"""
+        try:
+            response = requests.get(self._models_url(self.api_url), headers=self._headers(), timeout=5)
             
             if response.status_code == 200:
-                data = response.json()
-                models = []
-                for model in data.get('models', []):
-                    models.append(model.get('name', ''))
-                return [m for m in models if m]
+                return [m for m in self._parse_models(response.json()) if m]
             else:
-                return []
-                
+                return None
+        
         except Exception as e:
-            print(f"Failed to get available models: {e}")
-            return []
+            logger.warning("Failed to get available models: %s", e)
+            return None
     
     def _fallback_individual_translation(self, texts: Dict[str, str], target_language: str, source_language: str) -> Dict[str, str]:
         """Fallback method for individual translation"""
         result = {}
         total = len(texts)
+        progress = ProgressReporter(logger, f"Translating to {target_language}", total)
         
         for i, (key, text) in enumerate(texts.items(), 1):
-            print(f"Translating {i}/{total}: {key}")
+            # Nothing more can be translated, e.g. the quota ran out during this batch
+            if self.unavailable:
+                result[key] = text  # Keep original text
+                progress.update(failed=1)
+                continue
+            
+            logger.debug("Translating %d/%d: %s", i, total, key)
             
             translated = self.translate(text, target_language, source_language)
             if translated:
                 result[key] = translated
             else:
-                print(f"Failed to translate: {key} = {text}")
+                logger.debug("Failed to translate: %s = %s", key, text,
+                             extra={'event': 'translation_failed', 'key': key})
                 result[key] = text  # Keep original text
+            progress.update(failed=0 if translated else 1)
             
             # Add delay to avoid overwhelming the LLM
             if i < total:
-                import time
-                time.sleep(self.rate_limit_delay)
+                self.metrics.sleep(self.rate_limit_delay)
         
+        progress.close()
         return result
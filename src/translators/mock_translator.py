@@ -2,26 +2,195 @@
 # -*- coding: utf-8 -*-
 """
 Mock translator implementation for testing
+Supports simulated latency, failures and rate limiting for offline load testing
 """
 
-from typing import List, Optional
+import math
+import time
+import random
+import threading
+from typing import Dict, List, Optional
 from .base import TranslatorBase
 
 
+# Supported latency distributions, parameterized by mean latency and spread
+LATENCY_DISTRIBUTIONS = ('constant', 'uniform', 'normal', 'lognormal', 'exponential')
+
+
 class MockTranslator(TranslatorBase):
     """Mock translator for testing purposes"""
     
-    def __init__(self):
+    def __init__(self, latency: float = 0.0, latency_spread: float = 0.0,
+                 latency_distribution: str = 'constant', per_item_latency: float = 0.0,
+                 failure_rate: float = 0.0, throttle_rate: float = 0.0,
+                 max_batch_size: Optional[int] = None, max_retries: int = 3,
+                 retry_delay: float = 0.1, seed: Optional[int] = None):
+        """
+        Initialize mock translator
+        
+        Args:
+            latency: Mean simulated latency per request in seconds
+            latency_spread: Spread of the distribution (uniform half-width, normal/lognormal sigma)
+            latency_distribution: One of 'constant', 'uniform', 'normal', 'lognormal', 'exponential'
+            per_item_latency: Additional latency per text in a batch request
+            failure_rate: Probability that a request fails outright
+            throttle_rate: Probability that a request is rejected as rate limited (HTTP 429)
+            max_batch_size: Maximum texts per batch request, None for unlimited
+            max_retries: Retries of a throttled request before giving up
+            retry_delay: Initial backoff after throttling, doubled on each retry
+            seed: Random seed for reproducible runs
+        """
         super().__init__()
         self.rate_limit_delay = 0.1  # Use shorter delay for testing
+        
+        if latency_distribution not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(f"Unsupported latency distribution: {latency_distribution}. "
+                             f"Supported distributions: {list(LATENCY_DISTRIBUTIONS)}")
+        if max_batch_size is not None and max_batch_size < 1:
+            raise ValueError(f"max_batch_size must be at least 1, got {max_batch_size}")
+        
+        self.latency = latency
+        self.latency_spread = latency_spread
+        self.latency_distribution = latency_distribution
+        self.per_item_latency = per_item_latency
+        self.failure_rate = failure_rate
+        self.throttle_rate = throttle_rate
+        self.max_batch_size = max_batch_size
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        
+        # Shared between threads when used for concurrency testing
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.stats = {'requests': 0, 'items': 0, 'failures': 0, 'throttled': 0, 'retries': 0}
     
     def translate(self, text: str, target_language: str, source_language: str = 'en') -> Optional[str]:
         """Mock translation, adds language prefix"""
         if not text.strip():
             return text
         
-        return f"[{target_language.upper()}] {text}"
+        if not self._simulate_request(1):
+            return None
+        
+        return self._mock_translation(text, target_language)
     
     def get_supported_languages(self) -> List[str]:
         """Return mock supported language list"""
         return ['zh', 'ja', 'ko', 'fr', 'de', 'es', 'it', 'pt', 'ru']
+    
+    def translate_batch_optimized(self, texts: Dict[str, str], target_language: str, source_language: str = 'en') -> Dict[str, str]:
+        """
+        Batch translation honoring max_batch_size, latency and failure injection
+        
+        Args:
+            texts: Dictionary of key-value pairs, keys are identifiers, values are texts to translate
+            target_language: Target language code
+            source_language: Source language code
+        
+        Returns:
+            Dict[str, str]: Dictionary of translated key-value pairs, failed chunks keep the original text
+        """
+        if not texts:
+            return {}
+        
+        keys = list(texts.keys())
+        batch_size = self.max_batch_size or len(keys)
+        result = {}
+        
+        for start in range(0, len(keys), batch_size):
+            chunk = keys[start:start + batch_size]
+            success = self._simulate_request(len(chunk))
+            
+            for key in chunk:
+                text = texts[key]
+                if success and text.strip():
+                    result[key] = self._mock_translation(text, target_language)
+                else:
+                    result[key] = text  # Keep original text
+        
+        return result
+    
+    def plan_requests(self, texts: Dict[str, str]) -> int:
+        """Number of chunk requests translate_batch_optimized would send"""
+        if not texts:
+            return 0
+        return math.ceil(len(texts) / (self.max_batch_size or len(texts)))
+    
+    def reset_stats(self) -> None:
+        """Reset request counters"""
+        with self._lock:
+            for name in self.stats:
+                self.stats[name] = 0
+    
+    def _mock_translation(self, text: str, target_language: str) -> str:
+        """Build the mock translation of a text"""
+        return f"[{target_language.upper()}] {text}"
+    
+    def _simulate_request(self, item_count: int) -> bool:
+        """
+        Simulate one API request, including throttling retries
+        
+        Args:
+            item_count: Number of texts in the request
+        
+        Returns:
+            bool: Whether the request eventually succeeded
+        """
+        delay = self.retry_delay
+        
+        for attempt in range(self.max_retries + 1):
+            with self._lock:
+                self.stats['requests'] += 1
+                if attempt:
+                    self.stats['retries'] += 1
+                latency = self._sample_latency() + self.per_item_latency * item_count
+                roll = self._random.random()
+            
+            self.metrics.increment('requests')
+            if attempt:
+                self.metrics.increment('retries')
+            with self.metrics.timer('request', items=item_count, attempt=attempt):
+                if latency > 0:
+                    time.sleep(latency)
+            
+            if roll < self.throttle_rate:
+                with self._lock:
+                    self.stats['throttled'] += 1
+                if attempt < self.max_retries:
+                    self.metrics.sleep(delay, 'retry_wait')
+                    delay *= 2
+                continue
+            
+            if roll < self.throttle_rate + self.failure_rate:
+                with self._lock:
+                    self.stats['failures'] += 1
+                return False
+            
+            with self._lock:
+                self.stats['items'] += item_count
+            return True
+        
+        # Still throttled after all retries
+        with self._lock:
+            self.stats['failures'] += 1
+        return False
+    
+    def _sample_latency(self) -> float:
+        """Sample a request latency from the configured distribution (caller holds the lock)"""
+        if self.latency <= 0:
+            return 0.0
+        
+        distribution = self.latency_distribution
+        if distribution == 'uniform':
+            value = self._random.uniform(self.latency - self.latency_spread, self.latency + self.latency_spread)
+        elif distribution == 'normal':
+            value = self._random.gauss(self.latency, self.latency_spread)
+        elif distribution == 'lognormal':
+            # Parameterized so the median equals the configured latency; spread is sigma
+            value = self._random.lognormvariate(math.log(self.latency), self.latency_spread)
+        elif distribution == 'exponential':
+            value = self._random.expovariate(1.0 / self.latency)
+        else:
+            value = self.latency
+        
+        return max(0.0, value)
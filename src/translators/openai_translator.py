@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+OpenAI-compatible chat translator implementation
+Support for /v1/chat/completions servers (vLLM, llama.cpp server, hosted gateways)
+"""
+
+import re
+import json
+from typing import Dict, List, Optional, Tuple, Union
+
+from .capabilities import CapabilityCache
+from .llm_translator import LLMTranslator
+from ..logging_config import get_logger
+
+
+logger = get_logger(__name__)
+
+
+CHAT_COMPLETIONS_PATH = '/chat/completions'
+
+# Identical for every request, so servers with prefix caching reuse it across chunks and languages;
+# everything that varies (languages, texts) goes into the user message
+CHAT_SYSTEM_PROMPT = """You are a professional translator localizing the user interface of an iOS app.
+The user message starts with "Translate from <source language> to <target language>." followed by numbered texts.
+Translate every text into the target language.
+Reply with the translations only, one per line, numbered like the input ("1. ...").
+Keep format specifiers (%@, %d, %1$@), placeholders and escape sequences (\\n) unchanged.
+Do not add explanations, notes or quotes."""
+
+_NUMBER_PREFIX_PATTERN = re.compile(r'^\s*1\.\s+')
+
+
+class OpenAIChatTranslator(LLMTranslator):
+    """Translator for OpenAI-compatible chat completions APIs with a fixed system prompt"""
+    
+    def __init__(self, api_url: Union[str, List[str]] = "http://127.0.0.1:8000/v1/chat/completions",
+                 model: str = "mistral:latest", timeout: int = 60, api_key: Optional[str] = None,
+                 capability_cache: Optional[CapabilityCache] = None,
+                 max_concurrency: int = 1, chunk_size: int = 0, stream: bool = False,
+                 hedge_budget: float = 0.0):
+        """
+        Args:
+            api_url: Chat completions endpoint URL, or several URLs (list or comma-separated)
+            model: Model name
+            timeout: Request timeout in seconds
+            api_key: Bearer token for hosted gateways
+            capability_cache: Cache of available models, defaults to the shared on-disk cache
+            max_concurrency: Maximum number of requests in flight per endpoint
+            chunk_size: Texts per batch request; 0 splits a batch evenly over all request slots
+            stream: Stream responses as server-sent events and stop generation once every text
+                of a batch has been translated
+            hedge_budget: Fraction of batch requests that may be duplicated when slower than the p90 latency
+        """
+        self.api_key = api_key
+        super().__init__(api_url=api_url, model=model, timeout=timeout, capability_cache=capability_cache,
+                         max_concurrency=max_concurrency, chunk_size=chunk_size, stream=stream,
+                         hedge_budget=hedge_budget)
+    
+    def _create_translation_prompt(self, text: str, source_lang: str, target_lang: str) -> str:
+        """Single texts use the batch format, so they share the system prompt"""
+        return self._create_batch_prompt({'text': text}, source_lang, target_lang)
+    
+    def _create_batch_prompt(self, texts: Dict[str, str], source_lang: str, target_lang: str) -> str:
+        """Create the user message; the instructions are in CHAT_SYSTEM_PROMPT"""
+        lines = [f"Translate from {source_lang} to {target_lang}.", '']
+        lines += [f"{i}. {text}" for i, text in enumerate(texts.values(), 1)]
+        return '\n'.join(lines)
+    
+    def _extract_translation(self, response: str) -> str:
+        return super()._extract_translation(_NUMBER_PREFIX_PATTERN.sub('', response.strip(), count=1))
+    
+    def _build_payload(self, prompt: str) -> Dict:
+        payload = {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": CHAT_SYSTEM_PROMPT},
+                {"role": "user", "content": prompt},
+            ],
+            "temperature": 0,
+            "stream": self.stream
+        }
+        if self.stream:
+            payload["stream_options"] = {"include_usage": True}
+        return payload
+    
+    def _parse_stream_line(self, line: str) -> Tuple[str, bool]:
+        """Parse one server-sent event of a streamed chat completion"""
+        if not line.startswith('data:'):
+            return '', False
+        data = line[len('data:'):].strip()
+        if data == '[DONE]':
+            return '', True
+        chunk = json.loads(data)
+        self._record_usage(chunk.get('usage'))
+        choices = chunk.get('choices') or []
+        delta = (choices[0].get('delta') or {}) if choices else {}
+        return delta.get('content') or '', False
+    
+    def _record_usage(self, usage: Optional[Dict]) -> None:
+        """Count prompt tokens, and the cached part reported by servers with prefix caching (OpenAI, vLLM)"""
+        if not usage or not usage.get('prompt_tokens'):
+            return
+        self.metrics.increment('prompt_tokens', usage['prompt_tokens'])
+        cached = (usage.get('prompt_tokens_details') or {}).get('cached_tokens')
+        if cached:
+            self.metrics.increment('cached_prompt_tokens', cached)
+    
+    def _extract_response_text(self, result: Dict) -> Optional[str]:
+        self._record_usage(result.get('usage'))
+        
+        choices = result.get('choices') or []
+        if choices and isinstance(choices[0].get('message'), dict):
+            return choices[0]['message'].get('content') or ''
+        logger.error("Unexpected chat completion format: %s", result)
+        return None
+    
+    def _headers(self) -> Dict[str, str]:
+        headers = super()._headers()
+        if self.api_key:
+            headers["Authorization"] = f"Bearer {self.api_key}"
+        return headers
+    
+    def _is_ollama_api(self) -> bool:
+        return False
+    
+    def _models_url(self, url: str) -> Optional[str]:
+        """The /models endpoint next to /chat/completions"""
+        if url.endswith(CHAT_COMPLETIONS_PATH):
+            return url[:-len(CHAT_COMPLETIONS_PATH)] + '/models'
+        return None
+    
+    def _parse_models(self, data: Dict) -> List[str]:
+        return [model.get('id', '') for model in data.get('data', [])]
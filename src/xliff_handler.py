@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+XLIFF 1.2 import/export module
+Exchange missing strings with translation vendors and Xcode localization exports
+"""
+
+import os
+import xml.etree.ElementTree as ET
+from typing import Dict, Iterator, Optional, Tuple
+from xml.sax.saxutils import escape, quoteattr
+
+from .logging_config import get_logger
+
+
+logger = get_logger(__name__)
+
+
+XLIFF_NAMESPACE = 'urn:oasis:names:tc:xliff:document:1.2'
+
+# Only Localizable.strings entries are part of the .strings pipeline
+STRINGS_FILE_NAME = 'Localizable.strings'
+
+
+def _local_name(tag: str) -> str:
+    """Strip the XML namespace from an element tag"""
+    return tag.rsplit('}', 1)[-1]
+
+
+class XliffHandler:
+    """Class for exporting and importing XLIFF 1.2 translation files"""
+    
+    def __init__(self, source_language: str = 'en'):
+        self.source_language = source_language
+    
+    def export_missing_strings(self, missing_strings: Dict[str, Dict[str, str]], output_path: str,
+                               notes: Optional[Dict[str, str]] = None) -> bool:
+        """
+        Export missing strings to an XLIFF 1.2 file, one <file> element per language
+        
+        Args:
+            missing_strings: Mapping of iOS language code -> {key: source text}
+            output_path: Output XLIFF file path
+            notes: Optional mapping of key -> translator note
+        
+        Returns:
+            bool: Whether export was successful
+        """
+        notes = notes or {}
+        
+        try:
+            output_dir = os.path.dirname(output_path)
+            if output_dir:
+                os.makedirs(output_dir, exist_ok=True)
+            
+            # Write fragments directly instead of building a tree in memory
+            with open(output_path, 'w', encoding='utf-8') as file:
+                file.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+                file.write(f'<xliff xmlns="{XLIFF_NAMESPACE}" version="1.2">\n')
+                
+                for language, strings in missing_strings.items():
+                    if not strings:
+                        continue
+                    
+                    original = f'{language}.lproj/{STRINGS_FILE_NAME}'
+                    file.write(f'  <file original={quoteattr(original)} '
+                               f'source-language={quoteattr(self.source_language)} '
+                               f'target-language={quoteattr(language)} datatype="plaintext">\n')
+                    file.write('    <body>\n')
+                    
+                    for key, text in strings.items():
+                        file.write(f'      <trans-unit id={quoteattr(key)} xml:space="preserve">\n')
+                        file.write(f'        <source>{escape(text)}</source>\n')
+                        if key in notes:
+                            file.write(f'        <note>{escape(notes[key])}</note>\n')
+                        file.write('      </trans-unit>\n')
+                    
+                    file.write('    </body>\n')
+                    file.write('  </file>\n')
+                
+                file.write('</xliff>\n')
+            
+            return True
+        except Exception as e:
+            logger.error("Error writing XLIFF file %s: %s", output_path, e)
+            return False
+    
+    def iter_translations(self, xliff_path: str) -> Iterator[Tuple[str, str, str]]:
+        """
+        Stream completed translations from an XLIFF 1.2 file
+        
+        Uses iterparse and clears processed elements, so memory use stays flat
+        regardless of the bundle size.
+        
+        Args:
+            xliff_path: Path to the XLIFF file
+        
+        Yields:
+            Tuple[str, str, str]: (iOS language code, key, translated text)
+        """
+        language = None
+        in_strings_file = False
+        unit_id = None
+        target_text = None
+        # Open elements, used to detach finished trans-units from their parent
+        stack = []
+        
+        for event, elem in ET.iterparse(xliff_path, events=('start', 'end')):
+            tag = _local_name(elem.tag)
+            
+            if event == 'start':
+                stack.append(elem)
+                if tag == 'file':
+                    language = elem.get('target-language')
+                    in_strings_file = elem.get('original', '').endswith(STRINGS_FILE_NAME)
+                elif tag == 'trans-unit':
+                    unit_id = elem.get('id')
+                    target_text = None
+                continue
+            
+            stack.pop()
+            
+            if tag == 'target':
+                # Text is only complete on the end event
+                target_text = ''.join(elem.itertext())
+            elif tag == 'trans-unit':
+                if in_strings_file and language and unit_id is not None and target_text:
+                    yield language, unit_id, target_text
+                unit_id = None
+                target_text = None
+                # Drop the processed unit so the tree never grows
+                elem.clear()
+                if stack:
+                    stack[-1].remove(elem)
+    
+    def import_translations(self, xliff_path: str) -> Dict[str, Dict[str, str]]:
+        """
+        Read completed translations from an XLIFF 1.2 file
+        
+        Args:
+            xliff_path: Path to the XLIFF file
+        
+        Returns:
+            Dict[str, Dict[str, str]]: Mapping of iOS language code -> {key: translated text}
+        """
+        result = {}
+        
+        try:
+            for language, key, text in self.iter_translations(xliff_path):
+                result.setdefault(language, {})[key] = text
+        except (ET.ParseError, OSError) as e:
+            logger.error("Error reading XLIFF file %s: %s", xliff_path, e)
+        
+        return result
@@ -7,13 +7,23 @@ Functionality verification test script
 
 import os
 import sys
+import time
 import tempfile
 import shutil
+import atexit
+import subprocess
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# Translators built without a capability cache, including those of CLI subprocesses, must not
+# write the stub servers' random ports into the developer's ~/.cache/ios_translator
+_TEST_CACHE_DIR = tempfile.mkdtemp(prefix='ios_translator_test_cache_')
+os.environ['IOS_TRANSLATOR_CACHE_DIR'] = _TEST_CACHE_DIR
+atexit.register(shutil.rmtree, _TEST_CACHE_DIR, ignore_errors=True)
+
 from src.strings_parser import StringsParser
 from src.translator import create_translator
 from src.code_generator import LocalizationCodeGenerator
+from src.xliff_handler import XliffHandler
 
 
 def test_strings_parser():
@@ -41,6 +51,60 @@ def test_strings_parser():
     print("✅ StringsParser test passed")
 
 
+def test_binary_plist_strings():
+    """Test binary property list .strings read/write"""
+    print("Testing binary plist strings...")
+    
+    parser = StringsParser()
+    strings_dict = {"greeting": "Hello \"World\"", "multiline": "Line 1\nLine 2"}
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file_path = os.path.join(temp_dir, "Localizable.strings")
+        assert parser.write_strings_file(strings_dict, file_path, binary=True)
+        
+        with open(file_path, "rb") as f:
+            assert f.read(8) == b"bplist00"
+        
+        # Format is sniffed automatically
+        assert parser.parse_strings_file(file_path) == strings_dict
+        
+        # Updating keeps the binary format
+        assert parser.update_strings_file(file_path, {"new_key": "New"})
+        with open(file_path, "rb") as f:
+            assert f.read(8) == b"bplist00"
+        assert parser.parse_strings_file(file_path)["new_key"] == "New"
+    
+    print("✅ Binary plist strings test passed")
+
+
+def test_xliff_round_trip():
+    """Test XLIFF export and streaming import"""
+    print("Testing XliffHandler...")
+    
+    handler = XliffHandler()
+    missing = {"fr": {"greeting": "Hello & <welcome>", "farewell": "Bye"}}
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        xliff_path = os.path.join(temp_dir, "export.xliff")
+        assert handler.export_missing_strings(missing, xliff_path)
+        
+        # Simulate a vendor filling in one of the targets
+        with open(xliff_path, encoding="utf-8") as f:
+            content = f.read()
+        content = content.replace(
+            "<source>Hello &amp; &lt;welcome&gt;</source>",
+            "<source>Hello &amp; &lt;welcome&gt;</source><target>Bonjour &amp; &lt;bienvenue&gt;</target>"
+        )
+        with open(xliff_path, "w", encoding="utf-8") as f:
+            f.write(content)
+        
+        # Units without a target are not imported
+        translations = handler.import_translations(xliff_path)
+        assert translations == {"fr": {"greeting": "Bonjour & <bienvenue>"}}
+    
+    print("✅ XliffHandler test passed")
+
+
 def test_mock_translator():
     """Test mock translator"""
     print("Testing MockTranslator...")
@@ -60,6 +124,411 @@ def test_mock_translator():
     print("✅ MockTranslator test passed")
 
 
+def test_mock_translator_simulation():
+    """Test mock translator latency, batching and failure injection"""
+    print("Testing MockTranslator simulation...")
+    
+    texts = {f"key{i}": f"Text {i}" for i in range(10)}
+    
+    # Batches are split by max_batch_size, each paying the simulated latency
+    translator = create_translator('mock', latency=0.01, max_batch_size=4, seed=1)
+    start = time.perf_counter()
+    results = translator.translate_batch(texts, "fr")
+    assert time.perf_counter() - start >= 0.03
+    assert results["key9"] == "[FR] Text 9"
+    assert translator.stats["requests"] == 3
+    
+    # Failed requests keep the original text
+    translator = create_translator('mock', failure_rate=1.0)
+    assert translator.translate_batch(texts, "fr") == texts
+    assert translator.translate("Hello", "fr") is None
+    
+    # Throttled requests are retried before giving up
+    translator = create_translator('mock', throttle_rate=1.0, max_retries=2, retry_delay=0)
+    assert translator.translate_batch(texts, "fr") == texts
+    assert translator.stats["throttled"] == 3
+    assert translator.stats["retries"] == 2
+    
+    print("✅ MockTranslator simulation test passed")
+
+
+def test_stub_server():
+    """Test DeepL and LLM translators end-to-end against the local stub server"""
+    print("Testing stub server...")
+    
+    from src.stub_server import StubServer, StubServerConfig
+    
+    texts = {"key1": "Hello", "key2": "World"}
+    
+    with StubServer(config=StubServerConfig(character_limit=1000)) as server:
+        translator = create_translator('deepl', auth_key='stub-key', server_url=server.url)
+        assert translator.translate_batch(texts, "fr") == {"key1": "[FR] Hello", "key2": "[FR] World"}
+        assert translator.check_api_usage()["character_count"] == 10
+        
+        translator = create_translator('llm', api_url=server.ollama_url)
+        results = translator.translate_batch(texts, "ja")
+        assert results == {"key1": "[Japanese] Hello", "key2": "[Japanese] World"}
+    
+    # Injected errors surface as failed translations
+    with StubServer(config=StubServerConfig(error_rate=1.0)) as server:
+        translator = create_translator('llm', api_url=server.ollama_url)
+        translator.rate_limit_delay = 0
+        assert translator.translate("Hello", "fr") is None
+    
+    print("✅ Stub server test passed")
+
+
+def test_deepl_glossaries():
+    """Test DeepL glossaries created from TSV files and reused across runs"""
+    print("Testing DeepL glossaries...")
+    
+    from src.stub_server import StubServer
+    
+    with tempfile.TemporaryDirectory() as glossary_dir, StubServer() as server:
+        with open(os.path.join(glossary_dir, "en-de.tsv"), "w", encoding="utf-8") as f:
+            f.write("# Product terms\nSettings\tEinstellungen\n")
+        
+        translator = create_translator('deepl', auth_key='stub-key', server_url=server.url, glossary_dir=glossary_dir)
+        assert translator.translate_batch({"title": "Open Settings"}, "de") == {"title": "[DE] Open Einstellungen"}
+        # Pairs without a glossary file translate without one
+        assert translator.translate("Settings", "fr") == "[FR] Settings"
+        
+        # A new run reuses the cached glossary instead of creating it again
+        translator = create_translator('deepl', auth_key='stub-key', server_url=server.url, glossary_dir=glossary_dir)
+        assert translator.translate("Settings", "de") == "[DE] Einstellungen"
+        assert server.stats["glossaries_created"] == 1
+        
+        # Changed content creates a new glossary and deletes the old one
+        with open(os.path.join(glossary_dir, "en-de.tsv"), "a", encoding="utf-8") as f:
+            f.write("Account\tKonto\n")
+        translator = create_translator('deepl', auth_key='stub-key', server_url=server.url, glossary_dir=glossary_dir)
+        assert translator.translate("Account", "de") == "[DE] Konto"
+        assert server.stats["glossaries_created"] == 2
+        assert len(server.glossaries) == 1
+        
+        # Glossaries deleted on the server are created again
+        server.glossaries.clear()
+        translator = create_translator('deepl', auth_key='stub-key', server_url=server.url, glossary_dir=glossary_dir)
+        assert translator.translate("Account", "de") == "[DE] Konto"
+        assert server.stats["glossaries_created"] == 3
+    
+    print("✅ DeepL glossaries test passed")
+
+
+def test_capability_cache():
+    """Test model and language lists are cached on disk and never fetched during construction"""
+    print("Testing capability cache...")
+    
+    from src.stub_server import StubServer, StubServerConfig
+    from src.translators.capabilities import CapabilityCache
+    
+    with tempfile.TemporaryDirectory() as cache_dir, \
+            StubServer(config=StubServerConfig(models=['llama3:latest'])) as server:
+        cache = CapabilityCache(cache_dir)
+        
+        # Nothing cached: construction does not wait, the model is checked before the first request
+        translator = create_translator('llm', api_url=server.ollama_url, capability_cache=cache)
+        assert translator.model == 'mistral:latest'
+        cache.wait()
+        translator.translate("Hello", "fr")
+        assert translator.model == 'llama3:latest'
+        
+        # A new run reads the model list from disk without asking the server
+        requests_before = server.stats["requests"]
+        translator = create_translator('llm', api_url=server.ollama_url, capability_cache=CapabilityCache(cache_dir))
+        assert translator.model == 'llama3:latest'
+        assert server.stats["requests"] == requests_before
+        
+        # DeepL languages are fetched once, then served from the cache
+        translator = create_translator('deepl', auth_key='stub-key', server_url=server.url, capability_cache=cache)
+        languages = translator.get_supported_languages()
+        requests_before = server.stats["requests"]
+        assert translator.get_supported_languages() == languages and "DE" in languages
+        assert server.stats["requests"] == requests_before
+        
+        # Stale entries are returned at once and refreshed in the background
+        stale_cache = CapabilityCache(cache_dir, ttl=0)
+        assert stale_cache.get(f'deepl-target-languages:{server.url}', lambda: ['XX']) == languages
+        stale_cache.wait()
+        assert CapabilityCache(cache_dir).peek(f'deepl-target-languages:{server.url}') == ['XX']
+    
+    print("✅ Capability cache test passed")
+
+
+def test_llm_endpoint_pool():
+    """Test LLM requests are spread over several endpoints and failing endpoints are ejected"""
+    print("Testing LLM endpoint pool...")
+    
+    from src.stub_server import StubServer, StubServerConfig
+    from src.translators.capabilities import CapabilityCache
+    from src.translators.llm_pool import EndpointPool
+    
+    texts = {f"key{i}": f"Text {i}" for i in range(8)}
+    expected = {key: f"[French] {text}" for key, text in texts.items()}
+    
+    with tempfile.TemporaryDirectory() as cache_dir, StubServer() as first, StubServer() as second:
+        cache = CapabilityCache(cache_dir)
+        translator = create_translator('llm', api_url=f"{first.ollama_url},{second.ollama_url}",
+                                       max_concurrency=2, capability_cache=cache)
+        cache.wait()
+        assert translator.plan_requests(texts) == 4
+        assert translator.translate_batch(texts, "fr") == expected
+        assert [endpoint['requests'] for endpoint in translator.pool.to_dict()] == [2, 2]
+    
+    # A failing endpoint is skipped for the rest of the run, its requests are retried elsewhere
+    with tempfile.TemporaryDirectory() as cache_dir, StubServer() as healthy, \
+            StubServer(config=StubServerConfig(error_rate=1.0)) as failing:
+        translator = create_translator('llm', api_url=[failing.ollama_url, healthy.ollama_url],
+                                       chunk_size=1, capability_cache=CapabilityCache(cache_dir))
+        assert translator.translate_batch(texts, "fr") == expected
+        failing_endpoint, healthy_endpoint = translator.pool.to_dict()
+        assert failing_endpoint['ejected'] and failing_endpoint['requests'] == 3
+        assert healthy_endpoint['requests'] == 8
+    
+    # A single endpoint is never ejected, translation resumes once the server recovers
+    with tempfile.TemporaryDirectory() as cache_dir, StubServer(config=StubServerConfig(error_rate=1.0)) as server:
+        translator = create_translator('llm', api_url=server.ollama_url, capability_cache=CapabilityCache(cache_dir))
+        translator.rate_limit_delay = 0
+        for _ in range(4):
+            assert translator.translate("Hello", "fr") is None
+        assert not translator.pool.to_dict()[0]['ejected']
+        server.config.error_rate = 0.0
+        assert translator.translate("Hello", "fr") == "[French] Hello"
+    
+    # Ejected endpoints come back once their health check passes
+    pool = EndpointPool(['a', 'b'], failure_threshold=1, ejection_seconds=0.0, health_check=lambda url: True)
+    endpoint = pool.acquire()
+    pool.release(endpoint, success=False)
+    assert pool.acquire(exclude={'b'}).url == 'a'
+    
+    print("✅ LLM endpoint pool test passed")
+
+
+def test_openai_chat_translator():
+    """Test the chat completions backend keeps the system prompt identical across requests"""
+    print("Testing OpenAI-compatible chat translator...")
+    
+    from src.stub_server import StubServer
+    from src.translators.capabilities import CapabilityCache
+    
+    with tempfile.TemporaryDirectory() as cache_dir, StubServer() as server:
+        cache = CapabilityCache(cache_dir)
+        translator = create_translator('openai', api_url=server.openai_url, api_key='gateway-key',
+                                       capability_cache=cache)
+        cache.wait()
+        assert cache.peek(f"llm-models:{server.url}/v1/models") == ['mistral:latest']
+        
+        texts = {"key1": "Hello", "key2": "World"}
+        assert translator.translate_batch(texts, "ja") == {"key1": "[Japanese] Hello", "key2": "[Japanese] World"}
+        assert translator.translate_batch(texts, "fr") == {"key1": "[French] Hello", "key2": "[French] World"}
+        assert translator.translate("Settings", "de") == "[German] Settings"
+        
+        # Only the user message varies, so the server could reuse the cached prefix after the first request
+        assert len(server.system_prompts) == 1
+        assert translator.metrics.counters["cached_prompt_tokens"] > 0
+    
+    print("✅ OpenAI-compatible chat translator test passed")
+
+
+def test_ollama_residency_options():
+    """Test keep_alive, warm-up, context sizing and output caps sent to Ollama"""
+    print("Testing Ollama residency options...")
+    
+    from src.stub_server import StubServer
+    from src.translators.capabilities import CapabilityCache
+    
+    texts = {f"key{i}": f"Text number {i}" for i in range(4)}
+    
+    with tempfile.TemporaryDirectory() as cache_dir, StubServer() as server:
+        translator = create_translator('llm', api_url=server.ollama_url, capability_cache=CapabilityCache(cache_dir),
+                                       keep_alive='30m', warm_up=True, num_ctx='auto', output_ratio=1.5)
+        translator.warm_up(texts)
+        deadline = time.time() + 5
+        while not server.generate_payloads and time.time() < deadline:
+            time.sleep(0.01)
+        
+        warm_up = server.generate_payloads[0]
+        assert warm_up["prompt"] == "" and warm_up["keep_alive"] == "30m"
+        
+        assert translator.translate_batch(texts, "fr") == {key: f"[French] {text}" for key, text in texts.items()}
+        request = server.generate_payloads[-1]
+        assert request["keep_alive"] == "30m"
+        # The context sized during warm-up is kept, so the model is not reloaded
+        assert request["options"]["num_ctx"] == warm_up["options"]["num_ctx"] == 2048
+        assert 64 < request["options"]["num_predict"] < len(request["prompt"])
+    
+    # Without options, requests look as before
+    with tempfile.TemporaryDirectory() as cache_dir, StubServer() as server:
+        translator = create_translator('llm', api_url=server.ollama_url, capability_cache=CapabilityCache(cache_dir))
+        translator.warm_up(texts)
+        translator.translate("Hello", "fr")
+        assert server.generate_payloads == [{"model": "mistral:latest", "prompt": server.generate_payloads[0]["prompt"],
+                                             "stream": False}]
+    
+    print("✅ Ollama residency options test passed")
+
+
+def test_llm_streaming():
+    """Test streamed LLM responses are parsed incrementally and generation stops after the last translation"""
+    print("Testing LLM streaming...")
+    
+    from src.stub_server import StubServer, StubServerConfig
+    from src.translators.capabilities import CapabilityCache
+    
+    texts = {"key1": "Hello", "key2": "World", "key3": "Settings"}
+    
+    with tempfile.TemporaryDirectory() as cache_dir, StubServer(config=StubServerConfig(per_item_latency=0.05)) as server:
+        cache = CapabilityCache(cache_dir)
+        for translator_type, url in (('llm', server.ollama_url), ('openai', server.openai_url)):
+            translator = create_translator(translator_type, api_url=url, stream=True, capability_cache=cache)
+            results = translator.translate_batch(texts, "fr")
+            # The stub keeps talking after the translations; none of it ends up in the results
+            assert results == {key: f"[French] {text}" for key, text in texts.items()}
+            assert translator.metrics.counters["streams_stopped_early"] == 1
+            assert len(translator.metrics.timings["first_line"]) == 1
+            assert translator.translate("Hello", "fr") == "[French] Hello"
+    
+    print("✅ LLM streaming test passed")
+
+
+def test_llm_request_hedging():
+    """Test a batch request slower than the p90 latency is duplicated to another endpoint"""
+    print("Testing LLM request hedging...")
+    
+    from src.stub_server import StubServer
+    from src.translators.capabilities import CapabilityCache
+    
+    texts = {"key1": "Hello", "key2": "World"}
+    
+    with tempfile.TemporaryDirectory() as cache_dir, StubServer() as first, StubServer() as second:
+        translator = create_translator('llm', api_url=[first.ollama_url, second.ollama_url], hedge_budget=0.5,
+                                       max_concurrency=2, chunk_size=2, capability_cache=CapabilityCache(cache_dir))
+        # Observe the latency distribution before hedging
+        for _ in range(6):
+            translator.translate_batch(texts, "fr")
+        assert "hedged_requests" not in translator.metrics.counters
+        
+        # A busy slot on the first endpoint sends the next request to the second one, which stalls;
+        # the hedge goes to the first endpoint although the stalled one has a free slot and fewer requests
+        fast_endpoint, slow_endpoint = translator.pool.endpoints
+        translator.pool.release(translator.pool.acquire(exclude={second.ollama_url}), success=True)
+        held = translator.pool.acquire(exclude={second.ollama_url})
+        assert fast_endpoint.requests > slow_endpoint.requests + 1
+        second.config.latency = 1.0
+        requests_before = (fast_endpoint.requests, slow_endpoint.requests)
+        start = time.time()
+        assert translator.translate_batch(texts, "de") == {"key1": "[German] Hello", "key2": "[German] World"}
+        assert time.time() - start < 0.8
+        assert (fast_endpoint.requests, slow_endpoint.requests) == (requests_before[0] + 1, requests_before[1] + 1)
+        assert translator.metrics.counters["hedged_requests"] == 1
+        assert translator.metrics.counters["hedge_wins"] == 1
+        
+        # Without a free slot on another endpoint there is no hedge
+        other = translator.pool.acquire(exclude={second.ollama_url})
+        assert translator.translate_batch(texts, "ja") == {"key1": "[Japanese] Hello", "key2": "[Japanese] World"}
+        assert translator.metrics.counters["hedged_requests"] == 1
+        translator.pool.release(held, success=True)
+        translator.pool.release(other, success=True)
+    
+    print("✅ LLM request hedging test passed")
+
+
+def test_cascade_translator():
+    """Test the cascade hands work to the next engine once DeepL runs out of quota"""
+    print("Testing cascade translator...")
+    
+    from src.stub_server import StubServer, StubServerConfig
+    from src.translators.capabilities import CapabilityCache
+    
+    texts = {"key1": "Hello", "key2": "World"}
+    
+    with tempfile.TemporaryDirectory() as cache_dir, StubServer(config=StubServerConfig(character_limit=12)) as server:
+        translator = create_translator('cascade', engines=['deepl', 'llm'], auth_key='stub-key', server_url=server.url,
+                                       api_url=server.ollama_url, capability_cache=CapabilityCache(cache_dir))
+        assert translator.translate_batch(texts, "fr") == {"key1": "[FR] Hello", "key2": "[FR] World"}
+        # The quota only covers the first locale; the LLM takes over for the rest of the run
+        assert translator.translate_batch(texts, "de") == {"key1": "[German] Hello", "key2": "[German] World"}
+        assert translator.translate("Settings", "ja") == "[Japanese] Settings"
+        
+        assert translator.produced_by == {"fr": {"key1": "deepl", "key2": "deepl"},
+                                          "de": {"key1": "llm", "key2": "llm"}}
+        assert translator.metrics.counters["translated_by_deepl"] == 2
+        assert translator.metrics.counters["translated_by_llm"] == 2
+        # The attribution ends up in the metrics report
+        report = translator.metrics.to_dict()
+        assert report["languages"]["de"]["produced_by"] == {"key1": "llm", "key2": "llm"}
+        assert report["languages"]["de"]["translated_by_llm"] == 2
+        assert translator.unavailable is None
+    
+    # Connection errors are retried and never take DeepL out of the cascade
+    import deepl
+    with StubServer() as server:
+        translator = create_translator('deepl', auth_key='stub-key', server_url=server.url)
+        translator.connection_retry_delay = 0
+        translate_text = translator.translator.translate_text
+        failures = [2]
+        
+        def flaky_translate_text(*args, **kwargs):
+            if failures[0]:
+                failures[0] -= 1
+                raise deepl.exceptions.ConnectionException("Connection reset")
+            return translate_text(*args, **kwargs)
+        
+        translator.translator.translate_text = flaky_translate_text
+        assert translator.translate("Hello", "fr") == "[FR] Hello"
+        assert translator.metrics.counters["retries"] == 2
+        failures[0] = 10
+        assert translator.translate_batch(texts, "fr") == texts
+        assert translator.unavailable is None
+    
+    # Server errors are transient: the LLM stays in the cascade and recovers with the server
+    with tempfile.TemporaryDirectory() as cache_dir, StubServer(config=StubServerConfig(error_rate=1.0)) as server:
+        translator = create_translator('cascade', engines=['llm', 'mock'], api_url=server.ollama_url,
+                                       capability_cache=CapabilityCache(cache_dir))
+        translator.translators[0].rate_limit_delay = 0
+        assert translator.translate_batch(texts, "fr") == texts
+        assert translator.translators[0].unavailable is None
+        # Untranslated texts are not counted as engine output
+        assert "translated_by_llm" not in translator.metrics.counters
+        assert translator.produced_by["fr"] == {"key1": "none", "key2": "none"}
+        server.config.error_rate = 0.0
+        assert translator.translate_batch(texts, "fr") == {"key1": "[French] Hello", "key2": "[French] World"}
+        assert translator.produced_by["fr"] == {"key1": "llm", "key2": "llm"}
+        
+        # A missing endpoint does not go away, the next engine takes over
+        translator = create_translator('cascade', engines=['llm', 'mock'], api_url=f"{server.url}/api/missing",
+                                       capability_cache=CapabilityCache(cache_dir))
+        assert translator.translate_batch(texts, "fr") == {"key1": "[FR] Hello", "key2": "[FR] World"}
+        assert translator.translators[0].unavailable == 'endpoint or model not found'
+    
+    print("✅ Cascade translator test passed")
+
+
+def test_cli_startup():
+    """Benchmark CLI startup and check translator backends are imported lazily"""
+    print("Testing CLI startup time...")
+    
+    root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    
+    # Importing the CLI and using the mock translator must not load deepl or requests
+    check = (
+        "import sys, ios_translator; "
+        "ios_translator.create_translator('mock'); "
+        "print(','.join(m for m in ('deepl', 'requests') if m in sys.modules))"
+    )
+    output = subprocess.run([sys.executable, "-c", check], cwd=root_dir,
+                            capture_output=True, text=True, check=True).stdout
+    assert output.strip() == "", f"Eagerly imported: {output.strip()}"
+    
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "ios_translator.py", "--show-config"], cwd=root_dir,
+                   capture_output=True, check=True)
+    elapsed = time.perf_counter() - start
+    print(f"--show-config startup: {elapsed * 1000:.0f} ms")
+    
+    print("✅ CLI startup test passed")
+
+
 def test_deepl_translator_init():
     """Test DeepL translator initialization"""
     print("Testing DeepL Translator initialization...")
@@ -120,6 +589,472 @@ def test_code_generator():
     print("✅ LocalizationCodeGenerator test passed")
 
 
+def test_code_generator_skips_unchanged():
+    """Test generated files are only rewritten when content changes"""
+    print("Testing unchanged generated file skipping...")
+    
+    generator = LocalizationCodeGenerator()
+    strings_dict = {"welcome_message": "Welcome!"}
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        output_path = os.path.join(temp_dir, "LocalizedStrings.swift")
+        generator.generate_swift_extensions(strings_dict, output_path)
+        first_mtime = os.stat(output_path).st_mtime_ns
+        
+        # Same keys: file must not be touched
+        assert not generator._write_if_changed(output_path, generator.generate_swift_extensions(strings_dict))
+        assert os.stat(output_path).st_mtime_ns == first_mtime
+        
+        # Changed keys: file is rewritten
+        strings_dict["goodbye_message"] = "Goodbye!"
+        generator.generate_swift_extensions(strings_dict, output_path)
+        with open(output_path, encoding="utf-8") as f:
+            assert "goodbyeMessage" in f.read()
+    
+    print("✅ Unchanged generated file skipping test passed")
+
+
+def test_code_generator_streaming():
+    """Test streamed code generation matches in-memory generation"""
+    print("Testing streamed code generation...")
+    
+    generator = LocalizationCodeGenerator()
+    strings_dict = {"welcome_message": "Welcome!", "long_text": "x" * 80}
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        swift_path = os.path.join(temp_dir, "LocalizedStrings.swift")
+        header_path = os.path.join(temp_dir, "LocalizedStrings.h")
+        assert generator.write_swift_extensions(strings_dict, swift_path)
+        assert generator.write_objc_header(strings_dict, header_path)
+        
+        with open(swift_path, encoding="utf-8") as f:
+            assert f.read() == generator.generate_swift_extensions(strings_dict)
+        with open(header_path, encoding="utf-8") as f:
+            assert f.read() == generator.generate_objc_header(strings_dict)
+        
+        # No temporary files are left behind
+        assert not [name for name in os.listdir(temp_dir) if name.endswith(".tmp")]
+    
+    print("✅ Streamed code generation test passed")
+
+
+def test_property_names_stable():
+    """Test property names stay stable across runs via the naming map"""
+    print("Testing stable property names...")
+    
+    generator = LocalizationCodeGenerator()
+    
+    # Colliding keys get increasing suffixes
+    names = generator._generate_property_names({"item.": "A", "item-": "B", "item!": "C", "for": "D"})
+    assert list(names.values()) == ["item", "item1", "item2", "localizedFor"]
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        first = generator._resolve_property_names({"item.": "A", "item-": "B"}, temp_dir)
+        assert first == {"item.": "item", "item-": "item1"}
+        
+        # Removing the first key does not rename the second one
+        second = generator._resolve_property_names({"item-": "B", "item!": "C"}, temp_dir)
+        assert second == {"item-": "item1", "item!": "item"}
+    
+    print("✅ Stable property names test passed")
+
+
+def test_typed_format_accessors():
+    """Test typed Swift accessors for format strings"""
+    print("Testing typed format accessors...")
+    
+    generator = LocalizationCodeGenerator(typed_format_accessors=True)
+    
+    assert generator._parse_format_arguments("Hello %@, you have %d messages") == ["String", "Int"]
+    assert generator._parse_format_arguments("%2$@ bought %1$lld items") == ["Int", "String"]
+    assert generator._parse_format_arguments("%.1f km") == ["Double"]
+    assert generator._parse_format_arguments("100% done, 100%% sure") is None
+    assert generator._parse_format_arguments("%1$@ %1$d") is None
+    # Percent signs in prose are not format specifiers
+    for prose in ("10%OFF", "50%off today", "100%x faster", "Up to 20%Extra", "100%sure", "Top 5%ile, %@"):
+        assert generator._parse_format_arguments(prose) is None, prose
+    assert generator._parse_format_arguments("Save %d%% now, %@'s pick") == ["Int", "String"]
+    swift_code = generator.generate_swift_extensions({"sale_banner": "50%off everything"})
+    assert "static var saleBanner: String {" in swift_code
+    
+    swift_code = generator.generate_swift_extensions({"inbox_title": "Hello %@, you have %d messages", "plain": "Hi"})
+    assert "static func inboxTitle(_ arg1: String, _ arg2: Int) -> String {" in swift_code
+    assert 'String(format: NSLocalizedString("inbox_title", comment: ""), arg1, arg2)' in swift_code
+    assert "static var plain: String {" in swift_code
+    
+    print("✅ Typed format accessors test passed")
+
+
+def test_swift_shards():
+    """Test sharded Swift code generation"""
+    print("Testing sharded Swift generation...")
+    
+    import json
+    
+    generator = LocalizationCodeGenerator()
+    strings_dict = {f"settings_item_{i}": f"Item {i}" for i in range(20)}
+    strings_dict["welcome_message"] = "Welcome!"
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        def read_shards(shards):
+            contents = []
+            for path in shards:
+                with open(path, encoding="utf-8") as f:
+                    contents.append(f.read())
+            return contents
+        
+        shards = generator.generate_swift_shards(strings_dict, temp_dir, 4)
+        assert len(shards) == 4
+        assert sum(shards.values()) == len(strings_dict)
+        
+        # Every key appears exactly once across shards
+        combined = "".join(read_shards(shards))
+        assert combined.count("static var settingsItem0: String") == 1
+        assert combined.count("static var welcomeMessage: String") == 1
+        
+        # Keys sharing a prefix land in the same shard
+        shards = generator.generate_swift_shards(strings_dict, temp_dir, 4, shard_by="prefix")
+        assert sum(1 for code in read_shards(shards) if "settingsItem" in code) == 1
+        
+        # Shrinking the shard count removes stale files
+        generator.generate_swift_shards(strings_dict, temp_dir, 2)
+        swift_files = [f for f in os.listdir(temp_dir) if f.endswith(".swift")]
+        assert sorted(swift_files) == ["LocalizedStrings+Shard00.swift", "LocalizedStrings+Shard01.swift"]
+        
+        # Switching layouts removes the other layout's files and their manifest entries
+        generator.write_swift_extensions(strings_dict, os.path.join(temp_dir, "LocalizedStrings.swift"))
+        assert [f for f in os.listdir(temp_dir) if f.endswith(".swift")] == ["LocalizedStrings.swift"]
+        with open(os.path.join(temp_dir, ".localized_strings_manifest.json"), encoding="utf-8") as f:
+            assert sorted(json.load(f)) == ["LocalizedStrings.swift"]
+        
+        generator.generate_swift_shards(strings_dict, temp_dir, 2)
+        swift_files = [f for f in os.listdir(temp_dir) if f.endswith(".swift")]
+        assert sorted(swift_files) == ["LocalizedStrings+Shard00.swift", "LocalizedStrings+Shard01.swift"]
+        with open(os.path.join(temp_dir, ".localized_strings_manifest.json"), encoding="utf-8") as f:
+            assert sorted(json.load(f)) == swift_files
+    
+    print("✅ Sharded Swift generation test passed")
+
+
+def test_objc_implementation():
+    """Test Objective-C implementation generation"""
+    print("Testing Objective-C implementation generation...")
+    
+    generator = LocalizationCodeGenerator()
+    strings_dict = {"welcome_message": "Welcome!", "quote\"key": "Quote"}
+    
+    implementation = generator.generate_objc_implementation(strings_dict)
+    assert "@implementation LocalizedStrings" in implementation
+    assert "+ (NSString *)welcomeMessage {" in implementation
+    assert 'LocalizedStringsLookup(@"quote\\"key")' in implementation
+    assert "NSLocalizedString" not in implementation
+    
+    # Keys that would override NSObject methods or fall into ARC method families are prefixed
+    reserved = {"new": "New", "copy": "Copy", "hash": "Hash", "alloc": "Alloc", "class": "Class",
+                "init_title": "Title", "new_item": "New item", "mutable_copy": "Copy", "initial_setup": "Setup",
+                "copyright": "Copyright"}
+    implementation = generator.generate_objc_implementation(reserved)
+    for name in ("localizedNew", "localizedCopy", "localizedHash", "localizedAlloc", "localizedClass",
+                 "localizedInitTitle", "localizedNewItem", "localizedMutableCopy", "initialSetup", "copyright"):
+        assert f"+ (NSString *){name} {{" in implementation
+    assert "+ (NSString *)new {" not in implementation
+    
+    # The Objective-C reservations do not rename Swift accessors or persisted names
+    with tempfile.TemporaryDirectory() as temp_dir:
+        swift_keys = {"new_message": "New message", "copy_link": "Copy link", "version": "Version"}
+        output_path = os.path.join(temp_dir, "LocalizedStrings.swift")
+        for _ in range(2):
+            assert generator.write_swift_extensions(swift_keys, output_path)
+            with open(output_path, encoding="utf-8") as f:
+                swift_code = f.read()
+            for name in ("newMessage", "copyLink", "version"):
+                assert f"static var {name}: String {{" in swift_code
+        header = generator.generate_objc_header(swift_keys, os.path.join(temp_dir, "LocalizedStrings.h"))
+        assert "+ (NSString *)localizedNewMessage;" in header and "+ (NSString *)localizedVersion;" in header
+        assert generator._resolve_property_names(swift_keys, temp_dir)["new_message"] == "newMessage"
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        output_path = os.path.join(temp_dir, "LocalizedStrings.m")
+        assert generator.write_objc_implementation(strings_dict, output_path, shard_count=3)
+        
+        shard_files = sorted(f for f in os.listdir(temp_dir) if f.startswith("LocalizedStrings+Shard"))
+        assert len(shard_files) == 3
+        combined = ""
+        for name in shard_files:
+            with open(os.path.join(temp_dir, name), encoding="utf-8") as f:
+                combined += f.read()
+        assert combined.count("+ (NSString *)welcomeMessage {") == 1
+        
+        # Going back to a single file removes the shards
+        assert generator.write_objc_implementation(strings_dict, output_path)
+        assert not [f for f in os.listdir(temp_dir) if f.startswith("LocalizedStrings+Shard")]
+    
+    print("✅ Objective-C implementation generation test passed")
+
+
+def test_benchmark_suite():
+    """Smoke test the benchmark suite on a tiny synthetic project"""
+    print("Testing benchmark suite...")
+    
+    from benchmarks.run_benchmarks import main as run_benchmarks
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        report_path = os.path.join(temp_dir, "report.json")
+        report = run_benchmarks(["--keys", "50", "--locales", "2", "--output", report_path])
+        
+        assert set(report["results"]) == {"parse", "diff", "write", "codegen", "end_to_end"}
+        for result in report["results"].values():
+            assert result["seconds"] >= 0 and result["peak_bytes"] > 0
+        assert os.path.exists(report_path)
+    
+    print("✅ Benchmark suite test passed")
+
+
+def test_run_metrics():
+    """Test per-phase metrics of a pipeline run"""
+    print("Testing run metrics...")
+    
+    import json
+    from ios_translator import iOSTranslator
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for language, content in (("en", '"welcome" = "Welcome";\n"goodbye" = "Goodbye";\n'),
+                                  ("fr", '"welcome" = "Bienvenue";\n'), ("de", "")):
+            os.makedirs(os.path.join(temp_dir, f"{language}.lproj"))
+            with open(os.path.join(temp_dir, f"{language}.lproj", "Localizable.strings"), "w") as f:
+                f.write(content)
+        
+        ios_translator = iOSTranslator(temp_dir, create_translator('mock'))
+        assert ios_translator.translator.metrics is ios_translator.metrics
+        assert ios_translator.run()
+        
+        report = ios_translator.metrics.to_dict()
+        assert list(report["phases"]) == ["discover", "parse", "diff", "translate", "write", "codegen"]
+        assert report["languages"]["fr"]["missing"] == 1
+        assert report["languages"]["de"]["missing"] == 2
+        assert report["counters"]["keys_translated"] == 3
+        assert report["counters"]["keys_up_to_date"] == 1
+        # One batch request per language
+        assert report["timings"]["request"]["count"] == report["counters"]["requests"] == 2
+        assert "Run Metrics:" in ios_translator.metrics.format_summary()
+        
+        metrics_path = os.path.join(temp_dir, "metrics.json")
+        assert ios_translator.metrics.write_json(metrics_path)
+        with open(metrics_path, encoding="utf-8") as f:
+            assert json.load(f)["counters"] == report["counters"]
+    
+    print("✅ Run metrics test passed")
+
+
+def test_structured_logging():
+    """Test quiet console output, aggregated progress and the JSONL event log"""
+    print("Testing structured logging...")
+    
+    import io
+    import json
+    import logging
+    import contextlib
+    from ios_translator import iOSTranslator
+    from src.logging_config import LOGGER_NAME, ProgressReporter, configure_logging, get_logger
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for language, content in (("en", '"welcome" = "Welcome";\n"goodbye" = "Goodbye";\n'), ("fr", "")):
+            os.makedirs(os.path.join(temp_dir, f"{language}.lproj"))
+            with open(os.path.join(temp_dir, f"{language}.lproj", "Localizable.strings"), "w") as f:
+                f.write(content)
+        
+        event_log = os.path.join(temp_dir, "events.jsonl")
+        console = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(console):
+                configure_logging(quiet=True, event_log=event_log)
+                assert iOSTranslator(temp_dir, create_translator('mock')).run()
+                
+                # Per-item progress collapses into one aggregate line
+                progress = ProgressReporter(get_logger("test"), "Translating to FR", 1000)
+                for _ in range(1000):
+                    progress.update()
+                progress.close()
+        finally:
+            project_logger = logging.getLogger(LOGGER_NAME)
+            for handler in list(project_logger.handlers):
+                project_logger.removeHandler(handler)
+                handler.close()
+        
+        # Quiet mode keeps informational output off the console
+        assert console.getvalue() == ""
+        
+        with open(event_log, encoding="utf-8") as f:
+            events = [json.loads(line) for line in f]
+        missing = [event for event in events if event.get("event") == "missing_strings"]
+        assert missing == [dict(missing[0], language="fr", count=2)]
+        assert missing[0]["logger"] == "ios_translator.ios_translator"
+        done = [event for event in events if event.get("event") == "progress_done"]
+        assert len(done) == 1 and done[0]["done"] == 1000 and done[0]["failed"] == 0
+        assert not [event for event in events if event.get("event") == "progress"]
+    
+    print("✅ Structured logging test passed")
+
+
+def test_run_profiler():
+    """Test per-phase cProfile and tracemalloc reports"""
+    print("Testing run profiler...")
+    
+    import pstats
+    from src.metrics import Metrics
+    from src.profiler import RunProfiler
+    
+    metrics = Metrics()
+    profiler = RunProfiler(cpu=True, memory=True)
+    metrics.phase_listeners.append(profiler)
+    
+    profiler.start()
+    try:
+        with metrics.phase('parse'):
+            parsed = [str(i) * 10 for i in range(5000)]
+        with metrics.phase('codegen'):
+            LocalizationCodeGenerator().generate_swift_extensions({"key_%d" % i: "Value" for i in range(50)})
+    finally:
+        profiler.stop()
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        prefix = os.path.join(temp_dir, "metrics")
+        written = profiler.write_reports(prefix)
+        assert written == [prefix + ".prof", prefix + ".profile.txt", prefix + ".memory.txt"]
+        
+        # The combined profile loads with the standard tools
+        functions = {function for _, _, function in pstats.Stats(prefix + ".prof").stats}
+        assert "generate_swift_extensions" in functions
+        
+        with open(prefix + ".profile.txt", encoding="utf-8") as f:
+            cpu_report = f.read()
+        assert cpu_report.index("==== Phase: parse") < cpu_report.index("==== Phase: codegen")
+        assert "generate_swift_extensions" in cpu_report.split("==== Phase: codegen")[1]
+        
+        with open(prefix + ".memory.txt", encoding="utf-8") as f:
+            memory_report = f.read()
+        assert "==== Phase: parse (peak" in memory_report
+        assert "test_functionality.py" in memory_report.split("==== Phase: codegen")[0]
+    
+    assert len(parsed) == 5000
+    print("✅ Run profiler test passed")
+
+
+def test_trace_export():
+    """Test Chrome trace export of pipeline and request spans"""
+    print("Testing trace export...")
+    
+    import json
+    import threading
+    from ios_translator import iOSTranslator
+    from src.tracing import TraceRecorder
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for language, content in (("en", '"welcome" = "Welcome";\n'), ("fr", "")):
+            os.makedirs(os.path.join(temp_dir, f"{language}.lproj"))
+            with open(os.path.join(temp_dir, f"{language}.lproj", "Localizable.strings"), "w") as f:
+                f.write(content)
+        
+        # Throttle every first attempt so the trace contains a retry wait
+        translator = create_translator('mock', throttle_rate=1.0, max_retries=1, retry_delay=0.001)
+        ios_translator = iOSTranslator(temp_dir, translator)
+        tracer = TraceRecorder()
+        ios_translator.metrics.span_listeners.append(tracer)
+        assert ios_translator.run()
+        
+        # Spans from another thread get their own track
+        worker = threading.Thread(target=lambda: ios_translator.metrics.sleep(0.001), name="worker")
+        worker.start()
+        worker.join()
+        
+        trace_path = os.path.join(temp_dir, "trace.json")
+        assert tracer.write_json(trace_path)
+        with open(trace_path, encoding="utf-8") as f:
+            events = json.load(f)["traceEvents"]
+    
+    spans = [event for event in events if event["ph"] == "X"]
+    names = {event["name"] for event in spans}
+    assert {"discover", "parse", "diff", "translate", "write", "codegen", "request", "retry_wait"} <= names
+    translate = next(event for event in spans if event["name"] == "translate")
+    assert translate["args"] == {"language": "fr"}
+    requests = [event for event in spans if event["name"] == "request"]
+    assert [event["args"]["attempt"] for event in requests] == [0, 1]
+    # Requests are nested inside the translate span
+    assert all(translate["ts"] <= event["ts"] and event["ts"] + event["dur"] <= translate["ts"] + translate["dur"]
+               for event in requests)
+    
+    thread_names = {event["args"]["name"] for event in events if event["name"] == "thread_name"}
+    assert thread_names == {"MainThread", "worker"}
+    assert len({event["tid"] for event in spans}) == 2
+    
+    print("✅ Trace export test passed")
+
+
+def test_translation_plan():
+    """Test the dry-run plan: per-locale counts, quota check and time estimate"""
+    print("Testing translation plan...")
+    
+    import json
+    from ios_translator import iOSTranslator
+    from src.stub_server import StubServer, StubServerConfig
+    from src.translators.capabilities import CapabilityCache
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for language, content in (("en", '"a" = "Hello";\n"b" = "Hello";\n"c" = "World!";\n'),
+                                  ("de", '"a" = "Hallo";\n'), ("fr", ""), ("ja", "")):
+            os.makedirs(os.path.join(temp_dir, f"{language}.lproj"))
+            with open(os.path.join(temp_dir, f"{language}.lproj", "Localizable.strings"), "w") as f:
+                f.write(content)
+        
+        with StubServer(config=StubServerConfig(character_limit=30)) as server:
+            translator = create_translator('deepl', auth_key='stub-key', server_url=server.url)
+            plan = iOSTranslator(temp_dir, translator).plan()
+            # Only the usage endpoint was called
+            assert server.stats["requests"] == 1 and server.character_count == 0
+        
+        assert plan.languages["de"] == {"keys": 2, "characters": 11, "unique_texts": 2, "requests": 1}
+        assert plan.languages["fr"] == {"keys": 3, "characters": 16, "unique_texts": 2, "requests": 1}
+        assert plan.totals["characters"] == 43 and plan.remaining_characters == 30
+        assert not plan.fits_quota and plan.exhausted_at == "ja"
+        assert plan.estimated_seconds is None
+        
+        baseline_path = os.path.join(temp_dir, "metrics.json")
+        with open(baseline_path, "w") as f:
+            json.dump({"phases": {"translate": 2.0}, "counters": {"characters_sent": 400, "source_characters": 100}}, f)
+        assert plan.load_baseline(baseline_path)
+        assert abs(plan.estimated_seconds - 0.86) < 1e-9
+        assert "run out while translating ja" in plan.format_summary()
+        
+        # Chunked engines plan one request per chunk
+        mock_plan = iOSTranslator(temp_dir, create_translator('mock', max_batch_size=2)).plan()
+        assert mock_plan.totals["requests"] == 1 + 2 + 2
+        assert mock_plan.fits_quota
+        
+        # A fallback engine without a quota covers what DeepL cannot translate
+        with tempfile.TemporaryDirectory() as cache_dir, StubServer(config=StubServerConfig(character_limit=30)) as server:
+            translator = create_translator('cascade', engines=['deepl', 'llm'], auth_key='stub-key',
+                                           server_url=server.url, api_url=server.ollama_url,
+                                           capability_cache=CapabilityCache(cache_dir))
+            cascade_plan = iOSTranslator(temp_dir, translator).plan()
+        assert cascade_plan.usage["engines"]["deepl"]["character_limit"] == 30
+        assert cascade_plan.usage["engines"]["llm"] is None
+        assert cascade_plan.fits_quota
+        assert "deepl: 0 of 30 characters used" in cascade_plan.format_summary()
+        # DeepL's quota covers de (11) and fr (16); ja moves to the LLM
+        engines = cascade_plan.engines
+        assert engines["deepl"] == {"locales": ["de", "fr"], "keys": 5, "characters": 27, "requests": 2}
+        assert engines["llm"]["locales"] == ["ja"] and engines["llm"]["characters"] == 16
+        assert engines["llm"]["requests"] == 1
+    
+    # A plan never writes files, so it cannot be combined with an XLIFF import
+    result = subprocess.run([sys.executable, "ios_translator.py", ".", "--plan", "--import-xliff", "missing.xliff"],
+                            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                            capture_output=True, text=True)
+    assert result.returncode == 2 and "--import-xliff" in result.stderr
+    
+    print("✅ Translation plan test passed")
+
+
 def test_integration():
     """Integration test"""
     print("Testing integration...")
@@ -179,10 +1114,35 @@ def main():
     
     try:
         test_strings_parser()
+        test_binary_plist_strings()
+        test_xliff_round_trip()
         test_mock_translator()
+        test_mock_translator_simulation()
+        test_stub_server()
+        test_deepl_glossaries()
+        test_capability_cache()
+        test_llm_endpoint_pool()
+        test_openai_chat_translator()
+        test_ollama_residency_options()
+        test_llm_streaming()
+        test_llm_request_hedging()
+        test_cascade_translator()
+        test_cli_startup()
         test_deepl_translator_init()
         test_code_generator()
+        test_code_generator_skips_unchanged()
+        test_code_generator_streaming()
+        test_property_names_stable()
+        test_typed_format_accessors()
+        test_swift_shards()
+        test_objc_implementation()
         test_integration()
+        test_benchmark_suite()
+        test_run_metrics()
+        test_structured_logging()
+        test_run_profiler()
+        test_trace_export()
+        test_translation_plan()
         
         print("\n" + "=" * 50)
         print("🎉 All tests passed! The iOS translator is ready to use.")